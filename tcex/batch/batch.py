@@ -15,6 +15,7 @@ import uuid
 from collections import deque
 from typing import Any, Callable, Optional, Tuple, Union
 
+from ..utils.json_codec import json_codec
 from .group import (
     Adversary,
     AttackPattern,
@@ -146,6 +147,8 @@ class Batch:
     def _gen_indicator_class(self):  # pragma: no cover
         """Generate Custom Indicator Classes."""
         for entry in self.tcex.indicator_types_data.values():
+            # the entries are shared with the metadata cache, update a copy
+            entry = dict(entry)
             name = entry.get('name')
             class_name = name.replace(' ', '')
             # temp fix for API issue where boolean are returned as strings
@@ -634,7 +637,7 @@ class Batch:
 
                 # update entity trackers
                 tracker['count'] += 1
-                tracker['bytes'] += sys.getsizeof(json.dumps(group_data))
+                tracker['bytes'] += sys.getsizeof(json_codec.dumps(group_data))
 
                 # extend xids with any groups associated with the same object
                 xids.extend(group_data.get('associatedGroupXid', []))
@@ -727,7 +730,7 @@ class Batch:
 
             # update entity trackers
             tracker['count'] += 1
-            tracker['bytes'] += sys.getsizeof(json.dumps(indicator_data))
+            tracker['bytes'] += sys.getsizeof(json_codec.dumps(indicator_data))
 
             if tracker.get('count') % 2_500 == 0:
                 # log count/size at a sane level
@@ -877,7 +880,7 @@ class Batch:
             r = self.tcex.session.get(f'/v2/batch/{batch_id}/errors')
             # API does not return correct content type
             if r.ok:
-                errors = json.loads(r.text)
+                errors = json_codec.loads(r.content)
             # temporarily process errors to find "critical" errors.
             # FR in core to return error codes.
             for error in errors:
@@ -1942,7 +1945,10 @@ class Batch:
         )
 
         try:
-            files = (('config', json.dumps(self.settings)), ('content', json.dumps(content)))
+            files = (
+                ('config', json_codec.dumps(self.settings)),
+                ('content', json_codec.dumps_bytes(content)),
+            )
             params = {'includeAdditional': 'true'}
             r = self.tcex.session.post('/v2/batch/createAndUpload', files=files, params=params)
             if not r.ok or 'application/json' not in r.headers.get('content-type', ''):
@@ -2281,8 +2287,8 @@ class Batch:
             # get timestamp as a string without decimal place and consistent length
             timestamp = str(int(time.time() * 10000000))
             error_json_file = os.path.join(self.debug_path_batch, f'errors-{timestamp}.json.gz')
-            with gzip.open(error_json_file, mode='wt', encoding='utf-8') as fh:
-                json.dump(errors, fh)
+            with gzip.open(error_json_file, mode='wb') as fh:
+                fh.write(json_codec.dumps_bytes(errors))
 
     def write_batch_json(self, content: dict) -> None:
         """Write batch json data to a file."""
@@ -2290,8 +2296,8 @@ class Batch:
             # get timestamp as a string without decimal place and consistent length
             timestamp = str(int(time.time() * 10000000))
             batch_json_file = os.path.join(self.debug_path_batch, f'batch-{timestamp}.json.gz')
-            with gzip.open(batch_json_file, mode='wt', encoding='utf-8') as fh:
-                json.dump(content, fh)
+            with gzip.open(batch_json_file, mode='wb') as fh:
+                fh.write(json_codec.dumps_bytes(content))
 
     @property
     def group_len(self) -> int:
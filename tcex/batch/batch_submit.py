@@ -1,12 +1,13 @@
 """ThreatConnect Batch Import Module."""
 # standard library
 import gzip
-import json
 import math
 import re
 import time
 from typing import Optional
 
+from ..utils.json_codec import json_codec
+
 
 class BatchSubmit:
     """ThreatConnect Batch Import Module"""
@@ -159,7 +160,7 @@ class BatchSubmit:
             r = self.tcex.session.get(f'/v2/batch/{batch_id}/errors')
             # API does not return correct content type
             if r.ok:
-                errors = json.loads(r.text)
+                errors = json_codec.loads(r.content)
             # temporarily process errors to find "critical" errors.
             # FR in core to return error codes.
             for error in errors:
@@ -387,7 +388,8 @@ class BatchSubmit:
         Returns.
             dict: The Batch Status from the ThreatConnect API.
         """
-        content = gzip.open(batch_filename, 'rt').read()
+        with gzip.open(batch_filename, 'rb') as fh:
+            content = json_codec.loads(fh.read())
 
         # check global setting for override
         if self.halt_on_batch_error is not None:
@@ -403,7 +405,10 @@ class BatchSubmit:
             f'''count={len(content.get('indicator')):,}'''
         )
 
-        files = (('config', json.dumps(self.settings)), ('content', json.dumps(content)))
+        files = (
+            ('config', json_codec.dumps(self.settings)),
+            ('content', json_codec.dumps_bytes(content)),
+        )
         params = {'includeAdditional': 'true'}
         try:
             r = self.tcex.session.post('/v2/batch/createAndUpload', files=files, params=params)
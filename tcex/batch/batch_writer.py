@@ -2,7 +2,6 @@
 # standard library
 import gzip
 import hashlib
-import json
 import os
 import re
 import shelve  # nosec
@@ -12,6 +11,7 @@ import uuid
 from collections import deque
 from typing import Optional, Tuple, Union
 
+from ..utils.json_codec import json_codec
 from .group import (
     Adversary,
     AttackPattern,
@@ -84,6 +84,8 @@ class BatchWriter:
     def _gen_indicator_class(self):  # pragma: no cover
         """Generate Custom Indicator Classes."""
         for entry in self.tcex.indicator_types_data.values():
+            # the entries are shared with the metadata cache, update a copy
+            entry = dict(entry)
             name = entry.get('name')
             class_name = name.replace(' ', '')
             # temp fix for API issue where boolean are returned as strings
@@ -180,9 +182,9 @@ class BatchWriter:
 
             # track total batch job data size as TI gets added
             if isinstance(group_data, dict):
-                self._batch_size += sys.getsizeof(json.dumps(group_data))
+                self._batch_size += sys.getsizeof(json_codec.dumps(group_data))
             else:
-                self._batch_size += sys.getsizeof(json.dumps(group_data.data))
+                self._batch_size += sys.getsizeof(json_codec.dumps(group_data.data))
 
             # max size hit, dump TI to disk
             if self._batch_size > self._batch_max_size:
@@ -223,9 +225,9 @@ class BatchWriter:
 
             # track total batch job data size as TI gets added
             if isinstance(indicator_data, dict):
-                self._batch_size += sys.getsizeof(json.dumps(indicator_data))
+                self._batch_size += sys.getsizeof(json_codec.dumps(indicator_data))
             else:
-                self._batch_size += sys.getsizeof(json.dumps(indicator_data.data))
+                self._batch_size += sys.getsizeof(json_codec.dumps(indicator_data.data))
 
             # max size hit, dump TI to disk
             if self._batch_size > self._batch_max_size:
@@ -1243,8 +1245,8 @@ class BatchWriter:
             # TODO: is this needed
             self._batch_files.append(filename)
             fqfn = os.path.join(self.output_dir, filename)
-            with gzip.open(fqfn, mode='wt', encoding='utf-8') as fh:
-                json.dump(content, fh)
+            with gzip.open(fqfn, mode='wb') as fh:
+                fh.write(json_codec.dumps_bytes(content))
 
             # send callback the filename
             if callable(self.write_callback):
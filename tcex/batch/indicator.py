@@ -12,9 +12,26 @@ from .tag import Tag
 # import local modules for dynamic reference
 module = __import__(__name__)
 
+# custom indicator classes are generated once per process
+_custom_indicator_classes = {}
+
 
 def custom_indicator_class_factory(indicator_type, base_class, class_dict, value_fields):
     """Return internal methods for dynamically building Custom Indicator Class."""
+    if class_dict:
+        # classes with additional class data are not shared
+        return _custom_indicator_class(indicator_type, base_class, class_dict, value_fields)
+
+    key = (indicator_type, base_class, tuple(value_fields))
+    if key not in _custom_indicator_classes:
+        _custom_indicator_classes[key] = _custom_indicator_class(
+            indicator_type, base_class, class_dict, value_fields
+        )
+    return _custom_indicator_classes[key]
+
+
+def _custom_indicator_class(indicator_type, base_class, class_dict, value_fields):
+    """Return a new dynamic Custom Indicator Class."""
     value_count = len(value_fields)
 
     def init_1(self, tcex, value1, xid, **kwargs):  # pylint: disable=possibly-unused-variable
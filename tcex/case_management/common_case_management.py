@@ -1,4 +1,7 @@
 """ThreatConnect Common Case Management"""
+# standard library
+import logging
+
 # third-party
 from requests.exceptions import ProxyError
 
@@ -150,6 +153,28 @@ class CommonCaseManagement:
             'workflow_event_filter',
         ]
 
+    def _log_response(self, r, body=None):
+        """Log the request and response, skipped entirely unless debug logging is enabled.
+
+        Args:
+            r (requests.Response): The response object.
+            body (dict, optional): The request body.
+        """
+        if not self.tcex.log.isEnabledFor(logging.DEBUG):
+            return
+
+        self.tcex.log.debug(
+            f'Method: ({r.request.method.upper()}), '
+            f'Status Code: {r.status_code}, '
+            f'URl: ({r.url})'
+        )
+        if body is not None:
+            self.tcex.log.debug(f'body: {body}')
+        if len(r.content) < 5000:
+            self.tcex.log.debug(f'response text: {r.text}')
+        else:  # pragma: no cover
+            self.tcex.log.debug('response text: (text to large to log)')
+
     def _reverse_transform(self, kwargs):
         """Reverse mapping of the _metadata_map method."""
 
@@ -279,19 +304,11 @@ class CommonCaseManagement:
         r = None
         try:
             r = self.tcex.session.delete(url)
-            self.tcex.log.debug(
-                f'Method: ({r.request.method.upper()}), '
-                f'Status Code: {r.status_code}, '
-                f'URl: ({r.url})'
-            )
         except (ConnectionError, ProxyError):  # pragma: no cover
             self.tcex.handle_error(
                 951, ['OPTIONS', 407, '{\"message\": \"Connection Error\"}', self.api_endpoint]
             )
-        if len(r.content) < 5000:
-            self.tcex.log.debug(f'response text: {r.text}')
-        else:  # pragma: no cover
-            self.tcex.log.debug('response text: (text to large to log)')
+        self._log_response(r)
         if not self.success(r):
             err = r.text or r.reason
             if r.status_code == 404:
@@ -356,15 +373,7 @@ class CommonCaseManagement:
             self.tcex.handle_error(
                 951, ['OPTIONS', 407, '{\"message\": \"Connection Error\"}', self.api_endpoint]
             )
-        self.tcex.log.debug(
-            f'Method: ({r.request.method.upper()}), '
-            f'Status Code: {r.status_code}, '
-            f'URl: ({r.url})'
-        )
-        if len(r.content) < 5000:
-            self.tcex.log.debug(f'response text: {r.text}')
-        else:  # pragma: no cover
-            self.tcex.log.debug('response text: (text to large to log)')
+        self._log_response(r)
         if not self.success(r):
             err = r.text or r.reason
             if r.status_code == 404:
@@ -461,16 +470,7 @@ class CommonCaseManagement:
         # make the request
         r = self.tcex.session.request(method, url, json=body)
 
-        self.tcex.log.debug(
-            f'Method: ({r.request.method.upper()}), '
-            f'Status Code: {r.status_code}, '
-            f'URl: ({r.url})'
-        )
-        self.tcex.log.debug(f'body: {body}')
-        if len(r.content) < 5000:
-            self.tcex.log.debug(f'response text: {r.text}')
-        else:  # pragma: no cover
-            self.tcex.log.debug('response text: (text to large to log)')
+        self._log_response(r, body)
 
         if not self.success(r):  # pragma: no cover
             err = r.text or r.reason
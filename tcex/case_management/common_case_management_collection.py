@@ -1,7 +1,13 @@
 """ThreatConnect Case Management Collection"""
+# standard library
+import logging
+
 # third-party
 from requests.exceptions import ProxyError
 
+# first-party
+from tcex.logger.trace_logger import TRACE
+
 from .tql import TQL
 
 
@@ -255,12 +261,14 @@ class CommonCaseManagementCollection:
             r = None
             try:
                 r = self.tcex.session.get(url, params=parameters)
-                self.tcex.log.debug(
-                    f'Method: ({r.request.method.upper()}), '
-                    f'Status Code: {r.status_code}, '
-                    f'URl: ({r.url})'
-                )
-                self.tcex.log.trace(f'response: {r.text}')
+                if self.tcex.log.isEnabledFor(logging.DEBUG):
+                    self.tcex.log.debug(
+                        f'Method: ({r.request.method.upper()}), '
+                        f'Status Code: {r.status_code}, '
+                        f'URl: ({r.url})'
+                    )
+                    if self.tcex.log.isEnabledFor(TRACE):
+                        self.tcex.log.trace(f'response: {r.text}')
             except (ConnectionError, ProxyError):  # pragma: no cover
                 self.tcex.handle_error(
                     951, ['OPTIONS', 407, '{\"message\": \"Connection Error\"}', self.api_endpoint]
@@ -273,8 +281,9 @@ class CommonCaseManagementCollection:
             # reset some vars
             parameters = {}
 
-            data = r.json().get('data', [])
-            url = r.json().pop('next', None)
+            r_json = r.json()
+            data = r_json.get('data', [])
+            url = r_json.pop('next', None)
 
             for result in data:
                 yield self.entity_map(result)
@@ -2,3 +2,4 @@
 # flake8: noqa
 from .cache import Cache
 from .datastore import DataStore
+from .metadata_cache import MetadataCache
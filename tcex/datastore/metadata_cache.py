@@ -0,0 +1,143 @@
+"""TcEx Framework Module for caching ThreatConnect metadata on the local disk."""
+# standard library
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+# get tcex logger
+logger = logging.getLogger('tcex')
+
+
+class MetadataCache:
+    """TcEx Metadata Cache Class.
+
+    Cache rarely changing ThreatConnect metadata (e.g., indicator types and association types)
+    in memory for the life of the process and, when a cache path is provided, on disk across
+    executions. Entries are keyed by the ThreatConnect base URL so that multiple instances never
+    share metadata. Files on disk are only used if they are owned by the current user and
+    contain a JSON object.
+
+    Args:
+        base_url: The ThreatConnect API base URL.
+        cache_path: The directory for the on-disk cache (e.g., the App tc_temp_path). By default
+            the data is only cached in memory.
+        ttl_seconds: Number of seconds the cached data is valid. A value of 0 disables caching.
+    """
+
+    _memory = {}
+    _memory_lock = threading.Lock()
+
+    def __init__(
+        self,
+        base_url: str,
+        cache_path: Optional[str] = None,
+        ttl_seconds: Optional[int] = 3600,
+    ):
+        """Initialize class properties."""
+        self.base_url = (base_url or '').strip('/')
+        self.cache_path = None
+        if cache_path:
+            self.cache_path = os.path.join(
+                cache_path, 'tcex-metadata', hashlib.sha256(self.base_url.encode()).hexdigest()[:16]
+            )
+        self.ttl_seconds = ttl_seconds
+
+        # properties
+        self.log = logger
+
+    def _fqfn(self, name: str) -> str:
+        """Return the fully qualified filename for the cache entry."""
+        return os.path.join(self.cache_path, f'{name}.json')
+
+    def _read(self, name: str) -> Tuple[float, Optional[dict]]:
+        """Return the cache time and data from disk if it exists and has not expired."""
+        if self.cache_path is None:
+            return 0, None
+
+        fqfn = self._fqfn(name)
+        try:
+            stat = os.stat(fqfn)
+            if hasattr(os, 'getuid') and stat.st_uid != os.getuid():
+                # only trust files written by the current user
+                self.log.warning(f'feature=metadata-cache, event=invalid-owner, name={name}')
+                return 0, None
+            if time.time() - stat.st_mtime > self.ttl_seconds:
+                return 0, None
+            with open(fqfn) as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return 0, None
+
+        if not isinstance(data, dict) or not all(isinstance(v, dict) for v in data.values()):
+            self.log.warning(f'feature=metadata-cache, event=invalid-data, name={name}')
+            return 0, None
+        return stat.st_mtime, data
+
+    def _write(self, name: str, data: dict) -> None:
+        """Write the data to disk (best effort)."""
+        if self.cache_path is None:
+            return
+
+        try:
+            os.makedirs(self.cache_path, mode=0o700, exist_ok=True)
+            # write to a temp file and rename so that readers never see a partial file
+            fd, temp_fqfn = tempfile.mkstemp(dir=self.cache_path, suffix='.tmp')
+            with os.fdopen(fd, 'w') as fh:
+                json.dump(data, fh)
+            os.replace(temp_fqfn, self._fqfn(name))
+        except (OSError, TypeError) as e:
+            self.log.warning(f'feature=metadata-cache, event=write-failed, name={name}, error={e}')
+
+    def get(self, name: str, fetch: Callable[[], Optional[dict]]) -> Optional[dict]:
+        """Return the cached data, calling fetch to retrieve the data on a cache miss.
+
+        Args:
+            name: The name of the cache entry (e.g., indicator-types).
+            fetch: A callable that retrieves the data from the API. A return value of None
+                indicates a failure and will not be cached.
+
+        Returns:
+            dict: The cached or fetched data.
+        """
+        if not self.ttl_seconds:
+            return fetch()
+
+        key = (self.base_url, name)
+        with self._memory_lock:
+            cached = self._memory.get(key)
+        if cached is not None and time.time() - cached[0] <= self.ttl_seconds:
+            return cached[1]
+
+        cache_time, data = self._read(name)
+        if data is None:
+            data = fetch()
+            if data is None:
+                return None
+            cache_time = time.time()
+            self._write(name, data)
+            self.log.debug(f'feature=metadata-cache, event=miss, name={name}')
+
+        with self._memory_lock:
+            self._memory[key] = (cache_time, data)
+        return data
+
+    def invalidate(self, name: str) -> None:
+        """Remove the cache entry from memory and disk.
+
+        Args:
+            name: The name of the cache entry.
+        """
+        with self._memory_lock:
+            self._memory.pop((self.base_url, name), None)
+        if self.cache_path is None:
+            return
+
+        try:
+            os.remove(self._fqfn(name))
+        except OSError:
+            pass
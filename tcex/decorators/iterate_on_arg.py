@@ -30,7 +30,8 @@ class IterateOnArg:
     was provided the arg ``self.args.colors`` with a value of ``['blue', 'green', 'magenta']``, then
     this decorator would call the function 3 times. Each call to the function would pass one value
     from the array. The return values are stored and returned all at once after the last value is
-    processed.
+    processed. Array elements are read from the KV store as they are processed, unless the method
+    accepts the ``_array_length`` arg, in which case the array is read at once.
 
     .. code-block:: python
         :linenos:
@@ -152,15 +153,26 @@ class IterateOnArg:
 
             # retrieve data from Redis if variable and always return and array.
             results = []
-            arg_data = app.tcex.playbook.read(getattr(app.args, self.arg))
-            arg_type = app.tcex.playbook.variable_type(getattr(app.args, self.arg))
+            arg_value = getattr(app.args, self.arg)
+            arg_type = app.tcex.playbook.variable_type(arg_value)
+            if '_array_length' not in fn_signature and arg_type in [
+                'BinaryArray',
+                'KeyValueArray',
+                'StringArray',
+                'TCEntityArray',
+                'TCEnhancedEntityArray',
+            ]:
+                # the length is not required, so read the array elements as they are processed
+                arg_data = app.tcex.playbook.iter_array(arg_value)
+            else:
+                arg_data = app.tcex.playbook.read(arg_value)
+                if arg_data is not None and not isinstance(arg_data, list):
+                    arg_data = [arg_data]
             if arg_data is None:
                 arg_data = [None]
-            elif not isinstance(arg_data, list):
-                arg_data = [arg_data]
 
             _index = 0
-            _array_length = len(arg_data)
+            _array_length = len(arg_data) if isinstance(arg_data, list) else None
             for ad in arg_data:
 
                 # add "magic" args
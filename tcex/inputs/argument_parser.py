@@ -251,6 +251,13 @@ class TcArgumentParser(ArgumentParser):
             help='Log external requests as CURL commands.',
             action='store_true',
         )
+        self.add_argument(
+            '--tc_log_request_metrics',
+            default=False,
+            dest='tc_log_request_metrics',
+            help='Log per-endpoint request metrics on exit.',
+            action='store_true',
+        )
 
     def _playbook_arguments(self):
         """Define playbook specific args.
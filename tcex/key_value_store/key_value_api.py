@@ -1,8 +1,14 @@
 """TcEx Framework Key Value API Module"""
 # standard library
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
 from urllib.parse import quote
 
+# third-party
+from requests.adapters import DEFAULT_POOLSIZE
+
+from ..utils.json_codec import json_codec
+
 
 class KeyValueApi:
     """TcEx Key Value API Module.
@@ -10,56 +16,121 @@ class KeyValueApi:
     Args:
         session (request.Session): A configured requests session for TC API (tcex.session).
         runtime_level: The runtime level of the App.
+        max_workers: The maximum number of concurrent requests sent by create_many and
+            read_many. The default matches the connection pool size of the session.
     """
 
-    def __init__(self, session: object, runtime_level: str):
+    def __init__(
+        self, session: object, runtime_level: str, max_workers: Optional[int] = DEFAULT_POOLSIZE
+    ):
         """Initialize the Class properties."""
         self._runtime_level = runtime_level
         self._session = session
+        self.max_workers = max_workers
 
-    def create(self, context: str, key: str, value: Any) -> str:
-        """Create key/value pair in remote KV store.
+    def _map(self, fn: Callable, items: list) -> list:
+        """Return the results of fn for each item, sending the requests concurrently.
 
         Args:
-            context: A specific context for the create.
-            key: The key to create in remote KV store.
-            value: The value to store in remote KV store.
+            fn: The callable that sends a request for an item.
+            items: The items.
 
         Returns:
-            (string): The response from the API call.
+            (list): The results in the same order as items.
+        """
+        if len(items) < 2 or self.max_workers < 2:
+            return [fn(item) for item in items]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(items)), thread_name_prefix='key-value-api'
+        ) as executor:
+            # map() re-raises the first error encountered while sending the requests
+            return list(executor.map(fn, items))
+
+    def _url(self, context: str, key: str) -> str:
+        """Return the KV store URL for the key.
+
+        Args:
+            context: A specific context for the request.
+            key: The key in remote KV store.
         """
         key: str = quote(key, safe='~')
-        headers = {'content-type': 'application/octet-stream'}
 
         # this conditional is only required while there are TC instances < 6.0.7 in the wild.
         # once all TC instance are > 6.0.7 the context endpoint should work for PB Apps.
         url = f'/internal/playbooks/keyValue/{key}'
         if self._runtime_level in ['apiservice', 'triggerservice', 'webhooktriggerservice']:
             url = f'/internal/playbooks/keyValue/{context}/{key}'
-        r = self._session.put(url, data=value, headers=headers)
+        return url
+
+    def create(self, context: str, key: str, value: Any) -> str:
+        """Create key/value pair in remote KV store.
+
+        Args:
+            context: A specific context for the create.
+            key: The key to create in remote KV store.
+            value: The value to store in remote KV store. A dict or list value is JSON encoded.
+
+        Returns:
+            (string): The response from the API call.
+        """
+        headers = {'content-type': 'application/octet-stream'}
+        if isinstance(value, (dict, list)):
+            # requests would otherwise form encode the value
+            value = json_codec.dumps_bytes(value)
+        elif isinstance(value, (bytearray, memoryview)):
+            # requests only sends bytes, str, and file-like data as is
+            value = bytes(value)
+
+        r = self._session.put(self._url(context, key), data=value, headers=headers)
         return r.content
 
-    def read(self, context: str, key: str) -> Any:
+    def create_many(self, context: str, data: dict) -> list:
+        """Create multiple key/value pairs in remote KV store.
+
+        The KV API has no bulk endpoint, so the pairs are created with concurrent requests
+        (up to max_workers) on the pooled connections of the session.
+
+        Args:
+            context: A specific context for the create.
+            data: The keys and values to store in remote KV store.
+
+        Returns:
+            (list): The responses from the API calls.
+        """
+        return self._map(lambda item: self.create(context, *item), list(data.items()))
+
+    def read(self, context: str, key: str, decode='utf-8') -> Any:
         """Read data from remote KV store for the provided key.
 
         Args:
             context: A specific context for the create.
             key: The key to read in remote KV store.
+            decode: encoding to use to decode retrieved value or False to not decode value.
 
         Returns:
             (any): The response data from the remote KV store.
         """
-        key = quote(key, safe='~')
-
-        # this conditional is only required while there are TC instances < 6.0.7 in the wild.
-        # once all TC instance are > 6.0.7 the context endpoint should work for PB Apps.
-        url = f'/internal/playbooks/keyValue/{key}'
-        if self._runtime_level in ['apiservice', 'triggerservice', 'webhooktriggerservice']:
-            url = f'/internal/playbooks/keyValue/{context}/{key}'
-        r = self._session.get(url)
+        r = self._session.get(self._url(context, key))
         data = r.content
 
         # Binary data for PB Apps is base64 encoded, for service Apps it is not
-        if data is not None and isinstance(data, bytes):
-            data = data.decode('utf-8')
+        if data is not None and isinstance(data, bytes) and decode:
+            data = data.decode(decode)
         return data
+
+    def read_many(self, context: str, keys: List[str], decode='utf-8') -> List[Any]:
+        """Read data from remote KV store for the provided keys.
+
+        The keys are read with concurrent requests (up to max_workers) on the pooled
+        connections of the session.
+
+        Args:
+            context: A specific context for the read.
+            keys: The keys to read in remote KV store.
+            decode: encoding to use to decode retrieved values or False to not decode values.
+
+        Returns:
+            (list): The response data from the remote KV store in the same order as keys.
+        """
+        return self._map(lambda key: self.read(context, key, decode), list(keys))
@@ -1,6 +1,6 @@
 """TcEx Framework Key Value Redis Module"""
 # standard library
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 
 class KeyValueRedis:
@@ -27,6 +27,20 @@ class KeyValueRedis:
         """
         return self._redis_client.hset(context, key, value)
 
+    def create_many(self, context: str, data: dict) -> int:
+        """Create multiple key/value pairs in Redis with a single HSET.
+
+        Args:
+            context: A specific context for the create.
+            data: The field names (keys) and values for the kv pairs in Redis.
+
+        Returns:
+            int: The number of fields added by Redis.
+        """
+        if not data:
+            return 0
+        return self._redis_client.hset(context, mapping=data)
+
     def delete(self, context: str, key: str) -> str:
         """Alias for hdel method.
 
@@ -67,6 +81,26 @@ class KeyValueRedis:
             value = value.decode('utf-8')
         return value
 
+    def read_many(self, context: str, keys: List[str], decode='utf-8') -> List[Any]:
+        """Read data from Redis for the provided keys with a single HMGET.
+
+        Args:
+            context: A specific context for the read.
+            keys: The field names (keys) for the kv pairs in Redis.
+            decode: encoding to use to decode retrieved values or False to not decode values.
+
+        Returns:
+            list: The response data from Redis in the same order as keys.
+        """
+        if not keys:
+            return []
+
+        values = self._redis_client.hmget(context, keys)
+        if decode:
+            # convert retrieved bytes to string
+            values = [v.decode('utf-8') if isinstance(v, bytes) else v for v in values]
+        return values
+
     def hget(self, context: str, key: str) -> Optional[bytes]:
         """Read data from redis for the provided key.
 
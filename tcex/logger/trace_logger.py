@@ -4,7 +4,8 @@ import logging
 from inspect import getframeinfo, stack
 
 # Create trace logging level
-logging.TRACE = logging.DEBUG - 5
+TRACE = logging.DEBUG - 5
+logging.TRACE = TRACE
 logging.addLevelName(logging.TRACE, 'TRACE')
 
 
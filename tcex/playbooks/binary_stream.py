@@ -0,0 +1,175 @@
+"""TcEx Framework Playbook streaming Binary variables.
+
+Binary values up to the chunk size are written in the standard format (a JSON string of the
+base64 encoded data), so downstream Apps can read them as usual. Larger values are written as
+base64 encoded chunks in separate fields of the context ("<variable>.chunk.<n>"), followed by
+a small manifest in the variable field. The data is encoded and decoded one chunk at a time, so
+peak memory is proportional to the chunk size rather than the size of the value.
+"""
+# standard library
+import base64
+import io
+from typing import Callable, Iterator, Optional
+
+# identifies a manifest written in the variable field for a chunked value
+CHUNKED_MARKER = '_tcexChunkedBinary'
+
+# the raw chunk size is a multiple of 3 so each chunk is base64 encoded without padding and the
+# concatenated chunks are the base64 encoding of the full value
+DEFAULT_CHUNK_SIZE = 3 * 1024 ** 2
+
+
+def chunk_field(key: str, index: int) -> str:
+    """Return the field name for a chunk of a Binary variable.
+
+    Args:
+        key: The variable.
+        index: The chunk index.
+    """
+    return f'{key}.chunk.{index}'
+
+
+def is_manifest(value) -> bool:
+    """Return True if the loaded variable value is the manifest of a chunked Binary value."""
+    return isinstance(value, dict) and value.get(CHUNKED_MARKER) is True
+
+
+class BinaryStreamReader(io.RawIOBase):
+    """Read-only file-like object for a Binary variable.
+
+    Args:
+        chunks: An iterator of the decoded chunks.
+        size: The size of the value in bytes.
+    """
+
+    def __init__(self, chunks: Iterator[bytes], size: int):
+        """Initialize Class properties."""
+        super().__init__()
+        self.size = size
+
+        # properties
+        self._buffer = memoryview(b'')
+        self._chunks = iter(chunks)
+
+    def readable(self) -> bool:
+        """Return True as the stream is readable."""
+        return True
+
+    def readinto(self, b) -> int:
+        """Read bytes into a pre-allocated, writable bytes-like object.
+
+        Args:
+            b: The buffer to read into.
+
+        Returns:
+            int: The number of bytes read (0 at EOF).
+        """
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = memoryview(chunk)
+
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+class BinaryStreamWriter(io.RawIOBase):
+    """Write-only file-like object for a Binary variable.
+
+    The value is written when the writer is closed.
+
+    Args:
+        write_field: A callable that writes a (field, value) pair to the KV store.
+        write_small: A callable that writes a value up to the chunk size in the standard format.
+        key: The variable.
+        chunk_size: The raw (pre base64) chunk size in bytes, rounded down to a multiple of 3.
+    """
+
+    def __init__(
+        self,
+        write_field: Callable[[str, str], None],
+        write_small: Callable[[bytes], None],
+        key: str,
+        chunk_size: Optional[int] = DEFAULT_CHUNK_SIZE,
+    ):
+        """Initialize Class properties."""
+        super().__init__()
+        self.chunk_size = max(3, chunk_size - chunk_size % 3)
+        self.key = key
+        self.size = 0
+
+        # properties
+        self._buffer = bytearray()
+        self._chunks = 0
+        self._write_field = write_field
+        self._write_small = write_small
+
+    def _flush_chunk(self, data) -> None:
+        """Encode and write a chunk."""
+        self._write_field(chunk_field(self.key, self._chunks), base64.b64encode(data).decode())
+        self._chunks += 1
+
+    def close(self) -> None:
+        """Write any buffered data and the manifest, then close the writer."""
+        if self.closed:
+            return
+
+        try:
+            if self._chunks == 0:
+                # small values keep the standard format
+                self._write_small(bytes(self._buffer))
+            else:
+                if self._buffer:
+                    self._flush_chunk(self._buffer)
+                self._write_field(self.key, self.manifest)
+        finally:
+            self._buffer = bytearray()
+            super().close()
+
+    @property
+    def manifest(self) -> str:
+        """Return the manifest written in the variable field for a chunked value."""
+        return (
+            f'{{"{CHUNKED_MARKER}": true, "chunks": {self._chunks}, '
+            f'"chunkSize": {self.chunk_size}, "size": {self.size}}}'
+        )
+
+    def writable(self) -> bool:
+        """Return True as the stream is writable."""
+        return True
+
+    def write(self, b) -> int:
+        """Write a bytes-like object.
+
+        Args:
+            b: The data to write.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        if self.closed:
+            raise ValueError('write to closed file')
+
+        data = memoryview(b).cast('B')
+        size = len(data)
+        self.size += size
+
+        if self._buffer:
+            # complete the partially buffered chunk first
+            missing = self.chunk_size - len(self._buffer)
+            self._buffer += data[:missing]
+            data = data[missing:]
+            if len(self._buffer) < self.chunk_size:
+                return size
+            self._flush_chunk(self._buffer)
+            self._buffer = bytearray()
+
+        # encode full chunks directly from the caller's buffer without copying
+        while len(data) >= self.chunk_size:
+            self._flush_chunk(data[: self.chunk_size])
+            data = data[self.chunk_size :]
+        self._buffer += data
+        return size
@@ -1,7 +1,15 @@
 """TcEx Framework Playbook module"""
 # standard library
+import base64
 import re
 
+from .binary_stream import (
+    DEFAULT_CHUNK_SIZE,
+    BinaryStreamReader,
+    BinaryStreamWriter,
+    chunk_field,
+    is_manifest,
+)
 from .playbooks_base import PlaybooksBase
 
 
@@ -21,6 +29,78 @@ class Playbooks(PlaybooksBase):
         # properties
         self.output_data = {}
 
+    def _read_many_cache_key(self, variable, embedded):
+        """Return the read cache key used by read() for a variable."""
+        variable_type = self.variable_type(variable)
+        if variable_type in self._variable_types:
+            return (variable, embedded, True, False)
+        return (variable, None, None, None)
+
+    def _requested_variable(self, key, value, variable_type=None):
+        """Return the full variable for an output if it was requested by a downstream App.
+
+        Args:
+            key (str): The variable name, not the full variable.
+            value (any): The data to write to the DB.
+            variable_type (str): The variable type being written.
+
+        Returns:
+            (str): The full variable or None if the output should not be written.
+        """
+        #  This is if no downstream variables are requested then nothing should be returned.
+        if not self.output_variables_by_type:  # pragma: no cover
+            self.log.debug(f'Variable {key} was NOT requested by downstream app.')
+            return None
+
+        if key is None:
+            self.log.info('Key has a none value and will not be written.')
+            return None
+
+        if value is None:
+            self.log.info(f'Variable {key} has a none value and will not be written.')
+            return None
+
+        key = key.strip()
+        key_type = f'{key}-{variable_type}'
+        v = None
+        if self.output_variables_by_type.get(key_type) is not None:
+            # variable key-type has been requested
+            v = self.output_variables_by_type.get(key_type)
+        elif self.output_variables_by_name.get(key) is not None and variable_type is None:
+            # variable key has been requested
+            v = self.output_variables_by_name.get(key)
+
+        if v is None:
+            self.log.trace(f'requested output variables: {self.output_variables_by_name}')
+            self.log.debug(f'Variable {key} was NOT requested by downstream app.')
+            return None
+
+        self.log.info(f"Variable {v.get('variable')} was requested by downstream App.")
+        return v.get('variable')
+
+    def _serialize_variable(self, key, value):
+        """Return the validated and serialized value for a variable.
+
+        Args:
+            key (str): The variable to write to the DB.
+            value (any): The data to write to the DB.
+
+        Returns:
+            (any): The serialized value (raw data is returned unchanged).
+        """
+        variable_type = self.variable_type(key)
+
+        # log/debug
+        self.log.debug(f'create variable {key}')
+        if variable_type not in ['Binary', 'BinaryArray']:
+            self.log.trace(f'variable value: {value}')
+
+        if variable_type in self._variable_single_types:
+            return self._serialize(key, value)
+        if variable_type in self._variable_array_types:
+            return self._serialize_array(key, value)
+        return value
+
     def add_output(self, key, value, variable_type, append_array=True):
         """Dynamically add output to output_data dictionary to be written to DB later.
 
@@ -148,6 +228,38 @@ class Playbooks(PlaybooksBase):
             raise RuntimeError(f'The key provided ({key}) is not a {supported_variable_type} key.')
         return self._create(key, value)
 
+    def create_binary_stream(self, key, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Return a file-like object to write a large Binary value in chunks.
+
+        The value is base64 encoded and written one chunk at a time, so it never needs to be held
+        in memory. Values up to the chunk size are written in the standard Binary format.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            with open('report.pdf', 'rb') as src:
+                with tcex.playbook.create_binary_stream('#App:7979:report!Binary') as fh:
+                    shutil.copyfileobj(src, fh, 1024 ** 2)
+
+        Args:
+            key (str): The variable to write to the Key Value Store.
+            chunk_size (int): The size of each chunk in bytes (before base64 encoding).
+
+        Returns:
+            (BinaryStreamWriter): A writable file-like object. The value is complete when the
+                writer is closed.
+        """
+        supported_variable_type = 'Binary'
+        if self.variable_type(key) != supported_variable_type:
+            raise RuntimeError(f'The key provided ({key}) is not a {supported_variable_type} key.')
+
+        key = key.strip()
+        self.log.debug(f'create variable {key} (stream)')
+        return BinaryStreamWriter(
+            self._create_field, lambda value: self._create(key, value), key, chunk_size
+        )
+
     def create_binary_array(self, key, value):
         """Create method of CRUD operation for binary array data.
 
@@ -267,37 +379,21 @@ class Playbooks(PlaybooksBase):
         Returns:
             (str): Result string of DB write.
         """
-        #  This is if no downstream variables are requested then nothing should be returned.
-        if not self.output_variables_by_type:  # pragma: no cover
-            self.log.debug(f'Variable {key} was NOT requested by downstream app.')
+        variable = self._requested_variable(key, value, variable_type)
+        if variable is None:
             return None
-
-        if key is None:
-            self.log.info('Key has a none value and will not be written.')
-            return None
-
-        if value is None:
-            self.log.info(f'Variable {key} has a none value and will not be written.')
-            return None
-
-        key = key.strip()
-        key_type = f'{key}-{variable_type}'
-        results = None
-        if self.output_variables_by_type.get(key_type) is not None:
-            # variable key-type has been requested
-            v = self.output_variables_by_type.get(key_type)
-            self.log.info(f"Variable {v.get('variable')} was requested by downstream App.")
-            results = self.create(v.get('variable'), value)
-        elif self.output_variables_by_name.get(key) is not None and variable_type is None:
-            # variable key has been requested
-            v = self.output_variables_by_name.get(key)
-            self.log.info(f"Variable {v.get('variable')} was requested by downstream App.")
-            results = self.create(v.get('variable'), value)
-        else:
-            self.log.trace(f'requested output variables: {self.output_variables_by_name}')
-            self.log.debug(f'Variable {key} was NOT requested by downstream app.')
-
-        return results
+        return self.create(variable, value)
+
+    def _delete_binary_chunks(self, key):
+        """Delete the chunk fields of a chunked Binary value."""
+        value = self.tcex.key_value_store.read(self._context, key)
+        if isinstance(value, bytes):
+            value = value.decode('utf-8')
+        if isinstance(value, str) and value.startswith('{'):
+            manifest = self._load_value(value)
+            if is_manifest(manifest):
+                for index in range(manifest.get('chunks')):
+                    self.tcex.key_value_store.delete(self._context, chunk_field(key, index))
 
     def delete(self, key):
         """Delete method of CRUD operation for all data types.
@@ -312,7 +408,11 @@ class Playbooks(PlaybooksBase):
         """
         data = None
         if key is not None:
-            data = self.tcex.key_value_store.delete(self._context, key.strip())
+            key = key.strip()
+            if self.variable_type(key) == 'Binary':
+                self._delete_binary_chunks(key)
+            self._read_cache_invalidate([key])
+            data = self.tcex.key_value_store.delete(self._context, key)
         else:  # pragma: no cover
             self.log.warning('The key field was None.')
         return data
@@ -348,9 +448,48 @@ class Playbooks(PlaybooksBase):
         """Return True if provided key is a properly formatted variable."""
         if not isinstance(key, str):
             return False
-        if re.match(self._variable_match, key):
-            return True
-        return False
+        return self._tokenizer.variable(key) is not None
+
+    def iter_array(self, key, embedded=True, b64decode=True, decode=False):
+        """Return an iterator that reads the elements of an array variable one at a time.
+
+        Elements are decoded, coerced, and have embedded variables resolved as they are
+        iterated, so memory use is proportional to a single element rather than the array.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            for indicator in tcex.playbook.iter_array('#App:7979:indicators!StringArray') or []:
+                process(indicator)
+
+        Args:
+            key (str): The array variable to read from the DB.
+            embedded (boolean): Resolve embedded variables.
+            b64decode (bool): If true the BinaryArray elements will be base64 decoded.
+            decode (bool): If true the BinaryArray elements will be decoded to a String.
+
+        Returns:
+            (iterator): The elements or None if the variable is not set.
+        """
+        if self.variable_type(key) not in self._variable_array_types:
+            raise RuntimeError(f'The key provided ({key}) is not an array key.')
+
+        key = key.strip()
+        hit, value = self._read_cache_get((key, embedded, b64decode, decode))
+        if hit:
+            return None if value is None else iter(value)
+
+        self.log.debug(f'read variable {key} (iterator)')
+        try:
+            value = self.tcex.key_value_store.read(self._context, key)
+        except RuntimeError as e:
+            self.log.error(e)
+            return None
+
+        if value is None:
+            return None
+        return self._iter_array_value(key, value, embedded, b64decode, decode)
 
     @property
     def output_variables_by_name(self):
@@ -381,15 +520,9 @@ class Playbooks(PlaybooksBase):
         """
         data = None
         if variable is not None:
-            variable = variable.strip()
-            if re.match(self._variable_match, variable):
-                var = re.search(self._variable_parse, variable)
-                data = {
-                    'root': var.group(0),
-                    'job_id': var.group(2),
-                    'name': var.group(3),
-                    'type': var.group(4),
-                }
+            data = self._tokenizer.variable(variable.strip())
+            if data is not None:
+                data = dict(data)
         return data
 
     def read(self, key, array=False, embedded=True):
@@ -411,8 +544,9 @@ class Playbooks(PlaybooksBase):
         value = key
         if isinstance(key, str):
             key = key.strip()
-            variable_type = self.variable_type(key)
-            if re.match(self._variable_match, key):
+            parsed_variable = self._tokenizer.variable(key)
+            variable_type = 'String' if parsed_variable is None else parsed_variable.get('type')
+            if parsed_variable is not None:
                 # only log key if it's a variable
                 self.log.debug(f'read variable {key}')
                 if variable_type in self._variable_single_types:
@@ -443,6 +577,75 @@ class Playbooks(PlaybooksBase):
 
         return value
 
+    def read_many(self, keys, embedded=True):
+        """Read multiple variables from the KeyValue DB with a single request.
+
+        Each value is decoded the same as read(). Keys that are not variables are returned
+        the same as read() would return them (e.g., a default or a string with embedded
+        variables).
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            ip, hosts = tcex.playbook.read_many(
+                ['#App:7979:ip!String', '#App:7979:hosts!StringArray']
+            )
+
+        Args:
+            keys (list): The variables to read from the DB.
+            embedded (boolean): Resolve embedded variables.
+
+        Returns:
+            (list): Results retrieved from DB in the same order as keys.
+        """
+        variables = []
+        for key in keys:
+            if isinstance(key, str) and self._tokenizer.variable(key.strip()) is not None:
+                variables.append(key.strip())
+        # decode each distinct variable once, only reading variables that are not cached
+        values = {}
+        missing = []
+        for variable in dict.fromkeys(variables):
+            hit, value = self._read_cache_get(self._read_many_cache_key(variable, embedded))
+            if hit:
+                values[variable] = value
+            else:
+                missing.append(variable)
+
+        if missing:
+            self.log.debug(f'read variables {missing}')
+            generation = self._read_cache_generation
+            try:
+                data = self.tcex.key_value_store.read_many(self._context, missing)
+            except RuntimeError as e:
+                self.log.error(e)
+                data = [None] * len(missing)
+                generation = None
+
+            for variable, value in zip(missing, data):
+                variable_type = self.variable_type(variable)
+                if variable_type in self._variable_single_types:
+                    values[variable] = self._read_value(variable, value, embedded)
+                elif variable_type in self._variable_array_types:
+                    values[variable] = self._read_array_value(variable, value, embedded)
+                else:
+                    values[variable] = value
+                self._read_cache_set(
+                    self._read_many_cache_key(variable, embedded),
+                    values[variable],
+                    generation,
+                    value if embedded else None,
+                )
+
+        results = []
+        for key in keys:
+            if isinstance(key, str) and key.strip() in values:
+                results.append(values.get(key.strip()))
+            else:
+                results.append(self.read(key, embedded=embedded))
+        return results
+
     def _entity_field(self, key, field, entity_type=None, default=None):
         """Read the value of the given key and return the data at the given field of the value.
 
@@ -599,6 +802,42 @@ class Playbooks(PlaybooksBase):
         """
         return self._read(key, b64decode=b64decode, decode=decode)
 
+    def read_binary_stream(self, key):
+        """Return a file-like object to read a Binary value one chunk at a time.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            fh = tcex.playbook.read_binary_stream('#App:7979:report!Binary')
+            if fh is not None:
+                with open('report.pdf', 'wb') as dst:
+                    shutil.copyfileobj(fh, dst, 1024 ** 2)
+
+        Args:
+            key (str): The variable to read from the DB.
+
+        Returns:
+            (BinaryStreamReader): A readable file-like object or None if the variable is not set.
+        """
+        supported_variable_type = 'Binary'
+        if self.variable_type(key) != supported_variable_type:
+            raise RuntimeError(f'The key provided ({key}) is not a {supported_variable_type} key.')
+
+        key = key.strip()
+        self.log.debug(f'read variable {key} (stream)')
+        value = self.tcex.key_value_store.read(self._context, key)
+        if value is None:
+            return None
+
+        value = self._load_value(value)
+        if is_manifest(value):
+            return BinaryStreamReader(self._binary_chunks(key, value), value.get('size'))
+
+        # values in the standard format are small enough to decode at once
+        value = base64.b64decode(value)
+        return BinaryStreamReader([value], len(value))
+
     def read_binary_array(self, key, b64decode=True, decode=False):
         """Read method of CRUD operation for binary array data.
 
@@ -706,12 +945,28 @@ class Playbooks(PlaybooksBase):
         """
         var_type = 'String'
         if isinstance(variable, str):
-            variable = variable.strip()
-            if re.match(self._variable_match, variable):
-                var_type = re.search(self._variable_parse, variable).group(4)
+            parsed_variable = self._tokenizer.variable(variable.strip())
+            if parsed_variable is not None:
+                var_type = parsed_variable.get('type')
         return var_type
 
     def write_output(self):
-        """Write all stored output data to storage."""
-        for data in self.output_data.values():
-            self.create_output(data.get('key'), data.get('value'), data.get('type'))
+        """Write all stored output data to storage.
+
+        Each requested output is validated and serialized the same as create_output(), then
+        all outputs are written to the KV store in a single batched write (one HSET for Redis).
+        Invalid outputs are logged and skipped, so they do not prevent the other outputs from
+        being written.
+        """
+        data = {}
+        for output in self.output_data.values():
+            value = output.get('value')
+            variable = self._requested_variable(output.get('key'), value, output.get('type'))
+            if variable is None:
+                continue
+
+            try:
+                data[variable] = self._serialize_variable(variable, value)
+            except RuntimeError as e:
+                self.log.error(f'Output variable {variable} was not written ({e}).')
+        self._create_many(data)
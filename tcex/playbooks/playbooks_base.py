@@ -1,10 +1,22 @@
 """TcEx Framework Playbook module"""
 # standard library
 import base64
+import copy
 import json
-import re
-from collections import OrderedDict
+import threading
 from collections.abc import Iterable
+from json.decoder import WHITESPACE
+
+from ..utils.json_codec import json_codec
+from .binary_stream import chunk_field, is_manifest
+from .variable_tokenizer import (
+    VARIABLE_PATTERN,
+    VariableTokenizer,
+    variable_expansion,
+    variable_match,
+    variable_parse,
+    vars_keyvalue_embedded,
+)
 
 
 class PlaybooksBase:
@@ -16,6 +28,9 @@ class PlaybooksBase:
         output_variables (list): The requested output variables.
     """
 
+    # parsed values and variables are shared by all instances (e.g., per session in services)
+    _tokenizer = VariableTokenizer()
+
     def __init__(self, tcex, context, output_variables):
         """Initialize the Class properties."""
         self.tcex = tcex
@@ -25,14 +40,35 @@ class PlaybooksBase:
         # properties
         self._output_variables_by_name = None
         self._output_variables_by_type = None
+        self._read_cache = None
+        self._read_cache_copy = False
+        self._read_cache_embedded = set()
+        self._read_cache_generation = 0
+        self._read_cache_lock = threading.Lock()
         self.log = tcex.log
 
         # match full variable
-        self._variable_match = re.compile(fr'^{self._variable_pattern}$')
+        self._variable_match = variable_match
         # capture variable parts (exactly a variable)
-        self._variable_parse = re.compile(self._variable_pattern)
+        self._variable_parse = variable_parse
         # match embedded variables without quotes (#App:7979:variable_name!StringArray)
-        self._vars_keyvalue_embedded = re.compile(fr'(?:\"\:\s?)[^\"]?{self._variable_pattern}')
+        self._vars_keyvalue_embedded = vars_keyvalue_embedded
+
+    def _binary_chunks(self, key, manifest, b64decode=True):
+        """Yield the chunks of a chunked Binary value.
+
+        Args:
+            key (str): The variable.
+            manifest (dict): The manifest read from the variable field.
+            b64decode (bool): If true the chunks will be base64 decoded.
+        """
+        for index in range(manifest.get('chunks')):
+            data = self.tcex.key_value_store.read(self._context, chunk_field(key, index))
+            if data is None:
+                raise RuntimeError(f'Chunk {index} of variable {key} was not found.')
+            if isinstance(data, bytes):
+                data = data.decode('utf-8')
+            yield base64.b64decode(data) if b64decode else data
 
     def _coerce_string_value(self, value):
         """Return a string value from an bool or int."""
@@ -55,37 +91,8 @@ class PlaybooksBase:
             self.log.warning('The key or value field is None.')
             return None
 
-        # get variable type from variable value
-        variable_type = self.variable_type(key)
-
-        if variable_type == 'Binary':
-            # if not isinstance(value, bytes):
-            #     value = value.encode('utf-8')
-            if validate and not isinstance(value, bytes):
-                raise RuntimeError('Invalid data provided for Binary.')
-            value = base64.b64encode(value).decode('utf-8')
-        elif variable_type == 'KeyValue':
-            if validate and (not isinstance(value, dict) or not self._is_key_value(value)):
-                raise RuntimeError('Invalid data provided for KeyValue.')
-        elif variable_type == 'String':
-            # coerce string values
-            value = self._coerce_string_value(value)
-
-            if validate and not isinstance(value, str):
-                raise RuntimeError('Invalid data provided for String.')
-        elif variable_type == 'TCBatch':
-            if validate and (not isinstance(value, str) or not self._is_tc_batch(value)):
-                raise RuntimeError('Invalid data provided for TcBatch.')
-        elif variable_type == 'TCEntity':
-            if validate and (not isinstance(value, dict) or not self._is_tc_entity(value)):
-                raise RuntimeError('Invalid data provided for TcEntity.')
-
-        # self.log.trace(f'pb create - context: {self._context}, key: {key}, value: {value}')
-        try:
-            value = json.dumps(value)
-        except ValueError as e:  # pragma: no cover
-            raise RuntimeError(f'Failed to serialize value ({e}).')
-
+        value = self._serialize(key, value, validate)
+        self._read_cache_invalidate([key])
         try:
             return self.tcex.key_value_store.create(self._context, key.strip(), value)
         except RuntimeError as e:
@@ -98,54 +105,41 @@ class PlaybooksBase:
             self.log.warning('The key or value field is None.')
             return None
 
-        # get variable type from variable value
-        variable_type = self.variable_type(key)
+        value = self._serialize_array(key, value, validate)
+        self._read_cache_invalidate([key])
+        try:
+            return self.tcex.key_value_store.create(self._context, key.strip(), value)
+        except RuntimeError as e:
+            self.log.error(e)
+        return None
 
-        # Enhanced entity array is the wild-wild west, don't validate it
-        if variable_type != 'TCEnhancedEntityArray':
-            if validate and (not isinstance(value, Iterable) or isinstance(value, (str, dict))):
-                raise RuntimeError(f'Invalid data provided for {variable_type}.')
+    def _create_field(self, field, value):
+        """Write a field of a chunked Binary value (a chunk or the manifest).
 
-            value = [
-                *value
-            ]  # spread the value so that we know it's a list (as opposed to an iterable)
+        Args:
+            field (str): The field name.
+            value (str): The encoded chunk or manifest.
+        """
+        self._read_cache_invalidate([field])
+        self.tcex.key_value_store.create(self._context, field, value)
 
-        if variable_type == 'BinaryArray':
-            value_encoded = []
-            for v in value:
-                if v is not None:
-                    if validate and not isinstance(v, bytes):
-                        raise RuntimeError('Invalid data provided for Binary.')
-                    # if not isinstance(v, bytes):
-                    #     v = v.encode('utf-8')
-                    v = base64.b64encode(v).decode('utf-8')
-                value_encoded.append(v)
-            value = value_encoded
-        elif variable_type == 'KeyValueArray':
-            if validate and not self._is_key_value_array(value):
-                raise RuntimeError('Invalid data provided for KeyValueArray.')
-        elif variable_type == 'StringArray':
-            value_coerced = []
-            for v in value:
-                # coerce string values
-                v = self._coerce_string_value(v)
+    def _create_many(self, data):
+        """Create multiple serialized values in Redis in a single write.
 
-                if validate and not isinstance(v, (type(None), str)):
-                    raise RuntimeError('Invalid data provided for StringArray.')
-                value_coerced.append(v)
-            value = value_coerced
-        elif variable_type == 'TCEntityArray':
-            if validate and not self._is_tc_entity_array(value):
-                raise RuntimeError('Invalid data provided for TcEntityArray.')
+        Args:
+            data (dict): The serialized values by variable.
 
-        # self.log.trace(f'pb create - context: {self._context}, key: {key}, value: {value}')
-        try:
-            value = json.dumps(value)
-        except ValueError as e:  # pragma: no cover
-            raise RuntimeError(f'Failed to serialize value ({e}).')
+        Returns:
+            (any): Result of DB write.
+        """
+        if not data:
+            return None
 
+        self._read_cache_invalidate(data)
         try:
-            return self.tcex.key_value_store.create(self._context, key.strip(), value)
+            return self.tcex.key_value_store.create_many(
+                self._context, {k.strip(): v for k, v in data.items()}
+            )
         except RuntimeError as e:
             self.log.error(e)
         return None
@@ -178,7 +172,7 @@ class PlaybooksBase:
     def _is_tc_batch(data):
         """Return True if provided data has proper structure for TC Batch."""
         try:
-            json_ = json.loads(data)
+            json_ = json_codec.loads(data)
             return all(x in json_ for x in ['indicators', 'groups'])
         except Exception:
             return False
@@ -197,6 +191,84 @@ class PlaybooksBase:
                 return False
         return True
 
+    @staticmethod
+    def _iter_json_array(value):
+        """Yield (element, start, end) for each element of a JSON array.
+
+        Elements are decoded one at a time, so only the current element is loaded in memory.
+
+        Args:
+            value (str): The JSON array data from key/value store.
+
+        Raises:
+            RuntimeError: Raise error when data is not a JSON array.
+        """
+        scan_once = json.JSONDecoder().scan_once
+        index = WHITESPACE.match(value, 0).end()
+        if value[index : index + 1] != '[':
+            raise RuntimeError(f'Failed to JSON load data "{value[:100]}" (not an array).')
+
+        index = WHITESPACE.match(value, index + 1).end()
+        if value[index : index + 1] == ']':
+            return
+
+        while True:
+            try:
+                element, end = scan_once(value, index)
+            except StopIteration:
+                raise RuntimeError(
+                    f'Failed to JSON load data "{value[:100]}" (expected value at {index}).'
+                )
+            yield element, index, end
+
+            # only match whitespace when the element is not directly followed by a delimiter
+            delimiter = value[end : end + 1]
+            if delimiter not in (',', ']'):
+                end = WHITESPACE.match(value, end).end()
+                delimiter = value[end : end + 1]
+            if delimiter == ']':
+                return
+            if delimiter != ',':
+                raise RuntimeError(
+                    f'Failed to JSON load data "{value[:100]}" (expected "," at {end}).'
+                )
+            index = end + 1
+            if value[index : index + 1] in (' ', '\n', '\r', '\t'):
+                index = WHITESPACE.match(value, index).end()
+
+    def _iter_array_value(self, key, value, embedded=True, b64decode=True, decode=False):
+        """Yield the decoded elements of an array type variable read from the DB.
+
+        Each element is decoded the same as _read_array_value(), but embedded variables are
+        resolved per element and the array is never loaded as a whole.
+        """
+        if isinstance(value, bytes):
+            value = value.decode('utf-8')
+
+        # get variable type from variable value
+        variable_type = self.variable_type(key)
+
+        if variable_type == 'KeyValueArray':
+            # embedded variable can be unquoted, which breaks JSON.
+            value = self._wrap_embedded_keyvalue(value)
+
+        resolve = embedded and variable_type in ['KeyValueArray', 'StringArray']
+        for element, start, end in self._iter_json_array(value):
+            if resolve:
+                raw = value[start:end]
+                if '#' in raw or '&' in raw:
+                    element = self._load_value(self._read_embedded(raw))
+
+            if variable_type == 'BinaryArray':
+                if element is not None and b64decode:
+                    element = base64.b64decode(element)
+                    if decode:
+                        element = self._decode_binary(element)
+            elif variable_type == 'StringArray':
+                # coerce string values
+                element = self._coerce_string_value(element)
+            yield element
+
     @staticmethod
     def _load_value(value):
         """Return the loaded JSON value or raise an error.
@@ -211,7 +283,7 @@ class PlaybooksBase:
             any: The de-serialized value from the key/value store.
         """
         try:
-            return json.loads(value, object_pairs_hook=OrderedDict)
+            return json_codec.loads(value)
         except ValueError as e:  # pragma: no cover
             raise RuntimeError(f'Failed to JSON load data "{value}" ({e}).')
 
@@ -242,43 +314,22 @@ class PlaybooksBase:
             self.log.warning('The key is None.')
             return None
 
-        # get variable type from variable value
-        variable_type = self.variable_type(key)
+        key = key.strip()
+        cache_key = (key, embedded, b64decode, decode)
+        hit, value = self._read_cache_get(cache_key)
+        if hit:
+            return value
+        generation = self._read_cache_generation
 
         try:
-            value = self.tcex.key_value_store.read(self._context, key.strip())
+            value = self.tcex.key_value_store.read(self._context, key)
         except RuntimeError as e:
             self.log.error(e)
             return None
 
-        if value is None:
-            return value
-
-        if variable_type == 'Binary':
-            value = self._load_value(value)
-
-            if b64decode:
-                value = base64.b64decode(value)
-                if decode:
-                    value = self._decode_binary(value)
-        elif variable_type == 'KeyValue':
-            # embedded variable can be unquoted, which breaks JSON.
-            value = self._wrap_embedded_keyvalue(value)
-
-            if embedded:
-                value = self._read_embedded(value)
-
-            value = self._load_value(value)
-        elif variable_type == 'String':
-            if embedded:
-                value = self._read_embedded(value)
-
-            # coerce string values
-            value = self._coerce_string_value(self._load_value(value))
-        elif variable_type in ['TCEntity', 'TCBatch']:
-            value = self._load_value(value)
-
-        return value
+        data = self._read_value(key, value, embedded, b64decode, decode)
+        self._read_cache_set(cache_key, data, generation, value if embedded else None)
+        return data
 
     def _read_array(self, key, embedded=True, b64decode=True, decode=False):
         """Create the value in Redis if applicable."""
@@ -286,20 +337,33 @@ class PlaybooksBase:
             self.log.warning('The null value for key was provided.')
             return None
 
-        # get variable type from variable value
-        variable_type = self.variable_type(key)
+        key = key.strip()
+        cache_key = (key, embedded, b64decode, decode)
+        hit, value = self._read_cache_get(cache_key)
+        if hit:
+            return value
+        generation = self._read_cache_generation
 
         try:
-            value = self.tcex.key_value_store.read(self._context, key.strip())
+            value = self.tcex.key_value_store.read(self._context, key)
         except RuntimeError as e:
             self.log.error(e)
             return None
 
+        data = self._read_array_value(key, value, embedded, b64decode, decode)
+        self._read_cache_set(cache_key, data, generation, value if embedded else None)
+        return data
+
+    def _read_array_value(self, key, value, embedded=True, b64decode=True, decode=False):
+        """Return the decoded value of an array type variable read from the DB."""
         if value is None:
             return value
 
+        # get variable type from variable value
+        variable_type = self.variable_type(key)
+
         if variable_type == 'BinaryArray':
-            value = json.loads(value, object_pairs_hook=OrderedDict)
+            value = json_codec.loads(value)
 
             values = []
             for v in value:
@@ -317,7 +381,7 @@ class PlaybooksBase:
                 value = self._read_embedded(value)
 
             try:
-                value = json.loads(value, object_pairs_hook=OrderedDict)
+                value = json_codec.loads(value)
             except ValueError as e:  # pragma: no cover
                 raise RuntimeError(f'Failed loading JSON data ({value}). Error: ({e})')
         elif variable_type == 'StringArray':
@@ -336,6 +400,67 @@ class PlaybooksBase:
         # self.log.trace(f'pb create - context: {self._context}, key: {key}, value: {value}')
         return value
 
+    def _read_cache_get(self, cache_key):
+        """Return a (hit, value) tuple for a read cache key.
+
+        The cached value is shared by every read unless read_cache_copy is enabled.
+        """
+        if self._read_cache is None:
+            return False, None
+
+        with self._read_cache_lock:
+            if self._read_cache is None or cache_key not in self._read_cache:
+                return False, None
+            value = self._read_cache[cache_key]
+        if self._read_cache_copy:
+            value = copy.deepcopy(value)
+        return True, value
+
+    def _read_cache_invalidate(self, keys):
+        """Remove the cached values for the keys.
+
+        Values that were resolved with embedded variables may depend on any of the keys, so
+        they are also removed.
+
+        Args:
+            keys (list): The variables that were created or deleted.
+        """
+        if self._read_cache is None:
+            return
+
+        keys = {k.strip() for k in keys}
+        with self._read_cache_lock:
+            # reads that started before this write will not store their value
+            self._read_cache_generation += 1
+            if self._read_cache is None:
+                return
+            for cache_key in list(self._read_cache):
+                if cache_key[0] in keys or cache_key in self._read_cache_embedded:
+                    del self._read_cache[cache_key]
+                    self._read_cache_embedded.discard(cache_key)
+
+    def _read_cache_set(self, cache_key, value, generation, raw=None):
+        """Store a decoded value in the read cache if no write happened since the read started.
+
+        Args:
+            cache_key (tuple): The read cache key.
+            value (any): The decoded value.
+            generation (int): The read cache generation when the read started.
+            raw (str): The value from the KV store if embedded variables were resolved.
+        """
+        if self._read_cache is None:
+            return
+
+        embedded = isinstance(raw, str) and variable_expansion.search(raw)
+        if self._read_cache_copy:
+            # the value is returned to the caller, so a copy is cached
+            value = copy.deepcopy(value)
+        with self._read_cache_lock:
+            if self._read_cache is not None and generation == self._read_cache_generation:
+                self._read_cache[cache_key] = value
+                if embedded:
+                    self._read_cache_embedded.add(cache_key)
+
     def _read_embedded(self, value):
         """Read method for "embedded" variables.
 
@@ -388,63 +513,167 @@ class PlaybooksBase:
         if value is None:  # pragma: no cover
             return value
 
-        for match in re.finditer(self._variable_expansion_pattern, str(value)):
-            variable = match.group(0)  # the full variable pattern
-            if match.group('origin') == '#':  # pb-variable
-                v = self.read(variable)
-            elif match.group('origin') == '&':  # tc-variable
-                v = self.tcex.resolve_variable(
-                    match.group('provider'), match.group('lookup'), match.group('id')
-                )
+        template = self._tokenizer.template(str(value))
+        if not template.tokens:
+            return value
 
-            self.log.trace(f'embedded variable: {variable}, value: {v}')
-            if isinstance(v, (dict, list)):
-                v = json.dumps(v)
-                # for KeyValueArray with nested dict/list type replace the
-                # quoted value to ensure the resulting data is loadable JSON
-                value = re.sub(f'"{variable}"', v, value)
+        # resolve each distinct variable once, reading all pb-variables in a single request
+        pb_variables = template.pb_variables
+        resolved = dict(zip(pb_variables, self.read_many(pb_variables))) if pb_variables else {}
+        for token in template.tc_variables:
+            resolved[token.variable] = self.tcex.resolve_variable(
+                token.provider, token.lookup, token.id
+            )
 
-            if v is not None:
+        replacements = {}
+        for variable, v in resolved.items():
+            self.log.trace(f'embedded variable: {variable}, value: {v}')
+            if v is None:
                 # only replace variable if a non-null value is returned from kv store
                 # APP-1030 need to revisit this to handle variable references in kv/kvarrays that
                 # are None.  Would like to be able to say if value is just the variable reference,
                 # sub None value, else insert '' in string.  That would require a kv-specific
                 # version of this method that gets the entire list/dict instead of just the string.
-                value = re.sub(variable, v, value)
+                continue
+
+            # for KeyValueArray with nested dict/list type replace the
+            # quoted value to ensure the resulting data is loadable JSON
+            nested = isinstance(v, (dict, list))
+            if nested:
+                # the json module formatting is kept as the value is inserted into user text
+                v = json.dumps(v)
+            replacements[variable] = (self._tokenizer.expand(v), nested)
+
+        # substitute all variables in a single pass over the value
+        return template.render(replacements)
+
+    def _read_value(self, key, value, embedded=True, b64decode=True, decode=False):
+        """Return the decoded value of a single type variable read from the DB."""
+        if value is None:
+            return value
+
+        # get variable type from variable value
+        variable_type = self.variable_type(key)
+
+        if variable_type == 'Binary':
+            value = self._load_value(value)
+            if is_manifest(value):
+                # chunked value written with create_binary_stream()
+                value = ''.join(self._binary_chunks(key, value, b64decode=False))
+
+            if b64decode:
+                value = base64.b64decode(value)
+                if decode:
+                    value = self._decode_binary(value)
+        elif variable_type == 'KeyValue':
+            # embedded variable can be unquoted, which breaks JSON.
+            value = self._wrap_embedded_keyvalue(value)
+
+            if embedded:
+                value = self._read_embedded(value)
+
+            value = self._load_value(value)
+        elif variable_type == 'String':
+            if embedded:
+                value = self._read_embedded(value)
+
+            # coerce string values
+            value = self._coerce_string_value(self._load_value(value))
+        elif variable_type in ['TCEntity', 'TCBatch']:
+            value = self._load_value(value)
+
         return value
 
+    def _serialize(self, key, value, validate=True):
+        """Return the validated and serialized value for a single type variable."""
+        # get variable type from variable value
+        variable_type = self.variable_type(key)
+
+        if variable_type == 'Binary':
+            # if not isinstance(value, bytes):
+            #     value = value.encode('utf-8')
+            if validate and not isinstance(value, bytes):
+                raise RuntimeError('Invalid data provided for Binary.')
+            value = base64.b64encode(value).decode('utf-8')
+        elif variable_type == 'KeyValue':
+            if validate and (not isinstance(value, dict) or not self._is_key_value(value)):
+                raise RuntimeError('Invalid data provided for KeyValue.')
+        elif variable_type == 'String':
+            # coerce string values
+            value = self._coerce_string_value(value)
+
+            if validate and not isinstance(value, str):
+                raise RuntimeError('Invalid data provided for String.')
+        elif variable_type == 'TCBatch':
+            if validate and (not isinstance(value, str) or not self._is_tc_batch(value)):
+                raise RuntimeError('Invalid data provided for TcBatch.')
+        elif variable_type == 'TCEntity':
+            if validate and (not isinstance(value, dict) or not self._is_tc_entity(value)):
+                raise RuntimeError('Invalid data provided for TcEntity.')
+
+        # self.log.trace(f'pb create - context: {self._context}, key: {key}, value: {value}')
+        try:
+            return json_codec.dumps(value)
+        except ValueError as e:  # pragma: no cover
+            raise RuntimeError(f'Failed to serialize value ({e}).')
+
+    def _serialize_array(self, key, value, validate=True):
+        """Return the validated and serialized value for an array type variable."""
+        # get variable type from variable value
+        variable_type = self.variable_type(key)
+
+        # Enhanced entity array is the wild-wild west, don't validate it
+        if variable_type != 'TCEnhancedEntityArray':
+            if validate and (not isinstance(value, Iterable) or isinstance(value, (str, dict))):
+                raise RuntimeError(f'Invalid data provided for {variable_type}.')
+
+            value = [
+                *value
+            ]  # spread the value so that we know it's a list (as opposed to an iterable)
+
+        if variable_type == 'BinaryArray':
+            value_encoded = []
+            for v in value:
+                if v is not None:
+                    if validate and not isinstance(v, bytes):
+                        raise RuntimeError('Invalid data provided for Binary.')
+                    # if not isinstance(v, bytes):
+                    #     v = v.encode('utf-8')
+                    v = base64.b64encode(v).decode('utf-8')
+                value_encoded.append(v)
+            value = value_encoded
+        elif variable_type == 'KeyValueArray':
+            if validate and not self._is_key_value_array(value):
+                raise RuntimeError('Invalid data provided for KeyValueArray.')
+        elif variable_type == 'StringArray':
+            value_coerced = []
+            for v in value:
+                # coerce string values
+                v = self._coerce_string_value(v)
+
+                if validate and not isinstance(v, (type(None), str)):
+                    raise RuntimeError('Invalid data provided for StringArray.')
+                value_coerced.append(v)
+            value = value_coerced
+        elif variable_type == 'TCEntityArray':
+            if validate and not self._is_tc_entity_array(value):
+                raise RuntimeError('Invalid data provided for TcEntityArray.')
+
+        # self.log.trace(f'pb create - context: {self._context}, key: {key}, value: {value}')
+        try:
+            return json_codec.dumps(value)
+        except ValueError as e:  # pragma: no cover
+            raise RuntimeError(f'Failed to serialize value ({e}).')
+
     @property
     def _variable_pattern(self):
         """Regex pattern to match and parse a playbook variable."""
-        return (
-            r'#([A-Za-z]+)'  # match literal (#App,#Trigger) at beginning of String
-            r':([\d]+)'  # app id (:7979)
-            r':([A-Za-z0-9_\.\-\[\]]+)'  # variable name (:variable_name)
-            r'!(StringArray|BinaryArray|KeyValueArray'  # variable type (array)
-            r'|TCEntityArray|TCEnhancedEntityArray'  # variable type (array)
-            r'|String|Binary|KeyValue|TCEntity|TCEnhancedEntity'  # variable type
-            r'|(?:(?!String)(?!Binary)(?!KeyValue)'  # non matching for custom
-            r'(?!TCEntity)(?!TCEnhancedEntity)'  # non matching for custom
-            r'[A-Za-z0-9_-]+))'  # variable type (custom)
-        )
+        return VARIABLE_PATTERN
 
     @property
     def _variable_expansion_pattern(self):
         """Regex pattern to match and parse a playbook variable."""
-        return re.compile(
-            # Origin: "#" -> PB-Variable "&" -> TC-Variable
-            r'(?P<origin>#|&)'
-            r'(?:\{)?'  # drop "{"
-            # Provider: PB-Variable -> literal "App" or TC-Variable -> provider (e.g. TC|Vault)
-            r'(?P<provider>[A-Za-z]+):'
-            # ID: PB-Variable -> App ID or TC-Variable -> FILE|KEYCHAIN|TEXT
-            r'(?P<id>[\w]+):'
-            # Lookup: PB-Variable -> variable name or TC-Variable -> variable identifier
-            r'(?P<lookup>[A-Za-z0-9_\.\-\[\]]+)'
-            r'(?:\})?'  # drop "}"
-            # Type: PB-Variable -> variable type (e.g., String|StringArray)
-            r'(?:!(?P<type>[A-Za-z0-9_-]+))?'
-        )
+        return variable_expansion
 
     @property
     def _variable_array_types(self):
@@ -485,18 +714,57 @@ class PlaybooksBase:
         """
         # TODO: need to verify if core still sends improper JSON for KeyValueArrays
         if data is not None:  # pragma: no cover
-            variables = []
-            for v in re.finditer(self._vars_keyvalue_embedded, data):
-                variables.append(v.group(0))
-
-            for var in set(variables):  # recursion over set to handle duplicates
-                # pull (#App:1441:embedded_string!String) from (": #App:1441:embedded_string!String)
-                variable_string = re.search(self._variable_parse, var).group(0)
-                # reformat to replace the correct instance only, handling the case where a variable
-                # is embedded multiple times in the same key value array.
-                data = data.replace(var, f'": "{variable_string}"')
+            data = self._tokenizer.wrap_embedded_keyvalue(data)
         return data
 
+    @property
+    def read_cache(self):
+        """Return True if decoded values are cached by variable for this context."""
+        return self._read_cache is not None
+
+    @read_cache.setter
+    def read_cache(self, enabled):
+        """Enable or disable the read cache.
+
+        When enabled, repeated reads of the same variable return the decoded value without a
+        request to the KV store. Cached values are removed when the variable is created or
+        deleted using this instance.
+
+        Cached values are shared, so dict and list values returned while the cache is enabled
+        must be treated as read-only. Enable read_cache_copy to get a copy on each read.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            tcex.playbook.read_cache = True
+        """
+        with self._read_cache_lock:
+            self._read_cache_generation += 1
+            self._read_cache = {} if enabled else None
+            self._read_cache_embedded = set()
+
+    @property
+    def read_cache_copy(self):
+        """Return True if reads from the read cache return a copy of the cached value."""
+        return self._read_cache_copy
+
+    @read_cache_copy.setter
+    def read_cache_copy(self, enabled):
+        """Enable or disable copying cached values.
+
+        When enabled, each read returns a deep copy of the cached value, so dict and list values
+        can be modified by the caller without changing the cached value.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            tcex.playbook.read_cache = True
+            tcex.playbook.read_cache_copy = True
+        """
+        self._read_cache_copy = enabled
+
     def create_raw(self, key, value):
         """Create method of CRUD operation for raw data.
 
@@ -512,6 +780,7 @@ class PlaybooksBase:
         """
         data = None
         if key is not None and value is not None:
+            self._read_cache_invalidate([key])
             try:
                 data = self.tcex.key_value_store.create(self._context, key.strip(), value)
             except RuntimeError as e:
@@ -534,7 +803,14 @@ class PlaybooksBase:
         """
         value = None
         if key is not None:
-            value = self.tcex.key_value_store.read(self._context, key.strip())
+            key = key.strip()
+            hit, value = self._read_cache_get((key, None, None, None))
+            if hit:
+                return value
+            generation = self._read_cache_generation
+
+            value = self.tcex.key_value_store.read(self._context, key)
+            self._read_cache_set((key, None, None, None), value, generation)
         else:
             self.log.warning('The key field was None.')
         return value
@@ -547,6 +823,10 @@ class PlaybooksBase:
         """Set placeholder for child method."""
         raise NotImplementedError('Implemented in child class')
 
+    def read_many(self, keys, embedded=True):  # pragma: no cover
+        """Set placeholder for child method."""
+        raise NotImplementedError('Implemented in child class')
+
     def variable_type(self, variable):  # pragma: no cover
         """Set placeholder for child method."""
         raise NotImplementedError('Implemented in child class')
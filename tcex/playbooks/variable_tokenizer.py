@@ -0,0 +1,260 @@
+"""TcEx Framework Playbook variable tokenizer.
+
+Values are parsed once into a template of literal and variable segments, so reading a variable,
+resolving embedded variables, and detecting the variable type are a single pass over the value.
+Parsed templates and variables are cached by the input string.
+"""
+# standard library
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
+
+# regex pattern to match and parse a playbook variable
+VARIABLE_PATTERN = (
+    r'#([A-Za-z]+)'  # match literal (#App,#Trigger) at beginning of String
+    r':([\d]+)'  # app id (:7979)
+    r':([A-Za-z0-9_\.\-\[\]]+)'  # variable name (:variable_name)
+    r'!(StringArray|BinaryArray|KeyValueArray'  # variable type (array)
+    r'|TCEntityArray|TCEnhancedEntityArray'  # variable type (array)
+    r'|String|Binary|KeyValue|TCEntity|TCEnhancedEntity'  # variable type
+    r'|(?:(?!String)(?!Binary)(?!KeyValue)'  # non matching for custom
+    r'(?!TCEntity)(?!TCEnhancedEntity)'  # non matching for custom
+    r'[A-Za-z0-9_-]+))'  # variable type (custom)
+)
+
+# regex pattern to match and parse a playbook or tc variable embedded in a value
+VARIABLE_EXPANSION_PATTERN = (
+    # Origin: "#" -> PB-Variable "&" -> TC-Variable
+    r'(?P<origin>#|&)'
+    r'(?:\{)?'  # drop "{"
+    # Provider: PB-Variable -> literal "App" or TC-Variable -> provider (e.g. TC|Vault)
+    r'(?P<provider>[A-Za-z]+):'
+    # ID: PB-Variable -> App ID or TC-Variable -> FILE|KEYCHAIN|TEXT
+    r'(?P<id>[\w]+):'
+    # Lookup: PB-Variable -> variable name or TC-Variable -> variable identifier
+    r'(?P<lookup>[A-Za-z0-9_\.\-\[\]]+)'
+    r'(?:\})?'  # drop "}"
+    # Type: PB-Variable -> variable type (e.g., String|StringArray)
+    r'(?:!(?P<type>[A-Za-z0-9_-]+))?'
+)
+
+# match full variable
+variable_match = re.compile(fr'^{VARIABLE_PATTERN}$')
+# capture variable parts (exactly a variable)
+variable_parse = re.compile(VARIABLE_PATTERN)
+# match embedded variables
+variable_expansion = re.compile(VARIABLE_EXPANSION_PATTERN)
+# match embedded variables including optional surrounding quotes
+variable_expansion_quoted = re.compile(
+    fr'(?P<quote>")?(?P<variable>{VARIABLE_EXPANSION_PATTERN})(?(quote)")'
+)
+# match embedded variables without quotes (#App:7979:variable_name!StringArray)
+vars_keyvalue_embedded = re.compile(fr'(?:\"\:\s?)[^\"]?(?P<variable>{VARIABLE_PATTERN})')
+
+# a match with no groups, used to process backslash escapes the same as a re.sub() replacement
+_empty_match = re.match('', '')
+
+
+class VariableToken(NamedTuple):
+    """An embedded variable in a template."""
+
+    text: str  # the matched text, including surrounding quotes
+    variable: str  # the full variable
+    origin: str  # "#" for a playbook variable or "&" for a tc variable
+    provider: str
+    id: str
+    lookup: str
+    type: Optional[str]
+    quoted: bool
+
+
+class VariableTemplate:
+    """A value parsed into literal (str) and variable (VariableToken) segments.
+
+    Args:
+        segments: The literal and variable segments in order.
+    """
+
+    __slots__ = ['segments', 'tokens']
+
+    def __init__(self, segments: List[Union[str, VariableToken]]):
+        """Initialize Class properties."""
+        self.segments = segments
+        # distinct variables in order of first appearance
+        self.tokens: Dict[str, VariableToken] = {}
+        for segment in segments:
+            if isinstance(segment, VariableToken):
+                self.tokens.setdefault(segment.variable, segment)
+
+    @property
+    def pb_variables(self) -> List[str]:
+        """Return the distinct playbook variables."""
+        return [v for v, t in self.tokens.items() if t.origin == '#']
+
+    @property
+    def tc_variables(self) -> List[VariableToken]:
+        """Return the distinct tc variables."""
+        return [t for t in self.tokens.values() if t.origin == '&']
+
+    def render(self, replacements: Dict[str, tuple]) -> str:
+        """Return the value with the variables replaced.
+
+        Args:
+            replacements: A (value, nested) tuple by variable. Nested values (serialized
+                dict/list) also replace the quotes surrounding the variable so the result is
+                loadable JSON. Variables without a replacement are left unchanged.
+        """
+        parts = []
+        for segment in self.segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+
+            replacement = replacements.get(segment.variable)
+            if replacement is None:
+                parts.append(segment.text)
+            elif replacement[1] or not segment.quoted:
+                parts.append(replacement[0])
+            else:
+                parts.extend(['"', replacement[0], '"'])
+        return ''.join(parts)
+
+
+class VariableTokenizer:
+    """Tokenizer for playbook and tc variables with a bounded cache of parsed values.
+
+    The tokenizer is shared by every Playbooks instance in the process, so the cache is bounded
+    by the total length of the cached values as well as the number of values. Only short values
+    (e.g., variable names and templates with embedded variables) are cached.
+
+    Args:
+        cache_size: The maximum number of templates and variables to cache.
+        max_cached_length: Values longer than this are parsed on each call instead of cached.
+        max_total_length: The maximum total length of the cached templates and variables.
+    """
+
+    def __init__(
+        self,
+        cache_size: Optional[int] = 1024,
+        max_cached_length: Optional[int] = 4096,
+        max_total_length: Optional[int] = 1048576,
+    ):
+        """Initialize Class properties."""
+        self.cache_size = cache_size
+        self.max_cached_length = max_cached_length
+        self.max_total_length = max_total_length
+
+        # properties
+        self._lock = threading.Lock()
+        self._templates = OrderedDict()
+        self._total_length = 0
+        self._variables = OrderedDict()
+
+    def _cached(self, cache: OrderedDict, key: str, parse: Callable):
+        """Return the cached result of parse(key), parsing and caching it on a miss."""
+        if len(key) > self.max_cached_length:
+            return parse(key)
+
+        with self._lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+        result = parse(key)
+        with self._lock:
+            if key not in cache:
+                self._total_length += len(key)
+            cache[key] = result
+            cache.move_to_end(key)
+
+            while len(cache) > self.cache_size:
+                evicted, _ = cache.popitem(last=False)
+                self._total_length -= len(evicted)
+
+            # remove the least recently used values of either cache, keeping the new value
+            other = self._variables if cache is self._templates else self._templates
+            while self._total_length > self.max_total_length:
+                lru = cache if len(cache) > 1 else other
+                if not lru:
+                    break
+                evicted, _ = lru.popitem(last=False)
+                self._total_length -= len(evicted)
+        return result
+
+    @staticmethod
+    def _parse_template(value: str) -> VariableTemplate:
+        """Return the value parsed into literal and variable segments."""
+        segments = []
+        position = 0
+        for match in variable_expansion_quoted.finditer(value):
+            if match.start() > position:
+                segments.append(value[position : match.start()])
+            segments.append(
+                VariableToken(
+                    text=match.group(0),
+                    variable=match.group('variable'),
+                    origin=match.group('origin'),
+                    provider=match.group('provider'),
+                    id=match.group('id'),
+                    lookup=match.group('lookup'),
+                    type=match.group('type'),
+                    quoted=match.group('quote') is not None,
+                )
+            )
+            position = match.end()
+        if position < len(value):
+            segments.append(value[position:])
+        return VariableTemplate(segments)
+
+    @staticmethod
+    def _parse_variable(variable: str) -> Optional[dict]:
+        """Return the parts of a playbook variable or None if the value is not a variable."""
+        match = variable_match.match(variable)
+        if match is None:
+            return None
+        return {
+            'root': match.group(0),
+            'job_id': match.group(2),
+            'name': match.group(3),
+            'type': match.group(4),
+        }
+
+    @staticmethod
+    def expand(value: str) -> str:
+        """Return the value with backslash escapes processed the same as a re.sub() replacement.
+
+        Args:
+            value: The replacement value.
+        """
+        if '\\' not in value:
+            return value
+        return _empty_match.expand(value)
+
+    def template(self, value: str) -> VariableTemplate:
+        """Return the value parsed into literal and variable segments.
+
+        Args:
+            value: The value that may contain embedded variables.
+        """
+        return self._cached(self._templates, value, self._parse_template)
+
+    def variable(self, variable: str) -> Optional[dict]:
+        """Return the parts (root, job_id, name, type) of a playbook variable or None.
+
+        The returned dict is shared, so callers must copy it before modifying it.
+
+        Args:
+            variable: The stripped value that may be a playbook variable.
+        """
+        return self._cached(self._variables, variable, self._parse_variable)
+
+    def wrap_embedded_keyvalue(self, data: str) -> str:
+        """Wrap unquoted variables embedded as KeyValue values in double quotes.
+
+        Args:
+            data: The data with embedded variables.
+        """
+        if '#' not in data:
+            return data
+        return vars_keyvalue_embedded.sub(lambda m: f'": "{m.group("variable")}"', data)
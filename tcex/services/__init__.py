@@ -1,6 +1,8 @@
 """Service module for TcEx Framework"""
 # flake8: noqa
 from .api_service import ApiService
+from .command_dispatcher import CommandDispatcher
 from .common_service_trigger import CommonServiceTrigger
+from .config_index import ConfigIndex
 from .mqtt_message_broker import MqttMessageBroker
 from .webhook_trigger_service import WebhookTriggerService
@@ -1,18 +1,45 @@
 """TcEx Framework API Service module."""
 # standard library
+import asyncio
 import json
 import sys
 import threading
 import traceback
-from functools import reduce
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http import HTTPStatus
 from io import BytesIO
-from typing import Any
+from typing import Any, Callable, Iterable, Optional, Union
 
+try:
+    # standard library
+    from contextvars import copy_context
+except ImportError:  # pragma: no cover
+    # Python 3.6, the ASGI mode is not supported
+    copy_context = None
+
+from ..tokens.tokens import token_key
 from .common_service import CommonService
 
 
 class ApiService(CommonService):
-    """TcEx Framework API Service module."""
+    """TcEx Framework API Service module.
+
+    RunService commands are handled by the WSGI api_event_callback on a worker thread, or, when
+    asgi_app is set, by the ASGI application on a single event loop thread. In ASGI mode the
+    request body is read and the response body is written with the KV store on a small pool of
+    worker threads, so concurrent requests do not each hold a thread. The ASGI mode requires
+    Python 3.7 or later.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        # e.g., a Starlette or FastAPI application
+        tcex.service.asgi_app = app
+        tcex.service.listen()
+        tcex.service.ready = True
+    """
 
     def __init__(self, tcex: object):
         """Initialize the Class properties.
@@ -27,6 +54,132 @@ class ApiService(CommonService):
 
         # config callbacks
         self.api_event_callback = None
+        self.asgi_app = None
+
+        # asgi properties
+        self.asgi_kv_workers = 10
+        self._asgi_executor = None
+        self._asgi_loop = None
+        self._asgi_lock = threading.Lock()
+
+    @property
+    def asgi_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the event loop running the ASGI application, starting it on first use."""
+        if self._asgi_loop is None:
+            with self._asgi_lock:
+                if self._asgi_loop is None:
+                    loop = asyncio.new_event_loop()
+                    self._asgi_executor = ThreadPoolExecutor(
+                        max_workers=self.asgi_kv_workers, thread_name_prefix='asgi-kv'
+                    )
+
+                    def run_loop():
+                        asyncio.set_event_loop(loop)
+                        loop.run_forever()
+
+                    self.service_thread(name='asgi-event-loop', target=run_loop)
+                    self._asgi_loop = loop
+        return self._asgi_loop
+
+    async def _asgi_kv(self, method: Callable, *args, **kwargs) -> Any:
+        """Run a blocking KV store method on the ASGI worker pool in the current context."""
+        context = copy_context()
+        return await self.asgi_loop.run_in_executor(
+            self._asgi_executor, partial(context.run, method, *args, **kwargs)
+        )
+
+    async def _process_run_service_command_asgi(self, message: dict) -> None:
+        """Handle the RunService command with the ASGI application.
+
+        Args:
+            message: The message payload from the server topic.
+        """
+        self.log.info(f'feature=api-service, event=runservice-command, message="{message}"')
+
+        request_key: str = message.get('requestKey')
+        body = b''
+        try:
+            # read body from redis
+            body_variable: str = message.pop('bodyVariable', None)
+            if body_variable is not None:
+                body = (
+                    await self._asgi_kv(
+                        self.key_value_store.read, request_key, body_variable, decode=False
+                    )
+                    or b''
+                )
+        except Exception as e:
+            self.log.error(f'feature=api-service, event=failed-reading-body, error="""{e}"""')
+            self.log.trace(traceback.format_exc())
+
+        try:
+            headers: dict = self.format_request_headers(message.pop('headers'))
+            path: str = message.pop('path')
+            scope = {
+                'type': 'http',
+                'asgi': {'version': '3.0', 'spec_version': '2.3'},
+                'client': (message.get('remoteAddress', ''), 0),
+                'headers': [
+                    (k.encode('latin-1'), str(v).encode('latin-1')) for k, v in headers.items()
+                ],
+                'http_version': '1.1',
+                'method': message.pop('method').upper(),
+                'path': path,
+                'query_string': self.format_query_string(message.pop('queryParams')).encode(),
+                'raw_path': path.encode(),
+                'root_path': '',
+                'scheme': 'https',
+                'server': None,
+                # Add user config for TAXII or other service that supports the data type
+                'user_config': message.get('userConfig', []),
+            }
+
+            # make values from message available in the scope in snake case
+            for key, value in message.items():
+                if key not in scope and self.tcex.utils.camel_to_snake(key) not in scope:
+                    scope[self.tcex.utils.camel_to_snake(key)] = value
+
+            self.increment_metric('Requests')
+        except Exception as e:
+            self.log.error(f'feature=api-service, event=failed-building-scope, error="""{e}"""')
+            self.log.trace(traceback.format_exc())
+            self.increment_metric('Errors')
+            return  # stop processing
+
+        request_sent = False
+        response_complete = asyncio.Event()
+        response = {'body': bytearray(), 'headers': [], 'status': 500}
+
+        async def receive() -> dict:
+            """Return the request body, then wait for the response to complete."""
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {'type': 'http.request', 'body': body, 'more_body': False}
+            await response_complete.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(event: dict) -> None:
+            """Collect the response and write it when the last body event is sent."""
+            if event.get('type') == 'http.response.start':
+                response['status'] = event.get('status')
+                response['headers'] = [
+                    (k.decode('latin-1'), v.decode('latin-1')) for k, v in event.get('headers', [])
+                ]
+            elif event.get('type') == 'http.response.body' and not response_complete.is_set():
+                response['body'] += event.get('body', b'')
+                if not event.get('more_body', False):
+                    response_complete.set()
+                    await self.process_run_service_response_asgi(request_key, response)
+
+        try:
+            await self.asgi_app(scope, receive, send)  # pylint: disable=not-callable
+        except Exception as e:
+            self.log.error(f'feature=api-service, event=asgi-app-failed, error="""{e}""".')
+            self.log.trace(traceback.format_exc())
+            self.increment_metric('Errors')
+        finally:
+            response_complete.set()
 
     @property
     def command_map(self) -> dict:
@@ -79,6 +232,45 @@ class ApiService(CommonService):
             self.log.trace(traceback.format_exc())
         return headers_
 
+    @staticmethod
+    def format_response_body(body_data: Iterable) -> Optional[Union[bytes, memoryview]]:
+        """Return the response body assembled from the WSGI response iterable.
+
+        Chunks are appended to a single buffer as they are produced, so the body is assembled
+        in linear time and each chunk can be released once it is copied. A single chunk body
+        (e.g., falcon) is returned without a copy.
+
+        Args:
+            body_data: The WSGI response iterable of bytes (or str) chunks.
+
+        Returns:
+            bytes|memoryview: The response body or None if the body is empty.
+        """
+        body = None
+        buffer = None
+        try:
+            for chunk in body_data:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
+                if not chunk:
+                    continue
+
+                if body is None:
+                    body = chunk
+                    continue
+                if buffer is None:
+                    buffer = bytearray(body)
+                buffer += chunk
+        finally:
+            # the WSGI spec requires calling close() on the iterable if supported
+            if callable(getattr(body_data, 'close', None)):
+                body_data.close()
+
+        if buffer is not None:
+            # hand the buffer to the KV store without copying it to a bytes object
+            return memoryview(buffer)
+        return body
+
     def format_response_headers(self, headers: dict) -> dict:
         """Convert name/value array to a query string.
 
@@ -153,6 +345,13 @@ class ApiService(CommonService):
         Args:
             message: The message payload from the server topic.
         """
+        if self.asgi_app is not None:
+            # the request is handled on the event loop, releasing the current thread
+            asyncio.run_coroutine_threadsafe(
+                self.process_run_service_command_asgi(message), self.asgi_loop
+            )
+            return
+
         # register config apiToken (before any logging)
         self.token.register_token(
             self.thread_name, message.get('apiToken'), message.get('expireSeconds')
@@ -171,7 +370,8 @@ class ApiService(CommonService):
             if body_variable is not None:
                 body: Any = self.key_value_store.read(request_key, body_variable, decode=False)
                 if body is not None:
-                    # for API service the data in Redis is not b64 encoded
+                    # for API service the data in Redis is not b64 encoded. BytesIO shares the
+                    # buffer of the bytes value, so the body is not copied.
                     body = BytesIO(body)
         except Exception as e:
             self.log.error(f'feature=api-service, event=failed-reading-body, error="""{e}"""')
@@ -246,7 +446,7 @@ class ApiService(CommonService):
                     environ, response_handler
                 )
                 if body_data:
-                    body_data = reduce(lambda a, b: a + b, body_data)
+                    body_data = self.format_response_body(body_data)
 
                 # write body to Redis
                 if body_data:
@@ -266,3 +466,78 @@ class ApiService(CommonService):
 
         # unregister config apiToken
         self.token.unregister_token(self.thread_name)
+
+    async def process_run_service_command_asgi(self, message: dict) -> None:
+        """Process the RunService command with the ASGI application.
+
+        The ASGI (3.0) http scope is built from the message the same as the WSGI environ. The
+        apiToken and other message values are available in the scope in snake case (e.g.,
+        scope['api_token'], scope['request_key'], and scope['user_config']). Lifespan events
+        are not sent.
+
+        The apiToken is registered for the request, so tcex.session requests made by the ASGI
+        application while the request is handled use the token of the request.
+
+        Args:
+            message: The message payload from the server topic.
+        """
+        request_key: str = message.get('requestKey')
+
+        # register config apiToken (before any logging)
+        self.token.register_token(
+            request_key, message.get('apiToken'), message.get('expireSeconds')
+        )
+        context = token_key.set(request_key)
+        try:
+            await self._process_run_service_command_asgi(message)
+        finally:
+            token_key.reset(context)
+
+            # unregister config apiToken
+            self.token.unregister_token(request_key)
+
+    async def process_run_service_response_asgi(self, request_key: str, response: dict) -> None:
+        """Write the ASGI response body and send the response.
+
+        Args:
+            request_key: The request key of the RunService command.
+            response: The response status, headers, and body.
+        """
+        try:
+            if response.get('body'):
+                # hand the buffer to the KV store without copying it to a bytes object
+                await self._asgi_kv(
+                    self.key_value_store.create,
+                    request_key,
+                    'response.body',
+                    memoryview(response.get('body')),
+                )
+                self.log.info('feature=api-service, event=response-body-written')
+
+            status_code = response.get('status')
+            try:
+                status = HTTPStatus(status_code).phrase
+            except ValueError:
+                status = ''
+            self.message_broker.publish(
+                json.dumps(
+                    {
+                        'bodyVariable': 'response.body',
+                        'command': 'Acknowledged',
+                        'headers': self.format_response_headers(response.get('headers')),
+                        'requestKey': request_key,
+                        'status': status,
+                        'statusCode': str(status_code),
+                        'type': 'RunService',
+                    }
+                ),
+                self.args.tc_svc_client_topic,
+            )
+            self.log.info('feature=api-service, event=response-sent')
+            self.increment_metric('Responses')
+        except Exception as e:
+            self.log.error(
+                f'feature=api-service, event=failed-creating-response-body, error="""{e}"""'
+            )
+            self.log.trace(traceback.format_exc())
+            self.increment_metric('Errors')
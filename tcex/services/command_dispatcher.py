@@ -0,0 +1,175 @@
+"""TcEx Framework Service Command Dispatcher module"""
+# standard library
+import queue
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Callable, Optional
+
+
+class CommandDispatcher:
+    """Bounded worker pool for service commands.
+
+    Commands are queued on a bounded queue and run by a fixed number of worker threads. While a
+    command runs, the worker thread has the name, session_id, and trigger_id a dedicated service
+    thread would have, so per session logging and token handling are unchanged.
+
+    When the queue is full the overflow policy is applied:
+
+    * block - wait for space in the queue (this blocks the MQTT network thread)
+    * drop_oldest - discard the oldest queued command to make room for the new command
+    * reject - discard the new command
+
+    Args:
+        logger: A logger instance.
+        max_queue_size: The maximum number of queued commands.
+        max_workers: The number of worker threads.
+        overflow: The overflow policy (block, drop_oldest, or reject).
+    """
+
+    overflow_policies = ['block', 'drop_oldest', 'reject']
+
+    def __init__(
+        self,
+        logger: object,
+        max_queue_size: Optional[int] = 1000,
+        max_workers: Optional[int] = 20,
+        overflow: Optional[str] = 'reject',
+    ):
+        """Initialize the Class properties."""
+        if overflow not in self.overflow_policies:
+            raise RuntimeError(
+                f'Invalid overflow policy ({overflow}), valid values are {self.overflow_policies}.'
+            )
+
+        self.log = logger
+        self.max_queue_size = max_queue_size
+        self.max_workers = max_workers
+        self.overflow = overflow
+
+        # properties
+        self._lock = threading.Lock()
+        self._overflows = 0
+        self._queue = None
+        # the wait times of the most recently started commands
+        self._wait_times = deque(maxlen=100)
+        self._workers = []
+
+    def _start_workers(self) -> None:
+        """Create the queue and start the worker threads on first use."""
+        with self._lock:
+            if self._queue is None:
+                self._queue = queue.Queue(maxsize=self.max_queue_size)
+            while len(self._workers) < self.max_workers:
+                t = threading.Thread(
+                    name=f'command-worker-{len(self._workers)}', target=self._worker, daemon=True
+                )
+                t.start()
+                self._workers.append(t)
+
+    def _worker(self) -> None:
+        """Run queued commands."""
+        thread = threading.current_thread()
+        worker_name = thread.name
+        while True:
+            queued, name, target, args, kwargs, session_id, trigger_id = self._queue.get()
+            self._wait_times.append(time.monotonic() - queued)
+
+            # run the command as if it was on a dedicated thread
+            thread.name = name
+            thread.session_id = session_id
+            thread.trigger_id = trigger_id
+            try:
+                target(*args, **kwargs)
+            except Exception as e:
+                self.log.error(f'feature=service, event=command-error, name={name}, error={e}')
+                self.log.trace(traceback.format_exc())
+            finally:
+                thread.name = worker_name
+                thread.session_id = None
+                thread.trigger_id = None
+                self._queue.task_done()
+
+    @property
+    def metrics(self) -> dict:
+        """Return the dispatcher metrics reported in the heartbeat message."""
+        return {
+            'Queue Depth': self.queue_depth,
+            'Queue Overflows': self.overflows,
+            'Queue Wait Time (ms)': round(self.wait_time * 1000),
+        }
+
+    @property
+    def overflows(self) -> int:
+        """Return the number of commands dropped or rejected because the queue was full."""
+        return self._overflows
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of queued commands."""
+        return 0 if self._queue is None else self._queue.qsize()
+
+    def submit(
+        self,
+        name: str,
+        target: Callable[[], bool],
+        args: Optional[tuple] = None,
+        kwargs: Optional[dict] = None,
+        session_id: Optional[str] = None,
+        trigger_id: Optional[int] = None,
+    ) -> bool:
+        """Queue a command to run on a worker thread.
+
+        Args:
+            name: The thread name while the command runs.
+            target: The method to call for the command.
+            args: The args to pass to the target method.
+            kwargs: Additional args.
+            session_id: The current session id.
+            trigger_id: The current trigger id.
+
+        Returns:
+            bool: False if the command was rejected because the queue was full.
+        """
+        if len(self._workers) < self.max_workers:
+            self._start_workers()
+
+        item = (time.monotonic(), name, target, args or (), kwargs or {}, session_id, trigger_id)
+        if self.overflow == 'block':
+            self._queue.put(item)
+            return True
+
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return True
+            except queue.Full:
+                with self._lock:
+                    self._overflows += 1
+
+            if self.overflow == 'reject':
+                self.log.warning(
+                    f'feature=service, event=command-rejected, name={name}, '
+                    f'queue-depth={self.queue_depth}'
+                )
+                return False
+
+            # drop_oldest
+            try:
+                dropped = self._queue.get_nowait()
+                self._queue.task_done()
+                self.log.warning(
+                    f'feature=service, event=command-dropped, name={dropped[1]}, '
+                    f'queue-depth={self.queue_depth}'
+                )
+            except queue.Empty:  # pragma: no cover
+                pass
+
+    @property
+    def wait_time(self) -> float:
+        """Return the average queue wait time in seconds of the most recently started commands."""
+        wait_times = list(self._wait_times)
+        if not wait_times:
+            return 0.0
+        return sum(wait_times) / len(wait_times)
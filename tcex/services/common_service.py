@@ -8,6 +8,7 @@ import uuid
 from datetime import datetime
 from typing import Callable, Optional, Union
 
+from .command_dispatcher import CommandDispatcher
 from .mqtt_message_broker import MqttMessageBroker
 
 
@@ -33,6 +34,8 @@ class CommonService:
         self._start_time = datetime.now()
         self.args: object = tcex.default_args
         self.configs = {}
+        # commands other than the priority commands run on the bounded worker pool
+        self.dispatcher = CommandDispatcher(logger=tcex.log)
         self.heartbeat_max_misses = 3
         self.heartbeat_sleep_time = 1
         self.heartbeat_watchdog = 0
@@ -48,6 +51,16 @@ class CommonService:
             broker_cacert=self.args.tc_svc_broker_cacert_file,
             logger=tcex.log,
         )
+        # control commands always run on a dedicated thread so they never queue behind work
+        self.priority_commands = [
+            'acknowledged',
+            'brokercheck',
+            'createconfig',
+            'deleteconfig',
+            'heartbeat',
+            'loggingchange',
+            'shutdown',
+        ]
         self.ready = False
         self.redis_client = self.tcex.redis_client
         self.token = tcex.token
@@ -194,6 +207,7 @@ class CommonService:
         # TODO: move to trigger command and handle API Service
         if self._metrics.get('Active Playbooks') is not None:
             self.update_metric('Active Playbooks', len(self.configs))
+        self._metrics.update(self.dispatcher.metrics)
         return self._metrics
 
     @metrics.setter
@@ -241,14 +255,23 @@ class CommonService:
 
         # get the target method from command_map for the current command
         thread_method = self.command_map.get(command, self.process_invalid_command)
-        self.service_thread(
-            # use session_id as thread name to provide easy debugging per thread
-            name=session_id,
-            target=thread_method,
-            args=(m,),
-            session_id=session_id,
-            trigger_id=trigger_id,
-        )
+        if command in self.priority_commands:
+            self.service_thread(
+                # use session_id as thread name to provide easy debugging per thread
+                name=session_id,
+                target=thread_method,
+                args=(m,),
+                session_id=session_id,
+                trigger_id=trigger_id,
+            )
+        else:
+            self.dispatcher.submit(
+                name=session_id,
+                target=thread_method,
+                args=(m,),
+                session_id=session_id,
+                trigger_id=trigger_id,
+            )
 
     def process_broker_check(self, message: dict) -> None:
         """Implement parent method to log a broker check message.
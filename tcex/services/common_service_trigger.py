@@ -6,7 +6,9 @@ import threading
 import traceback
 from typing import Callable, Optional, Union
 
+from .command_dispatcher import CommandDispatcher
 from .common_service import CommonService
+from .config_index import ConfigIndex
 
 
 class CommonServiceTrigger(CommonService):
@@ -27,8 +29,14 @@ class CommonServiceTrigger(CommonService):
 
         # properties
         self._metrics = {'Active Playbooks': 0, 'Errors': 0, 'Hits': 0, 'Misses': 0}
+        self._config_index = None
+        self._fire_event_lock = threading.Lock()
+        self._fire_event_messages = []
+        self._fire_event_publishing = False
         self.configs = {}
         self.config_thread = None
+        # fire_event() evaluates the configs on a bounded pool, blocking when the queue is full
+        self.fire_event_dispatcher = CommandDispatcher(logger=tcex.log, overflow='block')
 
         # config callbacks
         self.create_config_callback = None
@@ -82,6 +90,20 @@ class CommonServiceTrigger(CommonService):
         )
         return command_map
 
+    @property
+    def config_index(self) -> Optional[ConfigIndex]:
+        """Return the index used by fire_event() to only evaluate matching configs."""
+        return self._config_index
+
+    @config_index.setter
+    def config_index(self, config_index: Optional[ConfigIndex]):
+        """Set the config index, adding any existing configs."""
+        if config_index is not None:
+            config_index.clear()
+            for trigger_id, config in list(self.configs.items()):
+                config_index.add(trigger_id, config)
+        self._config_index = config_index
+
     def create_config(self, trigger_id: int, message: str, status: bool) -> None:
         """Add config item to service config object.
 
@@ -92,9 +114,11 @@ class CommonServiceTrigger(CommonService):
             logfile: The CreateConfig logfile to return in response ack.
         """
         try:
-            if status is not True and self.configs.get(str(trigger_id)) is not None:
-                # add config to configs
-                del self.configs[str(trigger_id)]
+            if status is not True:
+                # remove the config temporarily added in process_create_config_command
+                self.configs.pop(trigger_id, None)
+                if self.config_index is not None:
+                    self.config_index.remove(trigger_id)
 
             # send ack response
             self.message_broker.publish(
@@ -131,6 +155,8 @@ class CommonServiceTrigger(CommonService):
         try:
             # always delete config from configs dict, even when status is False
             del self.configs[trigger_id]
+            if self.config_index is not None:
+                self.config_index.remove(trigger_id)
 
             # send ack response
             self.message_broker.publish(
@@ -155,17 +181,35 @@ class CommonServiceTrigger(CommonService):
     def fire_event(self, callback: Callable[[], bool], **kwargs) -> None:
         """Trigger a FireEvent command.
 
+        The callback is called for each matching config on the fire_event_dispatcher worker
+        pool. When a config_index is set and an index_key is provided, only the configs
+        matching the index key are evaluated.
+
         Args:
             callback: The trigger method in the App to call.
             trigger_ids: A list of trigger ids to trigger.
+            index_key: The config_index key (or list of keys) of the event.
         """
         if not callable(callback):
             raise RuntimeError('Callback method (callback) is not a callable.')
 
         # get developer passed trigger_ids
         trigger_ids: Optional[list] = kwargs.pop('trigger_ids', None)
-
-        for trigger_id, config in list(self.configs.items()):
+        if trigger_ids is not None:
+            trigger_ids = set(trigger_ids)
+
+        # get the configs matching the developer passed index_key
+        index_key = kwargs.pop('index_key', None)
+        if index_key is not None and self.config_index is not None:
+            configs = []
+            for trigger_id in self.config_index.match(index_key):
+                config = self.configs.get(trigger_id)
+                if config is not None:
+                    configs.append((trigger_id, config))
+        else:
+            configs = list(self.configs.items())
+
+        for trigger_id, config in configs:
             if trigger_ids is not None and trigger_id not in trigger_ids:
                 # skip config that don't match developer provided trigger ids
                 continue
@@ -186,8 +230,8 @@ class CommonServiceTrigger(CommonService):
 
                 self.log.info(f'feature=trigger-service, event=fire-event, trigger-id={session_id}')
 
-                # current thread has session_id as name
-                self.service_thread(
+                # the worker thread has session_id as name while the callback runs
+                self.fire_event_dispatcher.submit(
                     name=session_id,
                     target=self.fire_event_trigger,
                     args=(callback, playbook, session_id, trigger_id, config,),
@@ -203,6 +247,11 @@ class CommonServiceTrigger(CommonService):
     ) -> None:
         """Send FireEvent command.
 
+        Each FireEvent is a separate MQTT message. Messages sent while another thread is
+        publishing are published by that thread in the same batch, so threads firing events
+        do not wait on each other. A message that fails to publish is logged and counted as an
+        error, and the remaining messages are still published.
+
         Args:
             trigger_id: The ID of the trigger.
             session_id: The generated session for this fired event.
@@ -217,8 +266,32 @@ class CommonServiceTrigger(CommonService):
             msg['requestKey'] = request_key  # reference for a specific playbook execution
         self.log.info(f'feature=service, event=fire-event, msg={msg}')
 
-        # publish FireEvent command to client topic
-        self.message_broker.publish(json.dumps(msg), self.args.tc_svc_client_topic)
+        with self._fire_event_lock:
+            self._fire_event_messages.append(json.dumps(msg))
+            if self._fire_event_publishing:
+                # the thread currently publishing will send the message
+                return
+            self._fire_event_publishing = True
+
+        # publish FireEvent commands to client topic until no messages are pending
+        while True:
+            with self._fire_event_lock:
+                messages, self._fire_event_messages = self._fire_event_messages, []
+                if not messages:
+                    self._fire_event_publishing = False
+                    return
+
+            # a failed publish is logged so the remaining messages in the batch are still sent
+            for message in messages:
+                try:
+                    self.message_broker.publish(message, self.args.tc_svc_client_topic)
+                except Exception as e:
+                    self.increment_metric('Errors')
+                    self.log.error(
+                        f'feature=service, event=fire-event-publish-failed, msg={message}, '
+                        f'error="""{e}"""'
+                    )
+                    self.log.trace(traceback.format_exc())
 
     def fire_event_trigger(
         self,
@@ -283,6 +356,19 @@ class CommonServiceTrigger(CommonService):
             f'feature=service, event=create-config, trigger_id={trigger_id}, config={logged_config}'
         )
 
+    @property
+    def metrics(self) -> dict:
+        """Return current metrics, including the fire_event_dispatcher metrics."""
+        metrics = super().metrics
+        for label, value in self.fire_event_dispatcher.metrics.items():
+            metrics[f'Fire Event {label}'] = value
+        return metrics
+
+    @metrics.setter
+    def metrics(self, metrics: dict):
+        """Set the current metrics."""
+        CommonService.metrics.fset(self, metrics)
+
     def process_create_config_command(self, message: dict) -> None:
         """Process the CreateConfig command.
 
@@ -331,6 +417,8 @@ class CommonServiceTrigger(CommonService):
 
         # temporarily add config, will be removed if callback fails
         self.configs[trigger_id] = config
+        if self.config_index is not None:
+            self.config_index.add(trigger_id, config)
 
         msg = 'Create Config'
         if callable(self.create_config_callback):
@@ -0,0 +1,101 @@
+"""TcEx Framework Service Trigger Config Index module"""
+# standard library
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Set, Union
+
+
+class ConfigIndex:
+    """Index of trigger configs by the key(s) derived from each config.
+
+    When a config index is set on a trigger service, fire_event() only evaluates the configs
+    matching the index_key of the event. Configs without a key (e.g., no indicator type was
+    selected) match every event.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        # index configs by the indicator types selected in the trigger config
+        self.tcex.service.config_index = ConfigIndex('indicator_types')
+
+        # only configs with "Address" (or without indicator types) are evaluated
+        self.tcex.service.fire_event(self.trigger_callback, index_key='Address', data=data)
+
+    Args:
+        key: The config field name or a callable that returns the key or list of keys for a
+            config.
+    """
+
+    def __init__(self, key: Union[str, Callable[[dict], Any]]):
+        """Initialize the Class properties."""
+        self.key = key
+
+        # properties
+        self._index: Dict[Hashable, Set[int]] = {}
+        self._keys: Dict[int, List[Hashable]] = {}
+        self._lock = threading.Lock()
+        self._wildcard: Set[int] = set()
+
+    def _config_keys(self, config: dict) -> List[Hashable]:
+        """Return the keys for a config (an empty list matches every event)."""
+        keys = self.key(config) if callable(self.key) else config.get(self.key)
+        if keys is None or keys == '':
+            return []
+        if isinstance(keys, (list, set, tuple)):
+            return [k for k in keys if k is not None and k != '']
+        return [keys]
+
+    def _remove(self, trigger_id: int) -> None:
+        """Remove the config for a trigger (the lock must be held)."""
+        self._wildcard.discard(trigger_id)
+        for key in self._keys.pop(trigger_id, []):
+            trigger_ids = self._index.get(key)
+            if trigger_ids is not None:
+                trigger_ids.discard(trigger_id)
+                if not trigger_ids:
+                    del self._index[key]
+
+    def add(self, trigger_id: int, config: dict) -> None:
+        """Add or replace the config for a trigger.
+
+        Args:
+            trigger_id: The trigger ID for the config.
+            config: The trigger config.
+        """
+        keys = self._config_keys(config)
+        with self._lock:
+            self._remove(trigger_id)
+            self._keys[trigger_id] = keys
+            if not keys:
+                self._wildcard.add(trigger_id)
+            for key in keys:
+                self._index.setdefault(key, set()).add(trigger_id)
+
+    def clear(self) -> None:
+        """Remove all configs from the index."""
+        with self._lock:
+            self._index = {}
+            self._keys = {}
+            self._wildcard = set()
+
+    def match(self, key: Union[Hashable, list]) -> Set[int]:
+        """Return the trigger ids of the configs matching the key (or any of a list of keys).
+
+        Args:
+            key: The index key(s) of the event.
+        """
+        keys = key if isinstance(key, (list, set, tuple)) else [key]
+        with self._lock:
+            trigger_ids = set(self._wildcard)
+            for k in keys:
+                trigger_ids.update(self._index.get(k, ()))
+        return trigger_ids
+
+    def remove(self, trigger_id: int) -> None:
+        """Remove the config for a trigger.
+
+        Args:
+            trigger_id: The trigger ID for the config.
+        """
+        with self._lock:
+            self._remove(trigger_id)
@@ -1,4 +1,9 @@
 """Session module for TcEx Framework"""
 # flake8: noqa
+from .adaptive_limiter import AdaptiveLimiter, CircuitOpenError
+from .async_external_session import AsyncExternalSession
 from .external_session import ExternalSession
+from .http_cache import HttpCache
+from .rate_limiter import RateLimiter
+from .replay_adapter import RecordingAdapter, ReplayAdapter, ReplayStore
 from .tc_session import TcSession
@@ -0,0 +1,293 @@
+"""Adaptive (AIMD) per host concurrency limiting with circuit breaking.
+
+The number of requests permitted in flight to a host grows by one for each "limit" number of
+successful requests (additive increase) and is multiplied by the decrease factor on a 429, 5xx,
+or timeout (multiplicative decrease). After a number of consecutive failures the circuit opens
+and requests to the host fail fast. After the reset timeout a single probe request is allowed
+(half-open); if it succeeds the circuit closes and the limit grows again from the minimum.
+"""
+# standard library
+import logging
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+# third-party
+from requests import Response, exceptions
+
+# get tcex logger
+logger = logging.getLogger('tcex')
+
+
+class CircuitOpenError(exceptions.ConnectionError):
+    """Raised when a request is made to a host while its circuit is open."""
+
+
+class HostLimiter:
+    """Concurrency limit and circuit state for a single host.
+
+    Args:
+        host: The host name (used for logging).
+        initial_limit: The starting number of requests permitted in flight.
+        min_limit: The smallest number of requests permitted in flight.
+        max_limit: The largest number of requests permitted in flight.
+        decrease_factor: The factor applied to the limit on a failure.
+        decrease_interval: Seconds between decreases, so a burst of failures from requests
+            that were already in flight only decreases the limit once.
+        failure_threshold: The number of consecutive failures that open the circuit.
+        reset_timeout: Seconds the circuit stays open before a probe request is allowed.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        decrease_factor: float,
+        decrease_interval: float,
+        failure_threshold: int,
+        reset_timeout: float,
+    ):
+        """Initialize Class properties."""
+        self.host = host
+        self.decrease_factor = decrease_factor
+        self.decrease_interval = decrease_interval
+        self.failure_threshold = failure_threshold
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.reset_timeout = reset_timeout
+
+        # properties
+        self._condition = threading.Condition()
+        self._consecutive_failures = 0
+        self._decreased_at = 0.0
+        self._in_flight = 0
+        self._limit = float(initial_limit)
+        self._opened_at = 0.0
+        self._state = 'closed'
+        self.failures = 0
+        self.log = logger
+        self.rejected = 0
+        self.successes = 0
+
+    def __getstate__(self) -> dict:
+        """Return state for pickling (locks can not be pickled)."""
+        state = self.__dict__.copy()
+        del state['_condition']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore state when unpickling."""
+        self.__dict__.update(state)
+        self._condition = threading.Condition()
+        self._in_flight = 0
+
+    def _allowed(self) -> int:
+        """Return the number of requests currently permitted in flight (caller holds lock)."""
+        if self._state == 'open' and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = 'half-open'
+            self.log.info(f'feature=adaptive-limiter, host={self.host}, circuit=half-open')
+
+        if self._state == 'half-open':
+            return 1
+        return int(self._limit)
+
+    def acquire(self, timeout: Optional[float] = None) -> None:
+        """Wait for a free slot.
+
+        Args:
+            timeout: The maximum number of seconds to wait for a slot.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or no slot is free within the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                allowed = self._allowed()
+                if self._state == 'open':
+                    self.rejected += 1
+                    raise CircuitOpenError(f'The circuit for host {self.host} is open.')
+
+                if self._in_flight < allowed:
+                    self._in_flight += 1
+                    return
+
+                # wake up periodically so an open circuit transitions to half-open
+                wait = self.reset_timeout
+                if deadline is not None:
+                    wait = min(wait, deadline - time.monotonic())
+                    if wait <= 0:
+                        self.rejected += 1
+                        raise CircuitOpenError(
+                            f'No request slot for host {self.host} within {timeout} seconds.'
+                        )
+                self._condition.wait(wait)
+
+    def release(self, failed: bool) -> None:
+        """Release a slot and update the limit and circuit state.
+
+        Args:
+            failed: True if the request failed (429, 5xx, or timeout).
+        """
+        message = None
+        with self._condition:
+            self._in_flight -= 1
+            now = time.monotonic()
+            if failed:
+                self.failures += 1
+                self._consecutive_failures += 1
+                if now - self._decreased_at >= self.decrease_interval:
+                    self._decreased_at = now
+                    self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+
+                if self._state == 'half-open' or (
+                    self._state == 'closed' and self._consecutive_failures >= self.failure_threshold
+                ):
+                    self._opened_at = now
+                    self._state = 'open'
+                    message = (
+                        f'feature=adaptive-limiter, host={self.host}, circuit=open, '
+                        f'consecutive-failures={self._consecutive_failures}'
+                    )
+            else:
+                self.successes += 1
+                self._consecutive_failures = 0
+                if self._state == 'half-open':
+                    self._limit = float(self.min_limit)
+                    self._state = 'closed'
+                    message = f'feature=adaptive-limiter, host={self.host}, circuit=closed'
+                else:
+                    self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+        # log circuit changes outside of the lock
+        if message is not None:
+            self.log.info(message)
+
+    @property
+    def stats(self) -> dict:
+        """Return the current limit and circuit state."""
+        with self._condition:
+            return {
+                'circuit': self._state,
+                'consecutive_failures': self._consecutive_failures,
+                'failures': self.failures,
+                'in_flight': self._in_flight,
+                'limit': self._allowed(),
+                'rejected': self.rejected,
+                'successes': self.successes,
+            }
+
+
+class AdaptiveLimiter:
+    """Per host AIMD concurrency limiter and circuit breaker.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        tcex.session_external.concurrency_limiter = AdaptiveLimiter(max_limit=16)
+        ...
+        # e.g., {'api.example.com': {'circuit': 'closed', 'limit': 12, 'in_flight': 4, ...}}
+        tcex.log.info(tcex.session_external.concurrency_limiter.stats)
+
+    Args:
+        initial_limit: The starting number of requests permitted in flight per host.
+        min_limit: The smallest number of requests permitted in flight per host.
+        max_limit: The largest number of requests permitted in flight per host.
+        decrease_factor: The factor applied to the limit on a failure.
+        decrease_interval: Minimum seconds between decreases of the limit.
+        failure_threshold: The number of consecutive failures that open the circuit.
+        reset_timeout: Seconds the circuit stays open before a probe request is allowed.
+        acquire_timeout: The maximum number of seconds to wait for a request slot. Defaults
+            to waiting until a slot is free.
+        failure_status_codes: The status codes treated as failures. Defaults to 429 and 5xx.
+    """
+
+    def __init__(
+        self,
+        initial_limit: Optional[int] = 4,
+        min_limit: Optional[int] = 1,
+        max_limit: Optional[int] = 32,
+        decrease_factor: Optional[float] = 0.5,
+        decrease_interval: Optional[float] = 1.0,
+        failure_threshold: Optional[int] = 10,
+        reset_timeout: Optional[float] = 30.0,
+        acquire_timeout: Optional[float] = None,
+        failure_status_codes: Optional[list] = None,
+    ):
+        """Initialize Class properties."""
+        self.acquire_timeout = acquire_timeout
+        self.failure_status_codes = set(
+            failure_status_codes or [429] + list(range(500, 600))
+        )
+        self.host_config = {
+            'decrease_factor': decrease_factor,
+            'decrease_interval': decrease_interval,
+            'failure_threshold': failure_threshold,
+            'initial_limit': initial_limit,
+            'max_limit': max_limit,
+            'min_limit': min_limit,
+            'reset_timeout': reset_timeout,
+        }
+
+        # properties
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """Return state for pickling (locks can not be pickled)."""
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore state when unpickling."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> HostLimiter:
+        """Wait for a request slot for the host of the URL.
+
+        Args:
+            url: The request URL.
+
+        Returns:
+            HostLimiter: The host limiter which must be released when the request completes.
+        """
+        host_limiter = self.host(urlparse(url).netloc)
+        host_limiter.acquire(self.acquire_timeout)
+        return host_limiter
+
+    def failed(self, response: Optional[Response] = None, error: Optional[Exception] = None):
+        """Return True if the response or error indicates the host is degraded.
+
+        Args:
+            response: The response from the request.
+            error: The exception raised by the request.
+        """
+        if error is not None:
+            return isinstance(error, (exceptions.ConnectionError, exceptions.Timeout))
+        return response is not None and response.status_code in self.failure_status_codes
+
+    def host(self, host: str) -> HostLimiter:
+        """Return the limiter for a host.
+
+        Args:
+            host: The host name (and port).
+        """
+        with self._lock:
+            host_limiter = self._hosts.get(host)
+            if host_limiter is None:
+                host_limiter = self._hosts[host] = HostLimiter(host, **self.host_config)
+            return host_limiter
+
+    @property
+    def stats(self) -> dict:
+        """Return the current limit and circuit state for each host."""
+        with self._lock:
+            hosts = dict(self._hosts)
+        return {host: host_limiter.stats for host, host_limiter in hosts.items()}
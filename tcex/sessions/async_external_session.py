@@ -0,0 +1,270 @@
+"""asyncio Requests Session for external requests"""
+# standard library
+import asyncio
+import logging
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Awaitable, Callable, Iterable, List, Optional
+
+# third-party
+from requests import Response
+
+from .external_session import ExternalSession
+from .rate_limit_handler import RateLimitHandler
+
+
+class AsyncExternalSession:
+    """asyncio counterpart of the ExternalSession.
+
+    Requests are sent by an ExternalSession on a bounded pool of worker threads, so base_url
+    joining, retry, the RateLimitHandler, and curl/mask logging behave exactly as they do for
+    the ExternalSession. 429 responses are handled in the event loop using the
+    too_many_requests_handler, so waiting on a 429 does not hold a worker thread.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        async def collect(pages):
+            async with AsyncExternalSession('https://api.example.com', max_concurrency=5) as s:
+                s.retry(retries=5)
+                kwargs = [{'params': {'page': page}} for page in pages]
+                return [r.json() for r in await s.map('GET', '/v1/indicators', kwargs)]
+
+        data = asyncio.run(collect(range(1, 101)))
+
+    Args:
+        base_url: The base URL for all requests.
+        logger: An instance of Logger.
+        max_concurrency: The maximum number of requests in flight at once.
+        session: An existing ExternalSession to use (e.g., tcex.session_external). A provided
+            session is not closed by close().
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        logger: Optional[object] = None,
+        max_concurrency: Optional[int] = 10,
+        session: Optional[ExternalSession] = None,
+    ):
+        """Initialize the Class properties."""
+        self.max_concurrency = max_concurrency
+        self.session = session or ExternalSession(base_url, logger)
+        self._owns_session = session is None
+        self.log = self.session.log or logging.getLogger('session')
+
+        # properties
+        self._executor = None
+        # asyncio primitives are bound to a loop, so each event loop gets its own semaphore
+        self._semaphores = weakref.WeakKeyDictionary()
+
+        # keep at least one pooled connection per concurrent request
+        if self._owns_session and max_concurrency > 10:
+            self.session.pool_config(pool_connections=10, pool_maxsize=max_concurrency)
+
+    async def __aenter__(self) -> 'AsyncExternalSession':
+        """Enter the async context."""
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        """Close the session on exit of the async context."""
+        # close() waits on the worker threads, so it runs off of the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    @property
+    def base_url(self) -> str:
+        """Return the base url."""
+        return self.session.base_url
+
+    @base_url.setter
+    def base_url(self, url: str):
+        """Set base_url."""
+        self.session.base_url = url
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Return the executor used to send requests."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix='async-external-session'
+            )
+        return self._executor
+
+    @property
+    def headers(self) -> dict:
+        """Return the session headers."""
+        return self.session.headers
+
+    @property
+    def log_curl(self) -> bool:
+        """Return whether or not requests will be logged as a curl command."""
+        return self.session.log_curl
+
+    @log_curl.setter
+    def log_curl(self, log_curl: bool):
+        """Enable or disable logging curl commands."""
+        self.session.log_curl = log_curl
+
+    @property
+    def rate_limit_handler(self) -> RateLimitHandler:
+        """Return the RateLimitHandler."""
+        return self.session.rate_limit_handler
+
+    @rate_limit_handler.setter
+    def rate_limit_handler(self, rate_limit_handler: RateLimitHandler):
+        """Set the RateLimitHandler."""
+        self.session.rate_limit_handler = rate_limit_handler
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore limiting the number of requests in flight on the running loop.
+
+        The worker threads are shared, so requests sent from multiple event loops are also
+        limited to max_concurrency in total by the executor.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    @property
+    def too_many_requests_handler(self) -> Callable[[Response], float]:
+        """Return the handler that determines how long to sleep (in seconds) on a 429."""
+        return self.session.too_many_requests_handler
+
+    @too_many_requests_handler.setter
+    def too_many_requests_handler(self, too_many_requests_handler: Callable[[Response], float]):
+        """Set the handler that determines how long to sleep (in seconds) on a 429."""
+        self.session.too_many_requests_handler = too_many_requests_handler
+
+    def close(self) -> None:
+        """Shutdown the worker threads and close the session."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._owns_session:
+            self.session.close()
+
+    async def gather_limited(
+        self,
+        aws: Iterable[Awaitable],
+        limit: Optional[int] = None,
+        return_exceptions: Optional[bool] = False,
+    ) -> list:
+        """Run awaitables with at most limit running at once, returning results in order.
+
+        Args:
+            aws: The awaitables (e.g., coroutines that fetch and parse a page).
+            limit: The maximum number of awaitables running at once. Defaults to
+                max_concurrency.
+            return_exceptions: If True, exceptions are returned in the results instead of
+                raised.
+        """
+        semaphore = asyncio.Semaphore(limit or self.max_concurrency)
+
+        async def _limited(aw: Awaitable):
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(
+            *[_limited(aw) for aw in aws], return_exceptions=return_exceptions
+        )
+
+    async def map(
+        self,
+        method: str,
+        url: str,
+        requests_kwargs: Iterable[dict],
+        return_exceptions: Optional[bool] = False,
+    ) -> List[Response]:
+        """Send one request per kwargs dict concurrently, returning responses in order.
+
+        Args:
+            method: The HTTP method.
+            url: The URL or path for the requests.
+            requests_kwargs: The kwargs for each request (e.g., [{'params': {'page': 1}}, ...]).
+            return_exceptions: If True, exceptions are returned in the results instead of
+                raised.
+        """
+        return await asyncio.gather(
+            *[self.request(method, url, **kwargs) for kwargs in requests_kwargs],
+            return_exceptions=return_exceptions,
+        )
+
+    def rate_limit_config(
+        self,
+        limit_remaining_header: str = 'X-RateLimit-Remaining',
+        limit_reset_header: str = 'X-RateLimit-Reset',
+        remaining_threshold: int = 0,
+    ):
+        """Configure rate-limiting (see ExternalSession.rate_limit_config)."""
+        self.session.rate_limit_config(
+            limit_remaining_header, limit_reset_header, remaining_threshold
+        )
+
+    async def request(self, method: str, url: str, **kwargs) -> Response:
+        """Send a request without blocking the event loop.
+
+        Args:
+            method: The HTTP method
+            url: The URL or path for the request.
+            **kwargs: Additional args passed to requests (e.g., params, json, headers).
+
+        Returns:
+            Response: The requests Response object.
+        """
+        tc_is_retry = kwargs.pop('tc_is_retry', False)
+
+        # the 429 handling of the ExternalSession is disabled so that the wait happens here
+        send = partial(self.session.request, method, url, tc_is_retry=True, **kwargs)
+        async with self.semaphore:
+            response: Response = await asyncio.get_running_loop().run_in_executor(
+                self.executor, send
+            )
+
+        if response.status_code == 429 and not tc_is_retry:
+            await asyncio.sleep(self.too_many_requests_handler(response))
+            return await self.request(method, url, tc_is_retry=True, **kwargs)
+
+        return response
+
+    def retry(
+        self,
+        retries: Optional[int] = 3,
+        backoff_factor: Optional[float] = 0.3,
+        status_forcelist: Optional[list] = None,
+        **kwargs,
+    ):
+        """Add retry to the session (see ExternalSession.retry)."""
+        self.session.retry(retries, backoff_factor, status_forcelist, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> Response:
+        """Send a DELETE request."""
+        return await self.request('DELETE', url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> Response:
+        """Send a GET request."""
+        return await self.request('GET', url, **kwargs)
+
+    async def head(self, url: str, **kwargs) -> Response:
+        """Send a HEAD request."""
+        return await self.request('HEAD', url, **kwargs)
+
+    async def options(self, url: str, **kwargs) -> Response:
+        """Send an OPTIONS request."""
+        return await self.request('OPTIONS', url, **kwargs)
+
+    async def patch(self, url: str, **kwargs) -> Response:
+        """Send a PATCH request."""
+        return await self.request('PATCH', url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> Response:
+        """Send a POST request."""
+        return await self.request('POST', url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> Response:
+        """Send a PUT request."""
+        return await self.request('PUT', url, **kwargs)
@@ -6,12 +6,16 @@ from typing import Callable, Optional
 
 # third-party
 import urllib3
-from requests import Response, Session, adapters, exceptions
+from requests import Response, Session, exceptions
 from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, DEFAULT_RETRIES
 from urllib3.util.retry import Retry
 
 from ..utils import Utils
+from .adaptive_limiter import AdaptiveLimiter
+from .http_cache import HttpCache
+from .pool_adapter import PoolAdapter, PoolTelemetry
 from .rate_limit_handler import RateLimitHandler
+from .request_metrics import RequestMetrics
 
 # disable ssl warning message
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -44,9 +48,11 @@ def default_too_many_requests_handler(response: Response) -> float:
     return float(seconds)
 
 
-class CustomAdapter(adapters.HTTPAdapter):
+class CustomAdapter(PoolAdapter):
     """Custom Adapter to properly handle retries."""
 
+    __attrs__ = PoolAdapter.__attrs__ + ['concurrency_limiter', 'http_cache']
+
     def __init__(
         self,
         rate_limit_handler: Optional[RateLimitHandler] = None,
@@ -54,6 +60,7 @@ class CustomAdapter(adapters.HTTPAdapter):
         pool_maxsize=DEFAULT_POOLSIZE,
         max_retries=DEFAULT_RETRIES,
         pool_block=DEFAULT_POOLBLOCK,
+        **kwargs,
     ):
         """Initialize CustomAdapter.
 
@@ -63,15 +70,79 @@ class CustomAdapter(adapters.HTTPAdapter):
             pool_maxsize: passed to super
             max_retries: passed to super
             pool_block: passed to super
+            **kwargs: Additional keep-alive and telemetry args passed to super.
         """
-        super().__init__(pool_connections, pool_maxsize, max_retries, pool_block)
+        super().__init__(pool_connections, pool_maxsize, max_retries, pool_block, **kwargs)
         self._rate_limit_handler = rate_limit_handler
+        self.concurrency_limiter: Optional[AdaptiveLimiter] = None
+        self.http_cache: Optional[HttpCache] = None
 
     def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
         """Send PreparedRequest object. Returns Response object."""
+        cached = None
+        conditional_headers = []
+        if self.http_cache is not None:
+            cached = self.http_cache.lookup(request)
+            if cached is not None and cached.get('fresh'):
+                response = self.http_cache.response(request, cached)
+                if response is not None:
+                    self.http_cache.served()
+                    response.connection = self
+                    return response
+                cached = None
+
+            if cached is not None:
+                # revalidate the stale entry with a conditional request
+                if cached.get('headers').get('ETag'):
+                    request.headers['If-None-Match'] = cached.get('headers').get('ETag')
+                    conditional_headers.append('If-None-Match')
+                if cached.get('headers').get('Last-Modified'):
+                    request.headers['If-Modified-Since'] = cached.get('headers').get(
+                        'Last-Modified'
+                    )
+                    conditional_headers.append('If-Modified-Since')
+
+            # stream the body so that the cache can write it to disk in chunks
+            stream = True
+
+        host_limiter = None
+        if self.concurrency_limiter is not None:
+            host_limiter = self.concurrency_limiter.acquire(request.url)
+
+        try:
+            if self.rate_limit_handler:
+                self.rate_limit_handler.pre_send(request)
+
+            response = self._send(request, stream, timeout, verify, cert, proxies)
+        except Exception as ex:
+            if host_limiter is not None:
+                host_limiter.release(self.concurrency_limiter.failed(error=ex))
+            raise
+
+        if host_limiter is not None:
+            host_limiter.release(self.concurrency_limiter.failed(response=response))
+
         if self.rate_limit_handler:
-            self.rate_limit_handler.pre_send(request)
+            self.rate_limit_handler.post_send(response)
+
+        if self.http_cache is not None:
+            if cached is not None and response.status_code == 304:
+                cached_response = self.http_cache.revalidated(request, cached, response)
+                if cached_response is not None:
+                    cached_response.connection = self
+                    return cached_response
+
+                # the entry was evicted while revalidating, request the full response
+                for name in conditional_headers:
+                    request.headers.pop(name, None)
+                return self.send(request, stream, timeout, verify, cert, proxies)
+            else:
+                response = self.http_cache.store(request, response)
+
+        return response
 
+    def _send(self, request, stream, timeout, verify, cert, proxies):
+        """Send the request, making one final request without retries on a RetryError."""
         try:
             response = super().send(request, stream, timeout, verify, cert, proxies)
         except exceptions.RetryError:
@@ -86,10 +157,6 @@ class CustomAdapter(adapters.HTTPAdapter):
 
             # reset retries configuration
             self.max_retries = max_retries
-
-        if self.rate_limit_handler:
-            self.rate_limit_handler.post_send(response)
-
         return response
 
     @property
@@ -126,9 +193,15 @@ class ExternalSession(Session):
         'trust_env',
         # custom attrs
         '_base_url',
+        '_concurrency_limiter',
+        '_http_cache',
         '_mask_headers',
         '_mask_patterns',
+        '_pool_config',
+        '_rate_limiter',
         'log',
+        'pool_telemetry',
+        'request_metrics',
         'utils',
     ]
 
@@ -142,12 +215,18 @@ class ExternalSession(Session):
         self.utils: object = Utils()
 
         # properties
+        self._concurrency_limiter = None
+        self._http_cache = None
         self._log_curl: bool = False
         self._mask_body = False
         self._mask_headers = True
         self._mask_patterns = None
+        self._pool_config = {}
         self._rate_limit_handler = RateLimitHandler()
+        self._rate_limiter = None
         self._too_many_requests_handler = None
+        self.pool_telemetry = PoolTelemetry()
+        self.request_metrics = RequestMetrics()
 
         # Add default Retry
         self.retry()
@@ -162,6 +241,47 @@ class ExternalSession(Session):
         """Set base_url."""
         self._base_url = url.strip('/')
 
+    @property
+    def concurrency_limiter(self) -> Optional[AdaptiveLimiter]:
+        """Return the AdaptiveLimiter (None when concurrency is not limited)."""
+        return self._concurrency_limiter
+
+    @concurrency_limiter.setter
+    def concurrency_limiter(self, concurrency_limiter: Optional[AdaptiveLimiter]):
+        """Set the AdaptiveLimiter.
+
+        The AdaptiveLimiter limits the number of requests in flight to each host, shrinking the
+        limit on 429, 5xx, and timeout responses and failing fast (CircuitOpenError) while the
+        circuit for a host is open.
+
+        Args:
+            concurrency_limiter: the AdaptiveLimiter object to use or None to disable it.
+        """
+        self._concurrency_limiter = concurrency_limiter
+        if self._custom_adapter:
+            self._custom_adapter.concurrency_limiter = concurrency_limiter
+
+    @property
+    def http_cache(self) -> Optional[HttpCache]:
+        """Return the HttpCache (None when responses are not cached)."""
+        return self._http_cache
+
+    @http_cache.setter
+    def http_cache(self, http_cache: Optional[HttpCache]):
+        """Set the HttpCache.
+
+        GET responses are cached on disk according to the Cache-Control, Expires, ETag, and
+        Last-Modified headers. Fresh responses are served without a request (and without
+        waiting on the RateLimitHandler), stale responses are revalidated with a conditional
+        request.
+
+        Args:
+            http_cache: the HttpCache object to use or None to disable caching.
+        """
+        self._http_cache = http_cache
+        if self._custom_adapter:
+            self._custom_adapter.http_cache = http_cache
+
     @property
     def log_curl(self) -> bool:
         """Return whether or not requests will be logged as a curl command."""
@@ -249,6 +369,42 @@ class ExternalSession(Session):
         if self._custom_adapter:
             self._custom_adapter.rate_limit_handler = rate_limit_handler
 
+    @property
+    def rate_limiter(self) -> 'RateLimiter':  # noqa: F821
+        """Return the client-side RateLimiter (None when requests are not rate limited)."""
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, rate_limiter: 'RateLimiter'):  # noqa: F821
+        """Set the client-side RateLimiter.
+
+        The RateLimiter spaces out requests proactively using token buckets configured per
+        host/path pattern, and rate limit headers and 429 responses are fed back into it. A
+        single RateLimiter can be shared by multiple sessions.
+
+        Args:
+            rate_limiter: the RateLimiter object to use.
+        """
+        self._rate_limiter = rate_limiter
+        if self._custom_adapter:
+            self._custom_adapter.rate_limiter = rate_limiter
+
+    def _send_request(self, method: str, url: str, **kwargs) -> Response:
+        """Send the request, recording the request metrics."""
+        if not self.request_metrics.enabled:
+            return super().request(method, url, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            response: Response = super().request(method, url, **kwargs)
+        except Exception:
+            self.request_metrics.record(method, url, 'error', time.perf_counter() - start)
+            raise
+        self.request_metrics.record_response(
+            response, time.perf_counter() - start, stream=kwargs.get('stream', False)
+        )
+        return response
+
     def request(  # pylint: disable=arguments-differ
         self, method: str, url: str, **kwargs
     ) -> object:
@@ -268,7 +424,7 @@ class ExternalSession(Session):
         # method doesn't expect it so it needs to be removed.
         tc_is_retry = kwargs.pop('tc_is_retry', False)
 
-        response: Response = super().request(method, url, **kwargs)
+        response: Response = self._send_request(method, url, **kwargs)
 
         if response.status_code == 429 and not tc_is_retry:
             too_many_requests_handler = self.too_many_requests_handler
@@ -276,6 +432,10 @@ class ExternalSession(Session):
             kwargs['tc_is_retry'] = True
             return self.request(method, url, **kwargs)
 
+        # skip building log messages entirely when debug logging is disabled
+        if not self.log.isEnabledFor(logging.DEBUG):
+            return response
+
         # APP-79 - adding logging of request as curl commands
         if not response.ok or self.log_curl:
             try:
@@ -299,6 +459,43 @@ class ExternalSession(Session):
 
         return response
 
+    def pool_config(
+        self,
+        pool_connections: Optional[int] = 10,
+        pool_maxsize: Optional[int] = 10,
+        pool_block: Optional[bool] = False,
+        keep_alive: Optional[bool] = False,
+        keep_alive_idle: Optional[int] = None,
+        keep_alive_interval: Optional[int] = None,
+        keep_alive_count: Optional[int] = None,
+    ):
+        """Configure connection pooling.
+
+        The default pool holds 10 connections per host. When more threads share the session,
+        connections beyond the pool size are opened for each request and discarded afterwards.
+        Use pool_telemetry.stats (created/reused/discarded/wait_time) to size the pool.
+
+        Args:
+            pool_connections: The number of host connection pools to cache.
+            pool_maxsize: The maximum number of connections to keep in each host pool.
+            pool_block: If True, wait for a free connection instead of opening a new one.
+            keep_alive: If True, enable TCP keep-alive on pooled connections.
+            keep_alive_idle: Seconds a connection is idle before keep-alive probes are sent.
+            keep_alive_interval: Seconds between keep-alive probes.
+            keep_alive_count: Number of failed probes before the connection is dropped.
+        """
+        self._pool_config = {
+            'pool_connections': pool_connections,
+            'pool_maxsize': pool_maxsize,
+            'pool_block': pool_block,
+            'keep_alive': keep_alive,
+            'keep_alive_idle': keep_alive_idle,
+            'keep_alive_interval': keep_alive_interval,
+            'keep_alive_count': keep_alive_count,
+        }
+        if self._custom_adapter:
+            self._custom_adapter.configure(**self._pool_config)
+
     def rate_limit_config(
         self,
         limit_remaining_header: str = 'X-RateLimit-Remaining',
@@ -350,8 +547,14 @@ class ExternalSession(Session):
             self._custom_adapter.max_retries = retry_object
         else:
             self._custom_adapter = CustomAdapter(
-                rate_limit_handler=self.rate_limit_handler, max_retries=retry_object
+                rate_limit_handler=self.rate_limit_handler,
+                max_retries=retry_object,
+                rate_limiter=self.rate_limiter,
+                telemetry=self.pool_telemetry,
+                **self._pool_config,
             )
+            self._custom_adapter.concurrency_limiter = self.concurrency_limiter
+            self._custom_adapter.http_cache = self.http_cache
 
         # mount the custom adapter
         for url in urls:
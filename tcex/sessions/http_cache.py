@@ -0,0 +1,432 @@
+"""Disk backed HTTP cache for the ExternalSession.
+
+Responses are cached according to the Cache-Control, Expires, ETag, and Last-Modified
+headers. Fresh responses are served without a request, stale responses with validators are
+revalidated with a conditional request (If-None-Match/If-Modified-Since), and a 304 response
+is served from the cache.
+"""
+# standard library
+import calendar
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate
+from typing import Optional
+
+# third-party
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# get tcex logger
+logger = logging.getLogger('tcex')
+
+# request headers with credentials, responses are only shared between requests with the same values
+AUTH_HEADERS = ['Authorization', 'Cookie', 'Proxy-Authorization', 'X-Api-Key']
+
+# headers updated on the cached entry when a stale response is revalidated (RFC 7232)
+REVALIDATION_HEADERS = ['Cache-Control', 'Date', 'ETag', 'Expires', 'Last-Modified', 'Vary']
+
+
+class _CachedBody:
+    """File backed response body that is closed once it has been fully read."""
+
+    def __init__(self, fqfn: str):
+        """Initialize Class properties."""
+        self._fh = open(fqfn, 'rb')  # pylint: disable=consider-using-with
+
+    def close(self) -> None:
+        """Close the file."""
+        self._fh.close()
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        """Read from the file, closing it at EOF."""
+        if self._fh.closed:
+            return b''
+
+        data = self._fh.read(-1 if amt is None else amt)
+        if not data:
+            self._fh.close()
+        return data
+
+
+class HttpCache:
+    """Size bounded (LRU) disk cache for GET responses.
+
+    Response bodies are streamed to disk in chunks, so large bodies (e.g., CSV feed dumps) are
+    never held in memory by the cache.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        tcex.session_external.http_cache = HttpCache(
+            os.path.join(tcex.default_args.tc_temp_path, 'http-cache'), max_size=1024 ** 3
+        )
+        r = tcex.session_external.get('https://feeds.example.com/indicators.csv', stream=True)
+
+    Args:
+        cache_path: The directory for the cache files.
+        max_size: The maximum total size of the cached response bodies in bytes.
+        default_ttl: Seconds a response with validators but no explicit freshness information
+            is considered fresh. By default these responses are always revalidated.
+        chunk_size: The chunk size used when writing response bodies to disk.
+    """
+
+    def __init__(
+        self,
+        cache_path: str,
+        max_size: Optional[int] = 512 * 1024 ** 2,
+        default_ttl: Optional[int] = 0,
+        chunk_size: Optional[int] = 64 * 1024,
+    ):
+        """Initialize Class properties."""
+        self.cache_path = cache_path
+        self.chunk_size = chunk_size
+        self.default_ttl = default_ttl
+        self.max_size = max_size
+
+        # properties
+        self._index = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self.log = logger
+        self.reset_stats()
+
+        os.makedirs(self.cache_path, exist_ok=True)
+        self._load_index()
+
+    def __getstate__(self) -> dict:
+        """Return state for pickling (locks can not be pickled)."""
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore state when unpickling."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until the cache fits (caller holds lock)."""
+        while self._size > self.max_size and self._index:
+            key, size = self._index.popitem(last=False)
+            self._size -= size
+            self._stats['evictions'] += 1
+            self._remove_files(key)
+
+    def _fqfn(self, key: str, ext: str) -> str:
+        """Return the fully qualified filename for a cache entry file."""
+        return os.path.join(self.cache_path, f'{key}.{ext}')
+
+    def _load_index(self) -> None:
+        """Build the LRU index from the entries on disk (least recently used first)."""
+        entries = []
+        for filename in os.listdir(self.cache_path):
+            if filename.endswith('.tmp'):
+                # left behind by an interrupted write
+                os.remove(os.path.join(self.cache_path, filename))
+                continue
+            if not filename.endswith('.json'):
+                continue
+
+            key = filename[:-5]
+            try:
+                last_used = os.path.getmtime(self._fqfn(key, 'json'))
+                size = os.path.getsize(self._fqfn(key, 'body'))
+            except OSError:
+                # incomplete entry
+                self._remove_files(key)
+                continue
+            entries.append((last_used, key, size))
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._size += size
+
+        with self._lock:
+            self._evict()
+
+    def _read_meta(self, key: str) -> Optional[dict]:
+        """Return the metadata for a cache entry."""
+        try:
+            with open(self._fqfn(key, 'json')) as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return None
+
+    def _remove_files(self, key: str) -> None:
+        """Remove the files for a cache entry."""
+        for ext in ['body', 'json']:
+            try:
+                os.remove(self._fqfn(key, ext))
+            except OSError:
+                pass
+
+    def _write_meta(self, key: str, meta: dict) -> None:
+        """Atomically write the metadata for a cache entry."""
+        temp = self._fqfn(key, f'json.{threading.get_ident()}.tmp')
+        with open(temp, 'w') as fh:
+            json.dump(meta, fh)
+        os.replace(temp, self._fqfn(key, 'json'))
+
+    @staticmethod
+    def cache_control(headers: dict) -> dict:
+        """Return the Cache-Control directives from the headers.
+
+        Args:
+            headers: The request or response headers.
+        """
+        directives = {}
+        for directive in (headers.get('Cache-Control') or '').split(','):
+            name, _, value = directive.strip().partition('=')
+            if name:
+                directives[name.lower()] = value.strip('"') or None
+        return directives
+
+    def freshness_lifetime(self, headers: dict) -> Optional[float]:
+        """Return the number of seconds the response is fresh or None if it can not be stored.
+
+        Args:
+            headers: The response headers.
+        """
+        directives = self.cache_control(headers)
+        if 'no-store' in directives:
+            return None
+
+        if 'no-cache' in directives:
+            lifetime = 0.0
+        elif (directives.get('max-age') or '').isdigit():
+            lifetime = float(directives.get('max-age'))
+        elif headers.get('Expires'):
+            expires = parsedate(headers.get('Expires'))
+            date = parsedate(headers.get('Date') or '')
+            now = calendar.timegm(date) if date else time.time()
+            lifetime = max(calendar.timegm(expires) - now, 0.0) if expires else 0.0
+        else:
+            lifetime = float(self.default_ttl)
+
+        if lifetime <= 0 and not (headers.get('ETag') or headers.get('Last-Modified')):
+            # the response can never be used without validators
+            return None
+        return lifetime
+
+    def key(self, request: PreparedRequest) -> str:
+        """Return the cache key for the request.
+
+        The credentials in the request headers are part of the key, so a response is never
+        served to a request with different (or no) credentials.
+
+        Args:
+            request: The prepared request.
+        """
+        key = hashlib.sha256(f'{request.method} {request.url}'.encode())
+        for name in AUTH_HEADERS:
+            value = request.headers.get(name)
+            if value is not None:
+                key.update(f'\n{name.lower()}: {value}'.encode())
+        return key.hexdigest()
+
+    def lookup(self, request: PreparedRequest) -> Optional[dict]:
+        """Return the cache entry metadata for the request or None.
+
+        The returned metadata includes a "fresh" key indicating whether the entry can be used
+        without revalidation.
+
+        Args:
+            request: The prepared request.
+        """
+        if request.method != 'GET':
+            return None
+
+        key = self.key(request)
+        with self._lock:
+            if key not in self._index:
+                return None
+
+        meta = self._read_meta(key)
+        if meta is None:
+            return None
+
+        # responses with Vary are only used for requests with the same header values
+        for name, value in meta.get('vary', {}).items():
+            if request.headers.get(name) != value:
+                return None
+
+        fresh = time.time() < meta.get('stored') + meta.get('lifetime')
+        if 'no-cache' in self.cache_control(request.headers):
+            fresh = False
+        meta['fresh'] = fresh
+        meta['key'] = key
+        return meta
+
+    def reset_stats(self) -> None:
+        """Reset the cache statistics."""
+        self._stats = {
+            'evictions': 0,
+            'hits': 0,
+            'misses': 0,
+            'revalidated': 0,
+            'stores': 0,
+        }
+
+    def response(
+        self, request: PreparedRequest, meta: dict, body: Optional[_CachedBody] = None
+    ) -> Optional[Response]:
+        """Return a Response for a cache entry or None if the entry was removed.
+
+        Args:
+            request: The prepared request.
+            meta: The cache entry metadata.
+            body: The open response body. Defaults to the body of the cache entry.
+        """
+        key = meta.get('key')
+        if body is None:
+            try:
+                body = _CachedBody(self._fqfn(key, 'body'))
+            except OSError:
+                # the entry was evicted by another thread
+                return None
+
+        response = Response()
+        response.headers = CaseInsensitiveDict(meta.get('headers'))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = body
+        response.reason = meta.get('reason')
+        response.request = request
+        response.status_code = meta.get('status_code')
+        response.url = request.url
+        response.from_cache = True
+
+        # mark the entry as recently used
+        with self._lock:
+            if key in self._index:
+                self._index.move_to_end(key)
+        try:
+            os.utime(self._fqfn(key, 'json'))
+        except OSError:  # pragma: no cover
+            pass
+        return response
+
+    def revalidated(
+        self, request: PreparedRequest, meta: dict, response: Response
+    ) -> Optional[Response]:
+        """Update a cache entry from a 304 response and return the cached Response.
+
+        None is returned if the entry was evicted since the lookup.
+
+        Args:
+            request: The prepared request.
+            meta: The cache entry metadata.
+            response: The 304 response.
+        """
+        response.close()
+
+        with self._lock:
+            if meta.get('key') not in self._index:
+                return None
+
+        headers = CaseInsensitiveDict(meta.get('headers'))
+        for name in REVALIDATION_HEADERS:
+            if name in response.headers:
+                headers[name] = response.headers.get(name)
+
+        lifetime = self.freshness_lifetime(headers)
+        meta['headers'] = dict(headers)
+        meta['lifetime'] = lifetime or 0.0
+        meta['stored'] = time.time()
+        self._write_meta(meta.get('key'), {k: v for k, v in meta.items() if k != 'fresh'})
+
+        with self._lock:
+            self._stats['revalidated'] += 1
+        return self.response(request, meta)
+
+    def served(self) -> None:
+        """Record a response served from the cache without a request."""
+        with self._lock:
+            self._stats['hits'] += 1
+
+    @property
+    def stats(self) -> dict:
+        """Return the cache statistics."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._index)
+            stats['size'] = self._size
+        return stats
+
+    def store(self, request: PreparedRequest, response: Response) -> Response:
+        """Stream the response body to disk and return a Response reading from the cache.
+
+        Responses that can not be stored are returned unchanged.
+
+        Args:
+            request: The prepared request.
+            response: The response (sent with stream=True).
+        """
+        if request.method != 'GET':
+            return response
+
+        with self._lock:
+            self._stats['misses'] += 1
+
+        if response.status_code != 200:
+            return response
+
+        lifetime = self.freshness_lifetime(response.headers)
+        if lifetime is None:
+            return response
+
+        key = self.key(request)
+        temp = self._fqfn(key, f'body.{threading.get_ident()}.tmp')
+        size = 0
+        with open(temp, 'wb') as fh:
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                fh.write(chunk)
+                size += len(chunk)
+        response.close()
+
+        # the body is stored decoded
+        headers = CaseInsensitiveDict(response.headers)
+        headers.pop('Content-Encoding', None)
+        headers.pop('Transfer-Encoding', None)
+        headers['Content-Length'] = str(size)
+
+        vary = {}
+        for name in (headers.get('Vary') or '').split(','):
+            name = name.strip()
+            if name:
+                vary[name] = request.headers.get(name)
+
+        meta = {
+            'headers': dict(headers),
+            'key': key,
+            'lifetime': lifetime,
+            'reason': response.reason,
+            'status_code': response.status_code,
+            'stored': time.time(),
+            'url': request.url,
+            'vary': vary,
+        }
+
+        if size > self.max_size:
+            # serve the body from the temp file, which is removed once it is open
+            body = _CachedBody(temp)
+            os.remove(temp)
+            return self.response(request, meta, body)
+
+        with self._lock:
+            os.replace(temp, self._fqfn(key, 'body'))
+            self._write_meta(key, meta)
+            self._size += size - self._index.pop(key, 0)
+            self._index[key] = size
+            self._stats['stores'] += 1
+            self._evict()
+
+            # open the body while holding the lock so it can not be evicted first
+            body = _CachedBody(self._fqfn(key, 'body'))
+        return self.response(request, meta, body)
@@ -0,0 +1,233 @@
+"""Requests Adapter with configurable connection pooling and pool telemetry."""
+# standard library
+import socket
+import threading
+import time
+from typing import Optional
+
+# third-party
+from requests import adapters
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, DEFAULT_RETRIES
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class PoolTelemetry:
+    """Thread-safe connection pool counters shared by all adapters of a session.
+
+    * created - new connections opened (each requires a TCP and possibly a TLS handshake)
+    * reused - connections taken from the pool that were opened by a previous request
+    * discarded - connections closed on release because the pool was full or closed
+    * wait_time - total seconds spent waiting for a connection from the pool
+    * max_wait_time - the longest single wait for a connection from the pool
+    """
+
+    def __init__(self):
+        """Initialize Class properties."""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __getstate__(self) -> dict:
+        """Return state for pickling (locks can not be pickled)."""
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore state when unpickling."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def acquired(self, wait_time: float) -> None:
+        """Record a connection taken from the pool."""
+        with self._lock:
+            self._acquired += 1
+            self._wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+
+    def created(self) -> None:
+        """Record a new connection."""
+        with self._lock:
+            self._created += 1
+
+    def discarded(self) -> None:
+        """Record a discarded connection."""
+        with self._lock:
+            self._discarded += 1
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self._acquired = 0
+            self._created = 0
+            self._discarded = 0
+            self._max_wait_time = 0.0
+            self._wait_time = 0.0
+
+    @property
+    def stats(self) -> dict:
+        """Return the pool telemetry stats."""
+        with self._lock:
+            return {
+                'created': self._created,
+                'discarded': self._discarded,
+                'max_wait_time': self._max_wait_time,
+                'requests': self._acquired,
+                'reused': max(self._acquired - self._created, 0),
+                'wait_time': self._wait_time,
+            }
+
+
+class _TelemetryPoolMixin:
+    """Connection pool mixin that records telemetry for connection handling."""
+
+    telemetry: PoolTelemetry = None
+
+    def _get_conn(self, timeout=None):
+        """Get a connection from the pool, recording the time spent waiting."""
+        start = time.monotonic()
+        conn = super()._get_conn(timeout=timeout)
+        self.telemetry.acquired(time.monotonic() - start)
+        return conn
+
+    def _new_conn(self):
+        """Return a new connection."""
+        self.telemetry.created()
+        return super()._new_conn()
+
+    def _put_conn(self, conn):
+        """Put a connection back into the pool, recording connections that are discarded."""
+        if conn is not None and (self.pool is None or self.pool.full()):
+            self.telemetry.discarded()
+        super()._put_conn(conn)
+
+
+class PoolAdapter(adapters.HTTPAdapter):
+    """HTTP Adapter with configurable pooling, TCP keep-alive, and pool telemetry.
+
+    Args:
+        pool_connections: The number of host connection pools to cache.
+        pool_maxsize: The maximum number of connections to save in each pool. This should be
+            at least the number of threads sharing the session.
+        max_retries: The Retry configuration.
+        pool_block: If True, requests wait for a free connection when the pool is exhausted
+            instead of opening (and later discarding) an extra connection.
+        keep_alive: If True, enable TCP keep-alive on pooled connections so idle connections
+            are not silently dropped by firewalls and load balancers.
+        keep_alive_idle: Seconds a connection is idle before keep-alive probes are sent.
+        keep_alive_interval: Seconds between keep-alive probes.
+        keep_alive_count: Number of failed probes before the connection is dropped.
+        telemetry: The telemetry object to record pool stats. Defaults to a new instance.
+        rate_limiter: An optional RateLimiter used to space out requests before they are sent.
+    """
+
+    __attrs__ = adapters.HTTPAdapter.__attrs__ + ['_socket_options', 'rate_limiter', 'telemetry']
+
+    def __init__(
+        self,
+        pool_connections: Optional[int] = DEFAULT_POOLSIZE,
+        pool_maxsize: Optional[int] = DEFAULT_POOLSIZE,
+        max_retries: Optional[object] = DEFAULT_RETRIES,
+        pool_block: Optional[bool] = DEFAULT_POOLBLOCK,
+        keep_alive: Optional[bool] = False,
+        keep_alive_idle: Optional[int] = None,
+        keep_alive_interval: Optional[int] = None,
+        keep_alive_count: Optional[int] = None,
+        telemetry: Optional[PoolTelemetry] = None,
+        rate_limiter: Optional['RateLimiter'] = None,  # noqa: F821
+    ):
+        """Initialize Class properties."""
+        self.rate_limiter = rate_limiter
+        self.telemetry = telemetry or PoolTelemetry()
+        self._socket_options = self.socket_options(
+            keep_alive, keep_alive_idle, keep_alive_interval, keep_alive_count
+        )
+        super().__init__(pool_connections, pool_maxsize, max_retries, pool_block)
+
+    def _pool_classes(self) -> dict:
+        """Return the telemetry connection pool classes by scheme."""
+        return {
+            'http': type(
+                'TelemetryHTTPConnectionPool',
+                (_TelemetryPoolMixin, HTTPConnectionPool),
+                {'telemetry': self.telemetry},
+            ),
+            'https': type(
+                'TelemetryHTTPSConnectionPool',
+                (_TelemetryPoolMixin, HTTPSConnectionPool),
+                {'telemetry': self.telemetry},
+            ),
+        }
+
+    def configure(
+        self,
+        pool_connections: Optional[int] = DEFAULT_POOLSIZE,
+        pool_maxsize: Optional[int] = DEFAULT_POOLSIZE,
+        pool_block: Optional[bool] = DEFAULT_POOLBLOCK,
+        keep_alive: Optional[bool] = False,
+        keep_alive_idle: Optional[int] = None,
+        keep_alive_interval: Optional[int] = None,
+        keep_alive_count: Optional[int] = None,
+    ) -> None:
+        """Reconfigure the connection pools, closing any existing pooled connections."""
+        self._socket_options = self.socket_options(
+            keep_alive, keep_alive_idle, keep_alive_interval, keep_alive_count
+        )
+        self.close()
+        self.proxy_manager = {}
+        self.init_poolmanager(pool_connections, pool_maxsize, block=pool_block)
+
+    def init_poolmanager(
+        self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs
+    ):  # pylint: disable=arguments-differ
+        """Initialize the urllib3 PoolManager using the telemetry connection pools."""
+        if self._socket_options is not None:
+            pool_kwargs.setdefault('socket_options', self._socket_options)
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._pool_classes()
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        """Return the urllib3 ProxyManager using the telemetry connection pools."""
+        new_manager = proxy not in self.proxy_manager
+        if self._socket_options is not None:
+            proxy_kwargs.setdefault('socket_options', self._socket_options)
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        if new_manager:
+            manager.pool_classes_by_scheme = self._pool_classes()
+        return manager
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ):  # pylint: disable=arguments-differ
+        """Send PreparedRequest object, waiting on the rate limiter if one is configured."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.pre_send(request)
+
+        response = super().send(request, stream, timeout, verify, cert, proxies)
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.post_send(response)
+        return response
+
+    @staticmethod
+    def socket_options(
+        keep_alive: bool,
+        keep_alive_idle: Optional[int] = None,
+        keep_alive_interval: Optional[int] = None,
+        keep_alive_count: Optional[int] = None,
+    ) -> Optional[list]:
+        """Return the socket options for TCP keep-alive or None for the urllib3 defaults."""
+        if not keep_alive:
+            return None
+
+        options = list(HTTPConnection.default_socket_options)
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # the fine grained keep-alive options are not available on all platforms
+        for name, value in (
+            ('TCP_KEEPIDLE', keep_alive_idle),
+            ('TCP_KEEPINTVL', keep_alive_interval),
+            ('TCP_KEEPCNT', keep_alive_count),
+        ):
+            if value is not None and hasattr(socket, name):
+                options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+        return options
@@ -0,0 +1,245 @@
+"""Client-side token bucket rate limiting shared across threads.
+
+Unlike the RateLimitHandler, which waits only after the server reports that the limit has been
+reached, the RateLimiter spaces requests out proactively so that threads sharing a session stay
+at the allowed rate instead of bursting into 429 responses.
+"""
+# standard library
+import fnmatch
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from urllib.parse import urlparse
+
+# third-party
+from requests import PreparedRequest, Response
+
+# get tcex logger
+logger = logging.getLogger('tcex')
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens are added at ``rate`` per second up to ``capacity``. Each request consumes one token.
+    A capacity of 1 gives leaky bucket semantics (evenly spaced requests with no bursts).
+
+    Requests reserve their token up front, so concurrent callers queue behind each other with
+    exact spacing instead of waking up together and competing for the next token.
+
+    Args:
+        rate: The number of requests allowed per second.
+        capacity: The maximum burst size. Defaults to rate (one second of requests).
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize Class properties."""
+        if rate <= 0:
+            raise RuntimeError('The rate limit must be greater than 0.')
+
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(rate, 1))
+
+        # properties
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self.acquired = 0
+        self.wait_time = 0.0
+
+    def __getstate__(self) -> dict:
+        """Return state for pickling (locks can not be pickled)."""
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore state when unpickling."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time elapsed since the last update (caller must hold the lock)."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Wait until a request is allowed and return the number of seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = max(-self._tokens / self.rate, self._paused_until - now, 0.0)
+            self.acquired += 1
+            self.wait_time += wait
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Block all requests for the provided number of seconds (e.g., on a 429 response).
+
+        The bucket is empty when requests resume, so requests queued during the pause are
+        spaced out at the configured rate instead of all being sent at the resume time.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._paused_until = max(self._paused_until, now + seconds)
+            # a token debt for the pause (negative tokens are reserved by waiting requests)
+            self._tokens = min(self._tokens, (now - self._paused_until) * self.rate)
+
+    def sync(self, remaining: int, reset_seconds: Optional[float] = None) -> None:
+        """Reconcile the bucket with the remaining request count reported by the server.
+
+        Args:
+            remaining: The number of requests the server will still allow.
+            reset_seconds: The number of seconds until the server limit resets.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, float(remaining))
+        if remaining <= 0 and reset_seconds:
+            self.pause(reset_seconds)
+
+    @property
+    def tokens(self) -> float:
+        """Return the number of tokens currently available."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+class RateLimiter:
+    """Per host/path pattern token bucket rate limiter.
+
+    A single instance can be shared by multiple sessions and threads.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        rate_limiter = RateLimiter()
+        rate_limiter.add_limit('api.example.com/v1/search*', rate=2)
+        rate_limiter.add_limit('api.example.com/*', rate=10, capacity=20)
+        tcex.session_external.rate_limiter = rate_limiter
+
+    Args:
+        limit_remaining_header: The header containing the number of requests remaining.
+        limit_reset_header: The header that specifies when the rate limit period will reset.
+    """
+
+    def __init__(
+        self,
+        limit_remaining_header: Optional[str] = 'X-RateLimit-Remaining',
+        limit_reset_header: Optional[str] = 'X-RateLimit-Reset',
+    ):
+        """Initialize Class properties."""
+        self.limit_remaining_header = limit_remaining_header
+        self.limit_reset_header = limit_reset_header
+
+        # properties
+        self._limits = []
+        self.log = logger
+
+    @staticmethod
+    def _seconds_until(value: str) -> Optional[float]:
+        """Return the number of seconds for a reset/retry header value.
+
+        The value can be delta seconds, an epoch timestamp, or an HTTP date.
+        """
+        try:
+            seconds = float(value)
+            if seconds > 1_000_000_000:
+                # epoch timestamp
+                seconds -= time.time()
+            return max(seconds, 0.0)
+        except (TypeError, ValueError):
+            pass
+
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError, IndexError):
+            return None
+
+    @staticmethod
+    def _target(url: str) -> str:
+        """Return the host and path used for pattern matching."""
+        parsed = urlparse(url)
+        return f'{parsed.hostname or ""}{parsed.path or "/"}'
+
+    def add_limit(self, pattern: str, rate: float, capacity: Optional[float] = None) -> None:
+        """Add a rate limit for requests matching the pattern.
+
+        Patterns are matched in the order they were added against "<host><path>" using shell
+        style wildcards (e.g., "api.example.com/v2/*" or "*").
+
+        Args:
+            pattern: The host/path pattern.
+            rate: The number of requests allowed per second.
+            capacity: The maximum burst size. Defaults to rate.
+        """
+        self._limits.append((pattern, TokenBucket(rate, capacity)))
+
+    def bucket(self, url: str) -> Optional[TokenBucket]:
+        """Return the token bucket for the provided URL or None if the URL is not limited."""
+        target = self._target(url)
+        for pattern, bucket in self._limits:
+            if fnmatch.fnmatchcase(target, pattern):
+                return bucket
+        return None
+
+    def post_send(self, response: Response) -> None:
+        """Feed server rate limit headers and 429 responses back into the bucket.
+
+        Args:
+            response: The response from the request.
+        """
+        bucket = self.bucket(response.request.url)
+        if bucket is None:
+            return
+
+        if response.status_code == 429:
+            seconds = self._seconds_until(response.headers.get('Retry-After'))
+            if seconds:
+                self.log.debug(f'feature=rate-limiter, event=retry-after, seconds={seconds}')
+                bucket.pause(seconds)
+            return
+
+        remaining = response.headers.get(self.limit_remaining_header)
+        if remaining is not None:
+            try:
+                bucket.sync(
+                    int(remaining),
+                    self._seconds_until(response.headers.get(self.limit_reset_header)),
+                )
+            except ValueError:
+                pass
+
+    def pre_send(self, request: PreparedRequest) -> None:
+        """Wait until the request is allowed.
+
+        Args:
+            request: The request to be sent.
+        """
+        bucket = self.bucket(request.url)
+        if bucket is not None:
+            bucket.acquire()
+
+    @property
+    def stats(self) -> dict:
+        """Return the requests and total wait time for each pattern."""
+        return {
+            pattern: {
+                'requests': bucket.acquired,
+                'tokens': bucket.tokens,
+                'wait_time': bucket.wait_time,
+            }
+            for pattern, bucket in self._limits
+        }
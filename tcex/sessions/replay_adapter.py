@@ -0,0 +1,287 @@
+"""Record and replay transport adapters for offline testing and benchmarking.
+
+Responses are stored in a data file (the response bodies, one after another) and a JSON index
+mapping each request key to the offset, length, status, headers, and elapsed time of its
+responses. The data file is memory-mapped for replay, so opening a store only loads the index
+and each response body is read directly from the page cache.
+
+.. code-block:: python
+    :linenos:
+    :lineno-start: 1
+
+    # record a run against a live instance
+    store = ReplayStore('/tmp/app-run')
+    RecordingAdapter(store).install(tcex.session)
+    ...
+    store.close()
+
+    # replay the run offline with the recorded latency
+    ReplayAdapter(ReplayStore('/tmp/app-run'), latency='recorded').install(tcex.session)
+"""
+# standard library
+import hashlib
+import io
+import json
+import mmap
+import os
+import threading
+import time
+from typing import Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# third-party
+from requests import PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# headers that do not apply to the decoded body that is stored
+EXCLUDED_HEADERS = ['Content-Encoding', 'Transfer-Encoding']
+
+
+class ReplayStore:
+    """Indexed response store with a memory-mapped data file.
+
+    Args:
+        path: The path prefix for the store files (<path>.data and <path>.index.json).
+        blur: Query params whose values are not part of the request key (e.g., timestamps or
+            secrets that change between runs).
+        match_body: If True, the request body is part of the request key.
+    """
+
+    def __init__(
+        self, path: str, blur: Optional[list] = None, match_body: Optional[bool] = True
+    ):
+        """Initialize Class properties."""
+        self.blur = set(blur or ['password'])
+        self.data_file = f'{path}.data'
+        self.index_file = f'{path}.index.json'
+        self.match_body = match_body
+
+        # properties
+        self._data = None
+        self._index = {}
+        self._lock = threading.Lock()
+        self._mmap = None
+        self._positions = {}
+
+        if os.path.isfile(self.index_file):
+            with open(self.index_file) as fh:
+                self._index = json.load(fh)
+
+    def __len__(self) -> int:
+        """Return the number of recorded request keys."""
+        return len(self._index)
+
+    def _body(self, offset: int, length: int) -> bytes:
+        """Return a response body from the memory-mapped data file."""
+        if self._mmap is None:
+            with self._lock:
+                if self._mmap is None:
+                    # a store with only empty bodies has an empty (unmappable) data file
+                    if not os.path.getsize(self.data_file):
+                        return b''
+                    with open(self.data_file, 'rb') as fh:
+                        self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap[offset : offset + length]
+
+    def append(self, key: str, response: Response, elapsed: float) -> None:
+        """Record a response for the request key.
+
+        Args:
+            key: The request key.
+            response: The response (the body is read if it has not been).
+            elapsed: The request duration in seconds.
+        """
+        body = response.content or b''
+        headers = {k: v for k, v in response.headers.items() if k not in EXCLUDED_HEADERS}
+        with self._lock:
+            if self._data is None:
+                self._data = open(self.data_file, 'ab')  # pylint: disable=consider-using-with
+            offset = self._data.tell()
+            self._data.write(body)
+            self._index.setdefault(key, []).append(
+                {
+                    'elapsed': elapsed,
+                    'headers': headers,
+                    'length': len(body),
+                    'offset': offset,
+                    'reason': response.reason,
+                    'status_code': response.status_code,
+                }
+            )
+
+    def close(self) -> None:
+        """Write the index and close the data file."""
+        with self._lock:
+            if self._data is not None:
+                self._data.close()
+                self._data = None
+
+                temp = f'{self.index_file}.tmp'
+                with open(temp, 'w') as fh:
+                    json.dump(self._index, fh)
+                os.replace(temp, self.index_file)
+
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+
+    def get(self, key: str) -> Optional[tuple]:
+        """Return the next recorded (metadata, body) for the request key.
+
+        Repeated requests with the same key get the recorded responses in order (e.g., a
+        polled status endpoint); once exhausted, the last response is repeated.
+
+        Args:
+            key: The request key.
+        """
+        entries = self._index.get(key)
+        if not entries:
+            return None
+
+        with self._lock:
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+        entry = entries[min(position, len(entries) - 1)]
+        return entry, self._body(entry.get('offset'), entry.get('length'))
+
+    def key(self, request: PreparedRequest) -> str:
+        """Return the request key (method, URL with sorted query params, and body hash).
+
+        Args:
+            request: The prepared request.
+        """
+        scheme, netloc, path, query, _ = urlsplit(request.url)
+        params = sorted(
+            (k, '***' if k in self.blur else v)
+            for k, v in parse_qsl(query, keep_blank_values=True)
+        )
+        key = f'{request.method} {urlunsplit((scheme, netloc, path, urlencode(params), ""))}'
+
+        if self.match_body and request.body:
+            body = request.body
+            if isinstance(body, str):
+                body = body.encode()
+            if isinstance(body, bytes):
+                key += f' {hashlib.sha256(body).hexdigest()}'
+        return key
+
+    def reset(self) -> None:
+        """Replay all request keys from their first recorded response."""
+        with self._lock:
+            self._positions = {}
+
+
+class _InstallMixin:
+    """Mount an adapter on a session."""
+
+    def install(self, session: Session, prefixes: Optional[list] = None) -> None:
+        """Mount the adapter on the session (after any adapters mounted by retry()).
+
+        Args:
+            session: The TcSession or ExternalSession.
+            prefixes: The URL prefixes to mount. Defaults to https:// and http://.
+        """
+        for prefix in prefixes or ['https://', 'http://']:
+            session.mount(prefix, self)
+
+
+class RecordingAdapter(_InstallMixin, BaseAdapter):
+    """Adapter that records responses from the adapter it replaces to a ReplayStore.
+
+    Args:
+        store: The ReplayStore to record to.
+    """
+
+    def __init__(self, store: ReplayStore):
+        """Initialize Class properties."""
+        super().__init__()
+        self.adapters = {}
+        self.store = store
+
+    def close(self) -> None:
+        """Close the wrapped adapters."""
+        for adapter in self.adapters.values():
+            adapter.close()
+
+    def install(self, session: Session, prefixes: Optional[list] = None) -> None:
+        """Wrap the adapters currently mounted on the session and mount the adapter.
+
+        Args:
+            session: The TcSession or ExternalSession.
+            prefixes: The URL prefixes to mount. Defaults to https:// and http://.
+        """
+        for prefix in prefixes or ['https://', 'http://']:
+            self.adapters[prefix] = session.get_adapter(prefix)
+        super().install(session, prefixes)
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ):  # pylint: disable=arguments-differ
+        """Send the request with the wrapped adapter and record the response."""
+        prefix = 'https://' if request.url.lower().startswith('https://') else 'http://'
+        start = time.perf_counter()
+        response = self.adapters[prefix].send(request, stream, timeout, verify, cert, proxies)
+        # read the body so it is included in the recorded elapsed time
+        response.content  # pylint: disable=pointless-statement
+        self.store.append(self.store.key(request), response, time.perf_counter() - start)
+        return response
+
+
+class ReplayAdapter(_InstallMixin, BaseAdapter):
+    """Adapter that serves recorded responses from a ReplayStore.
+
+    Args:
+        store: The ReplayStore to replay from.
+        latency: None for no delay, "recorded" to sleep for the recorded elapsed time, or a
+            number of seconds to sleep for each request.
+        latency_factor: A multiplier applied to the latency (e.g., 0.5 for half the recorded
+            latency).
+    """
+
+    def __init__(
+        self,
+        store: ReplayStore,
+        latency: Optional[Union[float, str]] = None,
+        latency_factor: Optional[float] = 1.0,
+    ):
+        """Initialize Class properties."""
+        super().__init__()
+        self.latency = latency
+        self.latency_factor = latency_factor
+        self.store = store
+
+    def close(self) -> None:
+        """Close the adapter (the store is left open for other sessions)."""
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ):  # pylint: disable=arguments-differ,unused-argument
+        """Return the recorded response for the request."""
+        key = self.store.key(request)
+        recorded = self.store.get(key)
+        if recorded is None:
+            raise KeyError(f'No recorded response found for key {key}')
+        entry, body = recorded
+
+        if self.latency == 'recorded':
+            time.sleep(entry.get('elapsed') * self.latency_factor)
+        elif self.latency:
+            time.sleep(float(self.latency) * self.latency_factor)
+
+        response = Response()
+        # the raw body supports streamed responses (e.g., iter_content), otherwise the content
+        # is preloaded as requests would do
+        response.raw = io.BytesIO(body)
+        if not stream:
+            response._content = body  # pylint: disable=protected-access
+            response._content_consumed = True  # pylint: disable=protected-access
+        response.connection = self
+        response.headers = CaseInsensitiveDict(entry.get('headers'))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = entry.get('reason')
+        response.request = request
+        response.status_code = entry.get('status_code')
+        response.url = request.url
+        return response
@@ -0,0 +1,264 @@
+"""Per-endpoint request metrics for the HTTP sessions."""
+# standard library
+import atexit
+import bisect
+import json
+import re
+import threading
+from typing import Optional, Union
+from urllib.parse import urlparse
+
+# latency histogram bucket upper bounds in milliseconds (the last bucket is unbounded)
+LATENCY_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+# ThreatConnect endpoints where the type and value segments are collapsed, followed by
+# generic id segments (integer, uuid, and hashes)
+DEFAULT_RULES = [
+    (r'^(/api)?/v2/(groups|indicators)/[^/]+/[^/]+', r'\1/v2/\2/{type}/{id}'),
+    (r'/(tags|securityLabels)/[^/]+', r'/\1/{name}'),
+    (r'/[0-9]+(?=/|$)', r'/{id}'),
+    (r'/[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}(?=/|$)', r'/{id}'),
+    (r'/(?:[0-9a-fA-F]{32}|[0-9a-fA-F]{40}|[0-9a-fA-F]{64})(?=/|$)', r'/{id}'),
+]
+
+
+class EndpointMetrics:
+    """Latency histogram, status code counts, and byte counts for a single endpoint template."""
+
+    __slots__ = ('bytes_in', 'bytes_out', 'buckets', 'count', 'max', 'min', 'status', 'total')
+
+    def __init__(self):
+        """Initialize Class properties."""
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.max = 0.0
+        self.min = None
+        self.status = {}
+        self.total = 0.0
+
+    def add(self, status: Union[int, str], elapsed: float, bytes_in: int, bytes_out: int) -> None:
+        """Add a request (caller must hold the lock)."""
+        ms = elapsed * 1000
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, ms)] += 1
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+        self.count += 1
+        self.max = max(self.max, elapsed)
+        self.min = elapsed if self.min is None else min(self.min, elapsed)
+        self.status[status] = self.status.get(status, 0) + 1
+        self.total += elapsed
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Return the upper bound (in seconds) of the bucket containing the percentile."""
+        if not self.count:
+            return None
+
+        rank = pct / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                if index < len(LATENCY_BUCKETS):
+                    return min(LATENCY_BUCKETS[index] / 1000, self.max)
+                break
+        return self.max
+
+    def as_dict(self) -> dict:
+        """Return the metrics as a dict."""
+        histogram = {f'<={b}ms': c for b, c in zip(LATENCY_BUCKETS, self.buckets)}
+        histogram[f'>{LATENCY_BUCKETS[-1]}ms'] = self.buckets[-1]
+        return {
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'count': self.count,
+            'histogram': histogram,
+            'max': self.max,
+            'mean': self.total / self.count if self.count else 0.0,
+            'min': self.min,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'status': {str(k): v for k, v in sorted(self.status.items(), key=str)},
+            'total': self.total,
+        }
+
+
+class RequestMetrics:
+    """Thread-safe per-endpoint request metrics.
+
+    Requests are keyed by method and a normalized endpoint template (e.g.,
+    "GET /v2/indicators/{type}/{id}") so that repeated calls to the same API endpoint with
+    different ids are aggregated. The sessions only record requests when the metrics are
+    enabled (e.g., by the tc_log_request_metrics arg).
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        tcex.session.request_metrics.enabled = True
+        tcex.session.request_metrics.add_rule(r'^/v1/items/[^/]+', '/v1/items/{name}')
+        ...
+        for endpoint, metrics in tcex.session.request_metrics.stats.items():
+            print(endpoint, metrics.get('count'), metrics.get('total'))
+
+    Args:
+        rules: A list of (regex, replacement) tuples used to normalize the URL path. Defaults
+            to rules for the ThreatConnect API and generic ids.
+        enabled: If True, the sessions record their requests. Defaults to False.
+    """
+
+    def __init__(self, rules: Optional[list] = None, enabled: Optional[bool] = False):
+        """Initialize Class properties."""
+        self.enabled = enabled
+
+        # properties
+        self._dump_registered = False
+        self._endpoints = {}
+        self._lock = threading.Lock()
+        self._rules = [(re.compile(p), r) for p, r in (rules or DEFAULT_RULES)]
+
+    def __getstate__(self) -> dict:
+        """Return state for pickling (locks can not be pickled)."""
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore state when unpickling."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _body_size(body: Optional[Union[bytes, str]]) -> int:
+        """Return the size of a request body (streamed bodies are not counted)."""
+        if isinstance(body, bytes):
+            return len(body)
+        if isinstance(body, str):
+            return len(body.encode())
+        return 0
+
+    def add_rule(self, pattern: str, replacement: str) -> None:
+        """Add a normalization rule, applied before the existing rules.
+
+        Args:
+            pattern: The regex pattern to match against the URL path.
+            replacement: The replacement template.
+        """
+        self._rules.insert(0, (re.compile(pattern), replacement))
+
+    def dump(self, fqfn: Optional[str] = None, logger: Optional[object] = None) -> dict:
+        """Write the stats to a JSON file and/or log a summary.
+
+        Args:
+            fqfn: The fully qualified filename for the JSON output.
+            logger: A logger to write the summary.
+
+        Returns:
+            dict: The endpoint stats.
+        """
+        stats = self.stats
+        if fqfn is not None:
+            with open(fqfn, 'w') as fh:
+                json.dump(stats, fh, indent=2, sort_keys=True)
+
+        if logger is not None:
+            for endpoint, metrics in stats.items():
+                logger.info(
+                    f'feature=request-metrics, endpoint={endpoint}, count={metrics.get("count")}, '
+                    f'total={metrics.get("total"):.3f}, mean={metrics.get("mean"):.3f}, '
+                    f'p95={metrics.get("p95"):.3f}, max={metrics.get("max"):.3f}, '
+                    f'status={metrics.get("status")}, bytes-in={metrics.get("bytes_in")}, '
+                    f'bytes-out={metrics.get("bytes_out")}'
+                )
+        return stats
+
+    def dump_on_exit(self, fqfn: Optional[str] = None, logger: Optional[object] = None) -> None:
+        """Dump the stats when the interpreter exits (registered only once).
+
+        The metrics are enabled so that the requests are recorded.
+
+        Args:
+            fqfn: The fully qualified filename for the JSON output.
+            logger: A logger to write the summary.
+        """
+        self.enabled = True
+        if not self._dump_registered:
+            self._dump_registered = True
+            atexit.register(self.dump, fqfn, logger)
+
+    def normalize(self, url: str) -> str:
+        """Return the endpoint template for the provided URL.
+
+        Args:
+            url: The request URL.
+        """
+        path = urlparse(url).path or '/'
+        for pattern, replacement in self._rules:
+            path = pattern.sub(replacement, path)
+        return path
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        status: Union[int, str],
+        elapsed: float,
+        bytes_in: Optional[int] = 0,
+        bytes_out: Optional[int] = 0,
+    ) -> None:
+        """Record a request.
+
+        Args:
+            method: The HTTP method.
+            url: The request URL.
+            status: The response status code (or "error" when no response was received).
+            elapsed: The request duration in seconds.
+            bytes_in: The number of bytes received.
+            bytes_out: The number of bytes sent.
+        """
+        key = f'{method.upper()} {self.normalize(url)}'
+        with self._lock:
+            endpoint = self._endpoints.get(key)
+            if endpoint is None:
+                endpoint = self._endpoints[key] = EndpointMetrics()
+            endpoint.add(status, elapsed, bytes_in or 0, bytes_out or 0)
+
+    def record_response(self, response: object, elapsed: float, stream: bool = False) -> None:
+        """Record a requests Response.
+
+        Args:
+            response: The requests Response object.
+            elapsed: The request duration in seconds (including reading the body).
+            stream: If True, the body has not been read and only Content-Length is counted.
+        """
+        request = response.request
+        bytes_in = response.headers.get('Content-Length')
+        if bytes_in is not None and bytes_in.isdigit():
+            bytes_in = int(bytes_in)
+        elif not stream:
+            bytes_in = len(response.content or b'')
+        else:
+            bytes_in = 0
+
+        self.record(
+            request.method,
+            request.url,
+            response.status_code,
+            elapsed,
+            bytes_in,
+            self._body_size(request.body),
+        )
+
+    def reset(self) -> None:
+        """Reset all stats."""
+        with self._lock:
+            self._endpoints = {}
+
+    @property
+    def stats(self) -> dict:
+        """Return the stats for each endpoint, sorted by total time descending."""
+        with self._lock:
+            stats = {key: endpoint.as_dict() for key, endpoint in self._endpoints.items()}
+        return dict(sorted(stats.items(), key=lambda item: item[1].get('total'), reverse=True))
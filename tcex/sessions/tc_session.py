@@ -8,10 +8,12 @@ import time
 
 # third-party
 import urllib3
-from requests import Session, adapters, auth
+from requests import Session, auth
 from urllib3.util.retry import Retry
 
 from ..utils import Utils
+from .pool_adapter import PoolAdapter, PoolTelemetry
+from .request_metrics import RequestMetrics
 
 # disable ssl warning message
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -66,8 +68,12 @@ class TcSession(Session):
 
         # properties
         self._log_curl: bool = False
+        self._pool_config = {}
+        self._rate_limiter = None
         self._token = None
         self.auth = None
+        self.pool_telemetry = PoolTelemetry()
+        self.request_metrics = RequestMetrics()
         self.utils = Utils()
 
         # Add Retry
@@ -107,6 +113,26 @@ class TcSession(Session):
         """Enable or disable logging curl commands."""
         self._log_curl = log_curl
 
+    @property
+    def rate_limiter(self) -> 'RateLimiter':  # noqa: F821
+        """Return the client-side RateLimiter (None when requests are not rate limited)."""
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, rate_limiter: 'RateLimiter'):  # noqa: F821
+        """Set the client-side RateLimiter.
+
+        The RateLimiter spaces out requests proactively using token buckets configured per
+        host/path pattern. A single RateLimiter can be shared by multiple sessions.
+
+        Args:
+            rate_limiter: the RateLimiter object to use.
+        """
+        self._rate_limiter = rate_limiter
+        for adapter in self.adapters.values():
+            if isinstance(adapter, PoolAdapter):
+                adapter.rate_limiter = rate_limiter
+
     @property
     def token(self):
         """Return token."""
@@ -133,7 +159,11 @@ class TcSession(Session):
         # accept path for API calls instead of full URL
         if not url.startswith('https'):
             url = f'{self.base_url}{url}'
-        response = super().request(method, url, **kwargs)
+        response = self._send_request(method, url, **kwargs)
+
+        # skip building log messages entirely when debug logging is disabled
+        if not self.log.isEnabledFor(logging.DEBUG):
+            return response
 
         # don't show curl message for logging commands
         if '/v2/logs/app' not in url:
@@ -155,6 +185,60 @@ class TcSession(Session):
 
         return response
 
+    def _send_request(self, method, url, **kwargs):
+        """Send the request, recording the request metrics."""
+        if not self.request_metrics.enabled:
+            return super().request(method, url, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            response = super().request(method, url, **kwargs)
+        except Exception:
+            self.request_metrics.record(method, url, 'error', time.perf_counter() - start)
+            raise
+        self.request_metrics.record_response(
+            response, time.perf_counter() - start, stream=kwargs.get('stream', False)
+        )
+        return response
+
+    def pool_config(
+        self,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+        keep_alive=False,
+        keep_alive_idle=None,
+        keep_alive_interval=None,
+        keep_alive_count=None,
+    ):
+        """Configure connection pooling.
+
+        The default pool holds 10 connections per host. When more threads share the session,
+        connections beyond the pool size are opened for each request and discarded afterwards.
+        Use pool_telemetry.stats (created/reused/discarded/wait_time) to size the pool.
+
+        Args:
+            pool_connections (int): The number of host connection pools to cache.
+            pool_maxsize (int): The maximum number of connections to keep in each host pool.
+            pool_block (bool): If True, wait for a free connection instead of opening a new one.
+            keep_alive (bool): If True, enable TCP keep-alive on pooled connections.
+            keep_alive_idle (int): Seconds a connection is idle before keep-alive probes are sent.
+            keep_alive_interval (int): Seconds between keep-alive probes.
+            keep_alive_count (int): Number of failed probes before the connection is dropped.
+        """
+        self._pool_config = {
+            'pool_connections': pool_connections,
+            'pool_maxsize': pool_maxsize,
+            'pool_block': pool_block,
+            'keep_alive': keep_alive,
+            'keep_alive_idle': keep_alive_idle,
+            'keep_alive_interval': keep_alive_interval,
+            'keep_alive_count': keep_alive_count,
+        }
+        for adapter in self.adapters.values():
+            if isinstance(adapter, PoolAdapter):
+                adapter.configure(**self._pool_config)
+
     def retry(self, retries=3, backoff_factor=0.3, status_forcelist=(500, 502, 504)):
         """Add retry to Requests Session
 
@@ -168,4 +252,12 @@ class TcSession(Session):
             status_forcelist=status_forcelist,
         )
         # mount all https requests
-        self.mount('https://', adapters.HTTPAdapter(max_retries=retries))
+        self.mount(
+            'https://',
+            PoolAdapter(
+                max_retries=retries,
+                rate_limiter=self.rate_limiter,
+                telemetry=self.pool_telemetry,
+                **self._pool_config,
+            ),
+        )
@@ -50,6 +50,8 @@ class TcEx:
 
         # Property defaults
         self._config: dict = kwargs.get('config') or {}
+        self._api_branch_types = None
+        self._api_entity_types = None
         self._default_args = None
         self._error_codes = None
         self._exit_code = 0
@@ -59,6 +61,7 @@ class TcEx:
         self._jobs = None
         self._key_value_store = None
         self._logger = None
+        self._metadata_cache = None
         self._playbook = None
         self._redis_client = None
         self._service = None
@@ -78,26 +81,48 @@ class TcEx:
 
     def _association_types(self):
         """Retrieve Custom Indicator Associations types from the ThreatConnect API."""
-        # Dynamically create custom indicator class
-        r: object = self.session.get('/v2/types/associationTypes')
 
-        # check for bad status code and response that is not JSON
-        if not r.ok or 'application/json' not in r.headers.get('content-type', ''):
-            self.log.warning('feature=tcex, event=association-types-download, status=failure')
-            return
+        def fetch() -> Optional[dict]:
+            """Retrieve the association types from the API."""
+            r: object = self.session.get('/v2/types/associationTypes')
 
-        # validate successful API results
-        data: dict = r.json()
-        if data.get('status') != 'Success':
-            self.log.warning('feature=tcex, event=association-types-download, status=failure')
-            return
+            # check for bad status code and response that is not JSON
+            if not r.ok or 'application/json' not in r.headers.get('content-type', ''):
+                self.log.warning('feature=tcex, event=association-types-download, status=failure')
+                return None
 
-        try:
-            # Association Type Name is not a unique value at this time, but should be.
-            for association in data.get('data', {}).get('associationType', []):
-                self._indicator_associations_types_data[association.get('name')] = association
-        except Exception as e:
-            self.handle_error(200, [e])
+            # validate successful API results
+            data: dict = r.json()
+            if data.get('status') != 'Success':
+                self.log.warning('feature=tcex, event=association-types-download, status=failure')
+                return None
+
+            association_types = {}
+            try:
+                # Association Type Name is not a unique value at this time, but should be.
+                for association in data.get('data', {}).get('associationType', []):
+                    association_types[association.get('name')] = association
+            except Exception as e:
+                self.handle_error(200, [e])
+            return association_types
+
+        self._indicator_associations_types_data.update(
+            self.metadata_cache.get('association-types', fetch) or {}
+        )
+
+    def _fetch_indicator_types(self) -> dict:
+        """Retrieve the Indicator types from the ThreatConnect API."""
+        indicator_types_data = {}
+
+        # retrieve data from API
+        r = self.session.get('/v2/types/indicatorTypes')
+        # TODO: use handle error instead
+        if not r.ok:
+            raise RuntimeError('Could not retrieve indicator types from ThreatConnect API.')
+
+        for itd in r.json().get('data', {}).get('indicatorType'):
+            indicator_types_data[itd.get('name')] = itd
+        return indicator_types_data
 
     def _signal_handler(
         self, signal_interupt: int, frame: object  # pylint: disable=unused-argument
@@ -453,6 +478,10 @@ class TcEx:
         if self.default_args.tc_log_curl:
             _session.log_curl = True
 
+        # log request metrics on exit if tc_log_request_metrics param is set.
+        if self.default_args.tc_log_request_metrics:
+            _session.request_metrics.dump_on_exit(logger=self.log)
+
         # return session
         return _session
 
@@ -463,7 +492,7 @@ class TcEx:
         """
         from .threat_intelligence import ThreatIntelligence
 
-        return ThreatIntelligence(session=self.get_session())
+        return ThreatIntelligence(session=self.get_session(), metadata_cache=self.metadata_cache)
 
     @property
     def group_types(self) -> list:
@@ -497,6 +526,31 @@ class TcEx:
             'Vulnerability': {'apiBranch': 'vulnerabilities', 'apiEntity': 'vulnerability'},
         }
 
+    def _build_type_indexes(self) -> None:
+        """Build the apiBranch and apiEntity reverse indexes for Group and Indicator types."""
+        self._api_branch_types = {}
+        self._api_entity_types = {}
+        # Group types are searched before Indicator types, the same as the previous linear search
+        merged = self.group_types_data.copy()
+        merged.update(self.indicator_types_data)
+        for key, value in merged.items():
+            # the first match wins
+            self._api_branch_types.setdefault(value.get('apiBranch'), key)
+            self._api_entity_types.setdefault(value.get('apiEntity'), key)
+
+    def get_type_from_api_branch(self, api_branch: str) -> Optional[str]:
+        """Return the object type as a string given a api branch.
+
+        Args:
+            api_branch: The api branch (e.g., addresses or adversaries).
+
+        Returns:
+            str, None: The type value or None.
+        """
+        if self._api_branch_types is None:
+            self._build_type_indexes()
+        return self._api_branch_types.get(api_branch)
+
     def get_type_from_api_entity(self, api_entity: dict) -> Optional[str]:
         """Return the object type as a string given a api entity.
 
@@ -507,12 +561,9 @@ class TcEx:
             str, None: The type value or None.
 
         """
-        merged = self.group_types_data.copy()
-        merged.update(self.indicator_types_data)
-        for key, value in merged.items():
-            if value.get('apiEntity') == api_entity:
-                return key
-        return None
+        if self._api_entity_types is None:
+            self._build_type_indexes()
+        return self._api_entity_types.get(api_entity)
 
     def handle_error(
         self, code: int, message_values: Optional[list] = None, raise_error: Optional[bool] = True
@@ -579,16 +630,9 @@ class TcEx:
             (dict): A dictionary of ThreatConnect Indicator data.
         """
         if not self._indicator_types_data:
-            self._indicator_types_data = {}
-
-            # retrieve data from API
-            r = self.session.get('/v2/types/indicatorTypes')
-            # TODO: use handle error instead
-            if not r.ok:
-                raise RuntimeError('Could not retrieve indicator types from ThreatConnect API.')
-
-            for itd in r.json().get('data', {}).get('indicatorType'):
-                self._indicator_types_data[itd.get('name')] = itd
+            self._indicator_types_data = self.metadata_cache.get(
+                'indicator-types', self._fetch_indicator_types
+            )
         return self._indicator_types_data
 
     @property
@@ -636,6 +680,21 @@ class TcEx:
             self._logger.add_cache_handler('cache')
         return self._logger
 
+    @property
+    def metadata_cache(self) -> 'MetadataCache':  # noqa: F821
+        """Return an instance of the metadata cache for the ThreatConnect instance.
+
+        Indicator types and association types are cached in memory and in the tc_temp_path
+        directory so that short lived Apps do not download them on every execution.
+        """
+        if self._metadata_cache is None:
+            from .datastore import MetadataCache
+
+            self._metadata_cache = MetadataCache(
+                self.default_args.tc_api_path, cache_path=self.default_args.tc_temp_path
+            )
+        return self._metadata_cache
+
     def metric(
         self,
         name: str,
@@ -1039,6 +1098,9 @@ class TcEx:
 
             if self.default_args.tc_log_curl:
                 self._session_external.log_curl = True
+
+            if self.default_args.tc_log_request_metrics:
+                self._session_external.request_metrics.dump_on_exit(logger=self.log)
         return self._session_external
 
     @property
@@ -0,0 +1,240 @@
+"""ThreatConnect Threat Intelligence Association Graph"""
+# standard library
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from urllib.parse import quote, unquote
+
+from .tcex_ti_tc_request import TiTcRequest
+
+# get tcex logger
+logger = logging.getLogger('tcex')
+
+
+class AssociationGraph:
+    """Expand the Indicator/Group association graph with bounded concurrency.
+
+    The graph is expanded breadth first, one level per round, with the association requests
+    for every node in a level issued concurrently. Nodes are memoized by key so that each
+    Indicator or Group is requested at most once regardless of how many paths lead to it.
+
+    Node keys are strings in the format ``<type>:<id>`` where id is the Group ID or the
+    Indicator value (e.g., ``Adversary:12345`` or ``Address:1.1.1.1``).
+
+    Args:
+        ti: An instance of ThreatIntelligence.
+        depth: The number of association hops to expand from the root node.
+        group_types: A list of Group types to include. None includes all Group types and an
+            empty list excludes Groups.
+        indicator_types: A list of Indicator types to include. None includes all Indicator
+            types and an empty list excludes Indicators.
+        max_edges: The maximum number of unique edges to collect.
+        max_nodes: The maximum number of nodes to collect (including the root node).
+        max_workers: The maximum number of concurrent association requests.
+        owner: The ThreatConnect owner name used for association requests.
+        params: Additional query params for association requests.
+    """
+
+    def __init__(
+        self,
+        ti: 'ThreatIntelligence',  # noqa: F821
+        depth: Optional[int] = 1,
+        group_types: Optional[list] = None,
+        indicator_types: Optional[list] = None,
+        max_edges: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+        max_workers: Optional[int] = 8,
+        owner: Optional[str] = None,
+        params: Optional[dict] = None,
+    ):
+        """Initialize Class properties."""
+        self.ti = ti
+        self.depth = depth
+        self.group_types = self._normalize_types(group_types)
+        self.indicator_types = self._normalize_types(indicator_types)
+        self.max_edges = max_edges
+        self.max_nodes = max_nodes
+        self.max_workers = max_workers
+        self.owner = owner
+        self.params = params or {}
+
+        # properties
+        self._adjacent = set()
+        self._aliases = {}
+        self._edges = set()
+        self.adjacency = {}
+        self.expanded = 0
+        self.log = logger
+        self.nodes = {}
+        self.tc_requests = TiTcRequest(ti.session)
+        self.truncated = False
+
+    @staticmethod
+    def _normalize_types(types: Optional[list]) -> Optional[set]:
+        """Return a set of lower case type names or None for all types."""
+        if types is None:
+            return None
+        return {t.lower() for t in types}
+
+    @staticmethod
+    def _indicator_values(summary: str) -> list:
+        """Return the individual values from an Indicator summary (e.g., file hashes)."""
+        return [v.strip() for v in (summary or '').split(' : ') if v.strip()]
+
+    def _include(self, node_type: str, type_name: str) -> bool:
+        """Return True if the type passes the type filters."""
+        types = self.indicator_types if node_type == 'Indicator' else self.group_types
+        return types is None or (type_name or '').lower() in types
+
+    def _neighbor_key(self, node_type: str, record: dict) -> Optional[str]:
+        """Return the node key for an association record, resolving any aliases."""
+        type_name = record.get('type')
+        if node_type == 'Group':
+            return f'{type_name}:{record.get("id")}'
+
+        values = self._indicator_values(record.get('summary'))
+        if not values:
+            return None
+        for value in values:
+            key = self._aliases.get(f'{type_name}:{value}')
+            if key is not None:
+                return key
+
+        key = f'{type_name}:{values[0]}'
+        for value in values:
+            self._aliases[f'{type_name}:{value}'] = key
+        return key
+
+    def _api_branch(self, node_type: str, type_name: str) -> Optional[str]:
+        """Return the API branch for the provided type name."""
+        if node_type == 'Group':
+            types_data = self.ti._group_types_data
+        else:
+            types_data = self.ti._indicator_types_data
+        return types_data.get(type_name, {}).get('apiBranch')
+
+    def _fetch(self, node: tuple) -> list:
+        """Return all Indicator and Group associations for the provided node."""
+        api_type, api_branch, unique_id = node
+        neighbors = []
+        if self.indicator_types is None or self.indicator_types:
+            for record in self.tc_requests.indicator_associations(
+                api_type, api_branch, unique_id, owner=self.owner, params=dict(self.params)
+            ):
+                neighbors.append(('Indicator', record))
+        if self.group_types is None or self.group_types:
+            for record in self.tc_requests.group_associations(
+                api_type, api_branch, unique_id, owner=self.owner, params=dict(self.params)
+            ):
+                neighbors.append(('Group', record))
+        return neighbors
+
+    def _add_edge(self, key: str, neighbor_key: str) -> None:
+        """Add an edge to the graph, listing each neighbor of a node only once."""
+        self._edges.add(tuple(sorted((key, neighbor_key))))
+        if (key, neighbor_key) not in self._adjacent:
+            self._adjacent.add((key, neighbor_key))
+            self.adjacency.setdefault(key, []).append(neighbor_key)
+
+    def _edge_budget_reached(self, key: str, neighbor_key: str) -> bool:
+        """Return True if adding the edge would exceed the edge budget."""
+        if self.max_edges is None or tuple(sorted((key, neighbor_key))) in self._edges:
+            return False
+        if len(self._edges) >= self.max_edges:
+            self.truncated = True
+            return True
+        return False
+
+    def _add_node(self, node_type: str, key: str, record: dict) -> Optional[tuple]:
+        """Add a node to the graph and return the request tuple used to expand it."""
+        if self.max_nodes is not None and len(self.nodes) >= self.max_nodes:
+            self.truncated = True
+            return None
+
+        self.nodes[key] = record
+        api_branch = self._api_branch(node_type, record.get('type'))
+        if api_branch is None:
+            self.log.warning(f'feature=association-graph, event=unknown-type, key={key}')
+            return None
+
+        if node_type == 'Group':
+            unique_id = str(record.get('id'))
+        else:
+            unique_id = quote(self._indicator_values(record.get('summary'))[0], safe='')
+        api_type = 'groups' if node_type == 'Group' else 'indicators'
+        return api_type, api_branch, unique_id
+
+    def expand(self, root: 'Mappings') -> dict:  # noqa: F821
+        """Expand the association graph starting at the provided Indicator or Group.
+
+        Args:
+            root: The Indicator or Group object to start the expansion from.
+
+        Returns:
+            dict: The root node key, the node records, the adjacency lists keyed by node key,
+                whether a budget truncated the expansion, and expansion stats.
+        """
+        if not root.can_update():
+            root._handle_error(910, [root.type])
+
+        unique_id = unquote(str(root.unique_id))
+        root_key = f'{root.api_sub_type}:{unique_id}'
+        if root.is_indicator():
+            self._aliases[root_key] = root_key
+        self.nodes[root_key] = {
+            'id': root.data.get('id'),
+            'type': root.api_sub_type,
+            'summary' if root.is_indicator() else 'name': root.data.get('name') or unique_id,
+        }
+
+        frontier = [(root_key, (root.api_type, root.api_branch, root.unique_id))]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for _ in range(self.depth):
+                if not frontier:
+                    break
+
+                next_frontier = []
+                futures = [executor.submit(self._fetch, node) for _, node in frontier]
+                self.expanded += len(frontier)
+                edge_budget_reached = False
+                for (key, _), future in zip(frontier, futures):
+                    for node_type, record in future.result():
+                        if not self._include(node_type, record.get('type')):
+                            continue
+
+                        neighbor_key = self._neighbor_key(node_type, record)
+                        if neighbor_key is None or neighbor_key == key:
+                            continue
+
+                        if self._edge_budget_reached(key, neighbor_key):
+                            edge_budget_reached = True
+                            break
+
+                        if neighbor_key not in self.nodes:
+                            node = self._add_node(node_type, neighbor_key, record)
+                            if neighbor_key not in self.nodes:
+                                # the node budget has been reached
+                                continue
+                            if node is not None:
+                                next_frontier.append((neighbor_key, node))
+
+                        self._add_edge(key, neighbor_key)
+
+                    if edge_budget_reached:
+                        # stop the expansion, skipping the requests that have not started
+                        for f in futures:
+                            f.cancel()
+                        break
+                frontier = [] if edge_budget_reached else next_frontier
+
+        return {
+            'root': root_key,
+            'nodes': self.nodes,
+            'adjacency': self.adjacency,
+            'truncated': self.truncated,
+            'stats': {
+                'edges': len(self._edges),
+                'expanded': self.expanded,
+                'nodes': len(self.nodes),
+            },
+        }
@@ -8,11 +8,24 @@ from ..mappings import Mappings
 # import local modules for dynamic reference
 module = __import__(__name__)
 
+# custom indicator classes are generated once per process
+_custom_indicator_classes = {}
+
 
 def custom_indicator_class_factory(
     indicator_type, entity_type, branch_type, base_class, value_fields
 ):
     """Build dynamic Custom Indicator Class."""
+    key = (indicator_type, entity_type, branch_type, base_class, tuple(value_fields))
+    if key not in _custom_indicator_classes:
+        _custom_indicator_classes[key] = _custom_indicator_class(
+            indicator_type, entity_type, branch_type, base_class, value_fields
+        )
+    return _custom_indicator_classes[key]
+
+
+def _custom_indicator_class(indicator_type, entity_type, branch_type, base_class, value_fields):
+    """Return a new dynamic Custom Indicator Class."""
 
     @staticmethod
     def _metadata_map_1():
@@ -8,6 +8,7 @@ from urllib.parse import unquote
 
 # first-party
 from tcex.tcex_error_codes import TcExErrorCodes
+from tcex.threat_intelligence.association_graph import AssociationGraph
 from tcex.threat_intelligence.tcex_ti_tc_request import TiTcRequest
 from tcex.utils import Utils
 
@@ -324,13 +325,15 @@ class Mappings:
             params=params,
         )
 
-    def many(self, filters=None, params=None):
+    def many(self, filters=None, params=None, fields=None):
         """
         Gets the Indicator/Group/Victim or Security Labels
         Args:
             filters:
             owner:
             params: parameters to pass in to get the objects
+            fields: Optional list of fields (e.g., ['id', 'summary', 'rating']) to yield as
+                lightweight records instead of the full json
 
         Yields: A Indicator/Group/Victim json
 
@@ -342,6 +345,7 @@ class Mappings:
             owner=self.owner,
             filters=filters,
             params=params,
+            fields=fields,
         )
 
     def request(self, result_limit, result_start, filters=None, params=None):
@@ -532,10 +536,14 @@ class Mappings:
         """
         return self.label(label, action='DELETE')
 
-    def indicator_associations(self, params=None):
+    def indicator_associations(self, params=None, fields=None):
         """
         Gets the indicator association from a Indicator/Group/Victim
 
+        Args:
+            params: parameters to pass in to get the objects
+            fields: Optional list of fields to yield as lightweight records
+
         Yields: Indicator Association
 
         """
@@ -546,13 +554,22 @@ class Mappings:
             params = {}
 
         yield from self.tc_requests.indicator_associations(
-            self.api_type, self.api_branch, self.unique_id, owner=self.owner, params=params
+            self.api_type,
+            self.api_branch,
+            self.unique_id,
+            owner=self.owner,
+            params=params,
+            fields=fields,
         )
 
-    def group_associations(self, params=None):
+    def group_associations(self, params=None, fields=None):
         """
         Gets the group association from a Indicator/Group/Victim
 
+        Args:
+            params: parameters to pass in to get the objects
+            fields: Optional list of fields to yield as lightweight records
+
         Yields: Group Association
 
         """
@@ -563,13 +580,22 @@ class Mappings:
             self._handle_error(910, [self.type])
 
         yield from self.tc_requests.group_associations(
-            self.api_type, self.api_branch, self.unique_id, owner=self.owner, params=params
+            self.api_type,
+            self.api_branch,
+            self.unique_id,
+            owner=self.owner,
+            params=params,
+            fields=fields,
         )
 
-    def victim_asset_associations(self, params=None):
+    def victim_asset_associations(self, params=None, fields=None):
         """
         Gets the victim asset association from a Indicator/Group/Victim
 
+        Args:
+            params: parameters to pass in to get the objects
+            fields: Optional list of fields to yield as lightweight records
+
         Yields: Victim Association json
 
         """
@@ -579,11 +605,16 @@ class Mappings:
             self._handle_error(910, [self.type])
 
         return self.tc_requests.victim_asset_associations(
-            self.api_type, self.api_branch, self.unique_id, owner=self.owner, params=params
+            self.api_type,
+            self.api_branch,
+            self.unique_id,
+            owner=self.owner,
+            params=params,
+            fields=fields,
         )
 
     def indicator_associations_types(
-        self, indicator_type, api_entity=None, api_branch=None, params=None
+        self, indicator_type, api_entity=None, api_branch=None, params=None, fields=None
     ):
         """
         Gets the indicator association from a Indicator/Group/Victim
@@ -593,6 +624,7 @@ class Mappings:
             api_entity:
             api_branch:
             params:
+            fields: Optional list of fields to yield as lightweight records
 
         Returns:
 
@@ -612,9 +644,12 @@ class Mappings:
             api_branch=api_branch,
             owner=self.owner,
             params=params,
+            fields=fields,
         )
 
-    def group_associations_types(self, group_type, api_entity=None, api_branch=None, params=None):
+    def group_associations_types(
+        self, group_type, api_entity=None, api_branch=None, params=None, fields=None
+    ):
         """
         Gets the group association from a Indicator/Group/Victim
 
@@ -623,6 +658,7 @@ class Mappings:
             api_entity:
             api_branch:
             params:
+            fields: Optional list of fields to yield as lightweight records
 
         Returns:
 
@@ -642,6 +678,7 @@ class Mappings:
             api_branch=api_branch,
             owner=self.owner,
             params=params,
+            fields=fields,
         )
 
     def victim_asset_associations_type(self, victim_asset_type, params=None):
@@ -669,6 +706,56 @@ class Mappings:
             params=params,
         )
 
+    def expand_associations(
+        self,
+        depth: Optional[int] = 1,
+        group_types: Optional[list] = None,
+        indicator_types: Optional[list] = None,
+        max_edges: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+        max_workers: Optional[int] = 8,
+        params: Optional[dict] = None,
+    ) -> dict:
+        """Expand the Indicator/Group association graph of this Indicator/Group.
+
+        Each level of the graph is expanded concurrently and every node is requested at
+        most once.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            adversary = tcex.ti.adversary(unique_id=12345)
+            graph = adversary.expand_associations(depth=3, indicator_types=['Address', 'Host'])
+            for neighbor_key in graph.get('adjacency').get(graph.get('root'), []):
+                print(graph.get('nodes').get(neighbor_key))
+
+        Args:
+            depth: The number of association hops to expand.
+            group_types: A list of Group types to include. None includes all Group types and
+                an empty list excludes Groups.
+            indicator_types: A list of Indicator types to include. None includes all
+                Indicator types and an empty list excludes Indicators.
+            max_edges: The maximum number of unique edges to collect.
+            max_nodes: The maximum number of nodes to collect (including this node).
+            max_workers: The maximum number of concurrent association requests.
+            params: Additional query params for the association requests.
+
+        Returns:
+            dict: The association graph (root, nodes, adjacency, truncated and stats).
+        """
+        return AssociationGraph(
+            self.ti,
+            depth=depth,
+            group_types=group_types,
+            indicator_types=indicator_types,
+            max_edges=max_edges,
+            max_nodes=max_nodes,
+            max_workers=max_workers,
+            owner=self.owner,
+            params=params,
+        ).expand(self)
+
     def add_association(self, target, api_type=None, api_branch=None, unique_id=None):
         """
         Adds a association to a Indicator/Group/Victim
@@ -20,6 +20,93 @@ class Tags:
         self._utils = Utils()
         self.ti = ti
 
+    def groups(
+        self,
+        names,
+        group_type=None,
+        filters=None,
+        owner=None,
+        params=None,
+        fields=None,
+        max_workers=8,
+    ):
+        """Get all groups from multiple tags, deduplicated by group id.
+
+        Args:
+            names (list): The tag names.
+            group_type (str, optional): The group type.
+            filters (Filter, optional): A filter object.
+            owner (str, optional): The name of the TC owner.
+            params (dict, optional): Optional dict of query params.
+            fields (list, optional): Optional list of fields to project each group onto.
+            max_workers (int, optional): The maximum number of tags to query concurrently.
+
+        Yields:
+            tuple: The group and the set of tag names it matched, which is complete once the
+                iteration finishes.
+        """
+        if group_type and group_type.lower() == 'task':
+            group = self.ti.task()
+        else:
+            group = self.ti.group(group_type)
+        yield from self.tc_requests.pivot_from_tags(
+            group,
+            names,
+            filters=filters,
+            owner=owner,
+            params=params,
+            fields=fields,
+            max_workers=max_workers,
+        )
+
+    def indicators(
+        self,
+        names,
+        indicator_type=None,
+        filters=None,
+        owner=None,
+        params=None,
+        fields=None,
+        max_workers=8,
+    ):
+        """Get all indicators from multiple tags, deduplicated by indicator id.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            tags = ['MITRE ATT&CK - T1566', 'MITRE ATT&CK - T1059']
+            indicators = tcex.ti.tags().indicators(tags, fields=['summary'])
+            matches = {indicator.summary: matched for indicator, matched in indicators}
+
+            # the matched tags are complete once the iteration finishes
+            for summary, matched in matches.items():
+                print(summary, sorted(matched))
+
+        Args:
+            names (list): The tag names.
+            indicator_type (str, optional): The indicator type.
+            filters (Filter, optional): A filter object.
+            owner (str, optional): The name of the TC owner.
+            params (dict, optional): Optional dict of query params.
+            fields (list, optional): Optional list of fields to project each indicator onto.
+            max_workers (int, optional): The maximum number of tags to query concurrently.
+
+        Yields:
+            tuple: The indicator and the set of tag names it matched, which is complete once the
+                iteration finishes.
+        """
+        indicator = self.ti.indicator(indicator_type)
+        yield from self.tc_requests.pivot_from_tags(
+            indicator,
+            names,
+            filters=filters,
+            owner=owner,
+            params=params,
+            fields=fields,
+            max_workers=max_workers,
+        )
+
     def many(self, filters=None, owners=None, params=None):
         """Get all the tags."""
         for tag in self.tc_requests.all_tags(filters=filters, owners=owners, params=params):
@@ -0,0 +1,171 @@
+"""ThreatConnect Threat Intelligence Single-Flight Request Coalescing"""
+# standard library
+import logging
+import threading
+import weakref
+from typing import Any, Callable, Hashable, Optional
+
+# get tcex logger
+logger = logging.getLogger('tcex')
+
+
+class _Call:
+    """An in-flight call shared by the leader and any waiters."""
+
+    __slots__ = ('done', 'error', 'result', 'waiters')
+
+    def __init__(self):
+        """Initialize Class properties."""
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+        self.result: Any = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls into a single in-flight call.
+
+    The first caller for a given key (the leader) executes the call while any concurrent
+    callers for the same key (the waiters) block until the leader finishes and then share
+    its result. Once the leader finishes the key is released, so results are never cached
+    beyond the lifetime of the in-flight call.
+
+    Args:
+        max_inflight: The maximum number of distinct keys tracked at once. When the limit is
+            reached new keys bypass coalescing and are executed directly.
+        timeout: The number of seconds a waiter will wait on the leader before falling back
+            to executing the call itself.
+    """
+
+    _registry = weakref.WeakKeyDictionary()
+    _registry_lock = threading.Lock()
+
+    def __init__(self, max_inflight: Optional[int] = 1000, timeout: Optional[float] = 60):
+        """Initialize Class properties."""
+        self.max_inflight = max_inflight
+        self.timeout = timeout
+
+        # properties
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.log = logger
+        self._stats = {'bypassed': 0, 'coalesced': 0, 'errors': 0, 'executed': 0, 'timeouts': 0}
+
+    @classmethod
+    def for_session(
+        cls, session: object, create: Optional[bool] = True
+    ) -> Optional['SingleFlight']:
+        """Return the SingleFlight instance shared by all users of the provided session.
+
+        Args:
+            session: The Requests Session the in-flight calls are made with.
+            create: If True, the instance is created if the session does not have one.
+
+        Returns:
+            SingleFlight: The shared instance for the session or None if the session does not
+                have one and create is False.
+        """
+        with cls._registry_lock:
+            single_flight = cls._registry.get(session)
+            if single_flight is None and create:
+                single_flight = cls()
+                cls._registry[session] = single_flight
+            return single_flight
+
+    @classmethod
+    def remove_session(cls, session: object) -> None:
+        """Remove the SingleFlight instance shared by all users of the provided session.
+
+        Args:
+            session: The Requests Session the in-flight calls are made with.
+        """
+        with cls._registry_lock:
+            cls._registry.pop(session, None)
+
+    def _incr(self, stat: str) -> None:
+        """Increment a stat counter (caller must hold the lock)."""
+        self._stats[stat] += 1
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """Execute fn or join an identical in-flight call and return the shared result.
+
+        Args:
+            key: The key that identifies identical calls.
+            fn: The callable to execute.
+            *args: The positional args passed to fn.
+            **kwargs: The keyword args passed to fn.
+
+        Returns:
+            Any: The result of the (possibly shared) call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                leader = False
+            elif len(self._calls) >= self.max_inflight:
+                self._incr('bypassed')
+                call = None
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if call is None:
+            # the in-flight limit was reached, execute call directly
+            return fn(*args, **kwargs)
+
+        if not leader:
+            if not call.done.wait(self.timeout):
+                with self._lock:
+                    self._incr('timeouts')
+                self.log.warning(f'feature=single-flight, event=waiter-timeout, key={key}')
+                return fn(*args, **kwargs)
+
+            with self._lock:
+                self._incr('coalesced')
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._incr('executed')
+                if call.error is not None:
+                    self._incr('errors')
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    @property
+    def inflight(self) -> int:
+        """Return the current number of in-flight calls."""
+        with self._lock:
+            return len(self._calls)
+
+    def reset_stats(self) -> None:
+        """Reset the coalescing stats."""
+        with self._lock:
+            for stat in self._stats:
+                self._stats[stat] = 0
+
+    @property
+    def stats(self) -> dict:
+        """Return the coalescing stats.
+
+        * executed - calls executed by a leader
+        * coalesced - calls that received a result from a leader
+        * bypassed - calls executed directly because max_inflight was reached
+        * timeouts - waiters that gave up on the leader and executed the call directly
+        * errors - leader calls that raised an exception
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['inflight'] = len(self._calls)
+        return stats
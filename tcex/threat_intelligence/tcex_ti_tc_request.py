@@ -2,6 +2,10 @@
 # standard library
 import hashlib
 import logging
+import queue
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import Optional
 from urllib.parse import quote
@@ -10,25 +14,69 @@ from urllib.parse import quote
 from requests import Session
 
 # first-party
+from tcex.logger.trace_logger import TRACE
 from tcex.tcex_error_codes import TcExErrorCodes
 
+from .single_flight import SingleFlight
+
 # import local modules for dynamic reference
 module = __import__(__name__)
 
 # get tcex logger
 logger = logging.getLogger('tcex')
 
+# fields that are only returned by the API when includeAdditional is enabled
+ADDITIONAL_FIELDS = {
+    'description',
+    'dnsActive',
+    'falsePositiveCount',
+    'falsePositiveLastReported',
+    'lastObserved',
+    'observationCount',
+    'source',
+    'threatAssessConfidence',
+    'threatAssessRating',
+    'threatAssessScore',
+    'threatAssessScoreFalsePositive',
+    'threatAssessScoreObserved',
+    'whoisActive',
+}
+
+
+@lru_cache()
+def projection_record(fields: tuple) -> type:
+    """Return a lightweight record class (namedtuple) for the provided projection fields.
+
+    Field names that are not valid attribute names (e.g., keywords or duplicates) are renamed
+    to their position (e.g., "_1"), the values are still available by index.
+
+    Args:
+        fields: The API field names (e.g., ('id', 'summary', 'rating', 'lastModified')).
+
+    Returns:
+        type: A namedtuple class with one attribute per field.
+    """
+    return namedtuple('TiRecord', fields, rename=True)
+
 
 class TiTcRequest:
     """Common API calls to ThreatConnect"""
 
-    def __init__(self, session: Session) -> None:
-        """Initialize Class properties."""
+    def __init__(self, session: Session, single_flight: Optional[SingleFlight] = None) -> None:
+        """Initialize Class properties.
+
+        Args:
+            session: The ThreatConnect Requests Session.
+            single_flight: The single-flight instance used to coalesce concurrent identical GET
+                requests. Defaults to the instance shared by all users of the session if
+                coalescing was enabled (e.g., ``tcex.ti.coalesce_requests = True``).
+        """
         self.session = session
 
         # properties
         self.log = logger
         self.result_limit = 10000
+        self.single_flight = single_flight
 
     def _delete(self, url, params=None):
         """Delete data from API."""
@@ -36,14 +84,7 @@ class TiTcRequest:
         params['createActivityLog'] = params.get('createActivityLog') or 'false'
 
         r = self.session.delete(url, params=params)
-        self.log.debug(
-            f'Method: ({r.request.method.upper()}), '
-            f'Params: ({params}), '
-            f'Status Code: {r.status_code}, '
-            f'URL: ({r.url})'
-        )
-        if len(r.content) < 500:
-            self.log.trace(f'response: {r.text}')
+        self._log_request(r, params)
         if not r.ok:
             err = r.text or r.reason
             self.log.error(f'Error deleting data ({err}')
@@ -55,21 +96,33 @@ class TiTcRequest:
         """Return TcEx error codes."""
         return TcExErrorCodes()
 
-    def _get(self, url, params=None):
-        """Delete data from API."""
+    def _get(self, url, params=None, coalesce=True):
+        """Get data from API.
+
+        When coalescing is enabled, concurrent identical GET requests share a single in-flight
+        request and the same Response object, which must not be modified by the caller.
+
+        Args:
+            url (str): The URL for the request.
+            params (dict): The query params for the request.
+            coalesce (bool): If False, the request is always sent, even when coalescing is
+                enabled.
+        """
         params = params or {}
         params['createActivityLog'] = params.get('createActivityLog') or 'false'
 
-        r = self.session.get(url, params=params)
-
-        self.log.debug(
-            f'Method: ({r.request.method.upper()}), '
-            f'Params: ({params}), '
-            f'Status Code: {r.status_code}, '
-            f'URL: ({r.url})'
-        )
-        if len(r.content) < 500:
-            self.log.trace(f'response: {r.text}')
+        single_flight = None
+        if coalesce:
+            single_flight = self.single_flight or SingleFlight.for_session(
+                self.session, create=False
+            )
+        if single_flight is not None:
+            # concurrent identical GET requests share a single in-flight request
+            key = ('GET', url, tuple(sorted((k, str(v)) for k, v in params.items())))
+            r = single_flight.do(key, self.session.get, url, params=dict(params))
+        else:
+            r = self.session.get(url, params=params)
+        self._log_request(r, params)
         if not r.ok:
             err = r.text or r.reason
             self.log.error(f'Error getting data ({err}')
@@ -104,13 +157,28 @@ class TiTcRequest:
         if raise_error:
             raise RuntimeError(code, message)
 
-    def _iterate(self, url, params, api_entity):
-        """Iterate over API pagination."""
-        safe_params = params.copy()
+    def _iterate(self, url, params, api_entity, fields=None):
+        """Iterate over API pagination.
+
+        When fields are provided each entity is yielded as a lightweight record containing
+        only the requested fields instead of the full dict returned by the API.
+        """
+        # the params are updated for each page, so the caller's params are not modified
+        safe_params = dict(params or {})
         safe_params['resultLimit'] = self.result_limit
 
+        record = None
+        if fields:
+            fields = tuple(fields)
+            record = projection_record(fields)
+            if ADDITIONAL_FIELDS.isdisjoint(fields):
+                # only request the additional fields when they are part of the projection
+                safe_params.pop('includeAdditional', None)
+            else:
+                safe_params['includeAdditional'] = 'true'
+
         should_iterate = True
-        result_start = params.get('resultStart', 0)
+        result_start = safe_params.get('resultStart', 0)
         try:
             result_start = int(result_start)
         except Exception:
@@ -130,24 +198,46 @@ class TiTcRequest:
                 should_iterate = False
             result_start += self.result_limit
 
-            yield from data
+            if record is not None:
+                for d in data:
+                    yield record._make([d.get(f) for f in fields])
+            else:
+                yield from data
 
-    def _post(self, url, data, params=None):
-        """Post data to API."""
-        params = params or {}
-        params['createActivityLog'] = params.get('createActivityLog') or 'false'
+    def _log_request(self, r, params: dict, body: Optional[object] = None) -> None:
+        """Log the request and response.
+
+        The message formatting and response decoding are skipped entirely unless the debug
+        (request) or trace (body and response) log level is enabled.
+
+        Args:
+            r (requests.Response): The response object.
+            params: The request query params.
+            body: The request body to log at trace level.
+        """
+        if not self.log.isEnabledFor(logging.DEBUG):
+            return
 
-        r = self.session.post(url, data=data, params=params)
         self.log.debug(
             f'Method: ({r.request.method.upper()}), '
             f'Params: ({params}), '
             f'Status Code: {r.status_code}, '
             f'URL: ({r.url})'
         )
-        if len(data) < 50 and not isinstance(data, bytes):
-            self.log.trace(f'body: {data}')
-        if len(r.content) < 500:
-            self.log.trace(f'response: {r.text}')
+        if self.log.isEnabledFor(TRACE):
+            if body is not None:
+                self.log.trace(f'body: {body}')
+            if len(r.content) < 500:
+                self.log.trace(f'response: {r.text}')
+
+    def _post(self, url, data, params=None):
+        """Post data to API."""
+        params = params or {}
+        params['createActivityLog'] = params.get('createActivityLog') or 'false'
+
+        r = self.session.post(url, data=data, params=params)
+        body = data if len(data) < 50 and not isinstance(data, bytes) else None
+        self._log_request(r, params, body)
         if not r.ok:
             err = r.text or r.reason
             self.log.error(f'Error posting data ({err}')
@@ -159,15 +249,7 @@ class TiTcRequest:
         params['createActivityLog'] = params.get('createActivityLog') or 'false'
 
         r = self.session.post(url, json=json_data, params=params)
-        self.log.debug(
-            f'Method: ({r.request.method.upper()}), '
-            f'Params: ({params}), '
-            f'Status Code: {r.status_code}, '
-            f'URL: ({r.url})'
-        )
-        self.log.trace(f'body: {json_data}')
-        if len(r.content) < 500:
-            self.log.trace(f'response: {r.text}')
+        self._log_request(r, params, json_data)
         if not r.ok:
             err = r.text or r.reason
             self.log.error(f'Error posting data ({err}')
@@ -179,16 +261,8 @@ class TiTcRequest:
         params['createActivityLog'] = params.get('createActivityLog') or 'false'
 
         r = self.session.put(url, json=json_data, params=params)
-        self.log.debug(
-            f'Method: ({r.request.method.upper()}), '
-            f'Params: ({params}), '
-            f'Status Code: {r.status_code}, '
-            f'URL: ({r.url})'
-        )
-        if len(json_data) < 50 and not isinstance(json_data, bytes):
-            self.log.trace(f'body: {json_data}')
-        if len(r.content) < 500:
-            self.log.trace(f'response: {r.text}')
+        body = json_data if len(json_data) < 50 and not isinstance(json_data, bytes) else None
+        self._log_request(r, params, body)
         if not r.ok:
             err = r.text or r.reason
             self.log.error(f'Error updating data ({err}')
@@ -495,7 +569,9 @@ class TiTcRequest:
 
         return self.adversary_url_asset(unique_id, asset_id, params=params)
 
-    def many(self, main_type, sub_type, api_entity, owner=None, filters=None, params=None):
+    def many(
+        self, main_type, sub_type, api_entity, owner=None, filters=None, params=None, fields=None
+    ):
         """Update a TI object in the API.
 
         Args:
@@ -505,6 +581,8 @@ class TiTcRequest:
             owner (str): The name of the TC owner.
             filters (Filter, optional): A filter object.
             params (dict, optional): Optional dict of query params.
+            fields (list, optional): Project each entity onto a lightweight record containing
+                only these fields (e.g., ['id', 'summary', 'rating', 'lastModified']).
 
         Yields:
             request.Response: The response from the API call.
@@ -524,7 +602,7 @@ class TiTcRequest:
         if sub_type:
             url = f'/v2/{main_type}/{sub_type}'
 
-        yield from self._iterate(url, params, api_entity)
+        yield from self._iterate(url, params, api_entity, fields=fields)
 
     def mine(self):
         """Get owner mine data."""
@@ -1059,7 +1137,7 @@ class TiTcRequest:
             url = f'/v2/{main_type}/{sub_type}/{unique_id}/pdf'
         return self._get(url)
 
-    def pivot_from_tag(self, target, tag_name, filters=None, owner=None, params=None):
+    def pivot_from_tag(self, target, tag_name, filters=None, owner=None, params=None, fields=None):
         """
 
         Args:
@@ -1068,6 +1146,7 @@ class TiTcRequest:
             target:
             tag_name:
             params:
+            fields: Optional list of fields to project each entity onto.
 
         Return:
 
@@ -1086,7 +1165,101 @@ class TiTcRequest:
             url = f'/v2/tags/{tag_name}/{api_type}/{sub_type}'
         else:
             url = f'/v2/tags/{tag_name}/{api_type}/'
-        return self._iterate(url, params, api_entity)
+        return self._iterate(url, params, api_entity, fields=fields)
+
+    def pivot_from_tags(
+        self, target, tag_names, filters=None, owner=None, params=None, fields=None, max_workers=8
+    ):
+        """Pivot from multiple tags concurrently, merging the results by entity id.
+
+        Each tag is queried in a worker thread and each unique entity is yielded as soon as it
+        is first received, through a bounded queue, so the entities are never all held in
+        memory. Only the set of tag names matched by each entity id is kept.
+
+        The yielded set of tag names grows as the entity is matched by later tags and is
+        complete once the iteration finishes. Keep a reference to the set and read it after the
+        iteration if every matched tag is required.
+
+        Args:
+            target: The Group/Indicator/Victim object for the pivot (e.g., ti.group('Adversary')).
+            tag_names (list): The tag names to pivot from.
+            filters (Filter, optional): A filter object.
+            owner (str, optional): The name of the TC owner.
+            params (dict, optional): Optional dict of query params.
+            fields (list, optional): Project each entity onto a lightweight record containing
+                only these fields. The id field is always included.
+            max_workers (int, optional): The maximum number of tags to query concurrently.
+
+        Yields:
+            tuple: The entity (dict or record) and the set of tag names it matched.
+        """
+        if fields and 'id' not in fields:
+            fields = ['id'] + list(fields)
+
+        lock = threading.Lock()
+        # the tag names matched by each entity id
+        matched = {}
+        # the entities waiting to be yielded, the workers wait when the queue is full
+        results = queue.Queue(maxsize=1000)
+        stopped = threading.Event()
+        tag_done = object()
+
+        def put(item):
+            """Put an item on the queue unless the iteration was stopped."""
+            while not stopped.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def pivot(tag_name):
+            """Queue the entities for a single tag that have not been seen yet."""
+            try:
+                for entity in self.pivot_from_tag(
+                    target,
+                    tag_name,
+                    filters=filters,
+                    owner=owner,
+                    params=dict(params or {}),
+                    fields=fields,
+                ):
+                    if stopped.is_set():
+                        break
+
+                    entity_id = entity.id if fields else entity.get('id')
+                    with lock:
+                        tags = matched.get(entity_id)
+                        if tags is not None:
+                            tags.add(tag_name)
+                            continue
+                        tags = matched[entity_id] = {tag_name}
+                    put((entity, tags))
+            except Exception as e:
+                # raised by the iteration
+                put(e)
+            finally:
+                put(tag_done)
+
+        tag_names = set(tag_names)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for tag_name in tag_names:
+                executor.submit(pivot, tag_name)
+
+            pending = len(tag_names)
+            while pending:
+                item = results.get()
+                if item is tag_done:
+                    pending -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            # stop the workers when the iteration finishes, fails, or is closed early
+            stopped.set()
+            executor.shutdown(wait=False)
 
     def groups_from_tag(self, group, tag_name, filters=None, owner=None, params=None):
         """
@@ -1138,7 +1311,9 @@ class TiTcRequest:
             victim, tag_name, filters=filters, owner=owner, params=params
         )
 
-    def indicator_associations(self, main_type, sub_type, unique_id, owner=None, params=None):
+    def indicator_associations(
+        self, main_type, sub_type, unique_id, owner=None, params=None, fields=None
+    ):
         """
 
         Args:
@@ -1147,6 +1322,7 @@ class TiTcRequest:
             sub_type:
             unique_id:
             params:
+            fields: Optional list of fields to project each association onto.
 
         Return:
 
@@ -1160,9 +1336,11 @@ class TiTcRequest:
         else:
             url = f'/v2/{main_type}/{sub_type}/{unique_id}/indicators'
 
-        yield from self._iterate(url, params, 'indicator')
+        yield from self._iterate(url, params, 'indicator', fields=fields)
 
-    def group_associations(self, main_type, sub_type, unique_id, owner=None, params=None):
+    def group_associations(
+        self, main_type, sub_type, unique_id, owner=None, params=None, fields=None
+    ):
         """
 
         Args:
@@ -1171,6 +1349,7 @@ class TiTcRequest:
             sub_type:
             unique_id:
             params:
+            fields: Optional list of fields to project each association onto.
 
         Return:
 
@@ -1184,10 +1363,10 @@ class TiTcRequest:
         else:
             url = f'/v2/{main_type}/{sub_type}/{unique_id}/groups'
 
-        yield from self._iterate(url, params, 'group')
+        yield from self._iterate(url, params, 'group', fields=fields)
 
     def victim_asset_associations(
-        self, main_type, sub_type, unique_id, asset_type=None, owner=None, params=None
+        self, main_type, sub_type, unique_id, asset_type=None, owner=None, params=None, fields=None
     ):
         """
 
@@ -1198,6 +1377,7 @@ class TiTcRequest:
             unique_id:
             asset_type:
             params:
+            fields: Optional list of fields to project each association onto.
 
         Return:
 
@@ -1214,7 +1394,7 @@ class TiTcRequest:
         if asset_type:
             url = f'{url}/{asset_type}'
 
-        yield from self._iterate(url, params, 'victimAsset')
+        yield from self._iterate(url, params, 'victimAsset', fields=fields)
 
     def indicator_associations_types(
         self,
@@ -1226,6 +1406,7 @@ class TiTcRequest:
         api_entity=None,
         owner=None,
         params=None,
+        fields=None,
     ):
         """
 
@@ -1238,6 +1419,7 @@ class TiTcRequest:
             api_branch:
             api_entity:
             params:
+            fields: Optional list of fields to project each association onto.
 
         Return:
 
@@ -1253,7 +1435,7 @@ class TiTcRequest:
         else:
             url = f'/v2/{main_type}/{sub_type}/{unique_id}/indicators/{api_branch}'
 
-        yield from self._iterate(url, params, api_entity)
+        yield from self._iterate(url, params, api_entity, fields=fields)
 
     def group_associations_types(
         self,
@@ -1265,6 +1447,7 @@ class TiTcRequest:
         api_entity=None,
         owner=None,
         params=None,
+        fields=None,
     ):
         """
         Args:
@@ -1276,6 +1459,7 @@ class TiTcRequest:
             api_branch:
             api_entity:
             params:
+            fields: Optional list of fields to project each association onto.
 
         Return:
 
@@ -1297,7 +1481,7 @@ class TiTcRequest:
         else:
             url = f'/v2/{main_type}/{sub_type}/{unique_id}/groups/{api_branch}'
 
-        yield from self._iterate(url, params, api_entity)
+        yield from self._iterate(url, params, api_entity, fields=fields)
 
     def add_association(
         self,
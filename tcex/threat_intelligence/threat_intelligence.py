@@ -9,6 +9,7 @@ import inflect
 from requests import Session
 
 # first-party
+from tcex.datastore import MetadataCache
 from tcex.tcex_error_codes import TcExErrorCodes
 from tcex.utils import Utils
 
@@ -41,6 +42,7 @@ from .mappings.tag import Tag
 from .mappings.tags import Tags
 from .mappings.task import Task
 from .mappings.victim import Victim
+from .single_flight import SingleFlight
 
 p = inflect.engine()
 
@@ -52,11 +54,20 @@ logger = logging.getLogger('tcex')
 
 
 class ThreatIntelligence:
-    """ThreatConnect Threat Intelligence Module"""
+    """ThreatConnect Threat Intelligence Module
 
-    def __init__(self, session: Session) -> None:
+    Args:
+        session: An configured instance of request.Session with TC API Auth.
+        metadata_cache: The metadata cache for the ThreatConnect instance. Defaults to a memory
+            only cache.
+    """
+
+    def __init__(self, session: Session, metadata_cache: Optional[MetadataCache] = None) -> None:
         """Initialize Class properties."""
         self.session = session
+        self.metadata_cache = metadata_cache or MetadataCache(
+            getattr(self.session, 'base_url', None)
+        )
 
         # properties
         self._custom_indicator_classes = {}
@@ -132,19 +143,24 @@ class ThreatIntelligence:
         Returns:
             (dict): A dictionary of ThreatConnect Indicator data.
         """
-        _indicator_types_data = {}
 
-        # retrieve data from API
-        r = self.session.get('/v2/types/indicatorTypes')
+        def fetch() -> dict:
+            """Retrieve the indicator types from the API."""
+            _indicator_types_data = {}
+
+            # retrieve data from API
+            r = self.session.get('/v2/types/indicatorTypes')
 
-        # TODO: use handle error instead
-        if not r.ok:
-            raise RuntimeError('Could not retrieve indicator types from ThreatConnect API.')
+            # TODO: use handle error instead
+            if not r.ok:
+                raise RuntimeError('Could not retrieve indicator types from ThreatConnect API.')
 
-        for itd in r.json().get('data', {}).get('indicatorType'):
-            _indicator_types_data[itd.get('name')] = itd
+            for itd in r.json().get('data', {}).get('indicatorType'):
+                _indicator_types_data[itd.get('name')] = itd
 
-        return _indicator_types_data
+            return _indicator_types_data
+
+        return self.metadata_cache.get('indicator-types', fetch)
 
     def _handle_error(
         self, code: int, message_values: Optional[list] = None, raise_error: Optional[bool] = True
@@ -276,10 +292,8 @@ class ThreatIntelligence:
         }
 
         indicator_type = indicator_type.lower()
-        for custom_type in self._custom_indicator_classes:
-            for a in dir(module):
-                if a.lower() == custom_type.replace(' ', ''):
-                    indicator_type_map[custom_type.lower()] = getattr(module, a)
+        for custom_type, custom_indicator_data in self._custom_indicator_classes.items():
+            indicator_type_map[custom_type] = custom_indicator_data.get('class')
 
         if indicator_type not in indicator_type_map:
             raise RuntimeError(f'Invalid indicator type "{indicator_type}" provided.')
@@ -578,6 +592,40 @@ class ThreatIntelligence:
         """Create the Owner object."""
         return Owner(self)
 
+    @property
+    def coalesce_requests(self) -> bool:
+        """Return True if concurrent identical GET requests are coalesced."""
+        return SingleFlight.for_session(self.session, create=False) is not None
+
+    @coalesce_requests.setter
+    def coalesce_requests(self, enabled: bool) -> None:
+        """Enable or disable coalescing of concurrent identical GET requests.
+
+        When enabled, threads sending the same GET request (method, URL, and params) at the
+        same time share a single in-flight request and the same Response object. The shared
+        Response must not be modified (e.g., setting r.encoding) by the App.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            tcex.ti.coalesce_requests = True
+        """
+        if enabled:
+            SingleFlight.for_session(self.session)
+        else:
+            SingleFlight.remove_session(self.session)
+
+    @property
+    def single_flight(self) -> Optional[SingleFlight]:
+        """Return the single-flight instance used to coalesce concurrent identical GET requests.
+
+        The instance is shared by all TI objects using this session, so the coalescing stats
+        (e.g., ``tcex.ti.single_flight.stats``) cover every GET made through the TI module.
+        None is returned if coalescing is not enabled.
+        """
+        return SingleFlight.for_session(self.session, create=False)
+
     def create_entity(self, entity, owner):
         """Given a Entity and a Owner, creates a indicator/group in ThreatConnect"""
 
@@ -846,6 +894,8 @@ class ThreatIntelligence:
         """Generate Custom Indicator Classes."""
 
         for entry in self._indicator_types_data.values():
+            # the entries are shared with the metadata cache, update a copy
+            entry = dict(entry)
             name = entry.get('name')
             class_name = name.replace(' ', '')
             # temp fix for API issue where boolean are returned as strings
@@ -878,6 +928,7 @@ class ThreatIntelligence:
 
             custom_indicator_data = {
                 'branch': entry.get('apiBranch'),
+                'class': custom_class,
                 'entry': entry.get('apiEntry'),
                 'value_fields': value_fields,
             }
@@ -11,6 +11,16 @@ from urllib3.util.retry import Retry
 
 from ..utils import Utils
 
+try:
+    # standard library
+    from contextvars import ContextVar
+except ImportError:  # pragma: no cover
+    # Python 3.6, the ASGI mode of the ApiService is not supported
+    ContextVar = None
+
+# the token key of the current asyncio task (e.g., an ASGI request), used before the thread name
+token_key = ContextVar('token_key', default=None) if ContextVar is not None else None
+
 
 def retry_session(retries=3, backoff_factor=0.8, status_forcelist=(500, 502, 504)):
     """Add retry to Requests Session.
@@ -66,7 +76,11 @@ class Tokens:
     def key(self) -> str:
         """Return the current key"""
         key = 'MainThread'  # default Python parent thread name
-        if self.thread_name in self.token_map:
+        context_key = token_key.get() if token_key is not None else None
+        if context_key is not None and context_key in self.token_map:
+            # for ApiService Apps in ASGI mode the key is set for each request.
+            key: str = context_key
+        elif self.thread_name in self.token_map:
             # for Job, Playbook, and ApiService Apps the key is the thread name.
             key: str = self.thread_name
         elif self.trigger_id in self.token_map:
@@ -0,0 +1,79 @@
+"""TcEx Framework JSON Codec Module"""
+# standard library
+import json
+from typing import Any, Optional, Union
+
+try:
+    # third-party
+    import orjson
+except ImportError:
+    # orjson is optional, the standard library json module is used when it is not installed
+    orjson = None
+
+
+class JsonCodec:
+    """JSON codec that uses orjson when it is installed and the json module otherwise.
+
+    Values orjson does not support (e.g., integers larger than 64 bits, NaN literals, or non
+    string dict keys) fall back to the json module, so the codec accepts the same data as the
+    json module. Encoded data is compact (no whitespace after separators) and decoded objects
+    are plain (insertion ordered) dicts.
+
+    Args:
+        accelerated: If False, the json module is always used.
+    """
+
+    def __init__(self, accelerated: Optional[bool] = True):
+        """Initialize Class properties."""
+        self.accelerated = accelerated and orjson is not None
+
+    @property
+    def name(self) -> str:
+        """Return the name of the JSON library in use."""
+        return 'orjson' if self.accelerated else 'json'
+
+    def dumps(self, obj: Any) -> str:
+        """Return the JSON encoded string for the object.
+
+        Args:
+            obj: The object to encode.
+        """
+        if self.accelerated:
+            try:
+                return orjson.dumps(obj).decode('utf-8')
+            except TypeError:
+                pass
+        return json.dumps(obj, separators=(',', ':'))
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """Return the JSON encoded UTF-8 bytes for the object.
+
+        Args:
+            obj: The object to encode.
+        """
+        if self.accelerated:
+            try:
+                return orjson.dumps(obj)
+            except TypeError:
+                pass
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Return the object decoded from JSON data.
+
+        Args:
+            data: The JSON data.
+
+        Raises:
+            ValueError: If the data is not valid JSON.
+        """
+        if self.accelerated:
+            try:
+                return orjson.loads(data)
+            except ValueError:
+                pass
+        return json.loads(data)
+
+
+# the codec shared by the playbook, batch, and key value store modules
+json_codec = JsonCodec()
@@ -0,0 +1,101 @@
+"""Test the TcEx MetadataCache Module."""
+# standard library
+import os
+import time
+from unittest.mock import MagicMock
+
+# first-party
+from tcex.datastore import MetadataCache
+
+
+class TestMetadataCache:
+    """Test the TcEx MetadataCache Module."""
+
+    @staticmethod
+    def test_get_memory(tmp_path):
+        """Test data is fetched once and then served from memory."""
+        fetch = MagicMock(return_value={'Address': {'apiBranch': 'addresses'}})
+        cache = MetadataCache('https://memory.example.com/api', cache_path=str(tmp_path))
+        cache.invalidate('indicator-types')
+
+        assert cache.get('indicator-types', fetch) == {'Address': {'apiBranch': 'addresses'}}
+        assert cache.get('indicator-types', fetch) == {'Address': {'apiBranch': 'addresses'}}
+        fetch.assert_called_once()
+
+    @staticmethod
+    def test_get_disk(tmp_path):
+        """Test data is served from disk in a new process (empty memory cache)."""
+        base_url = 'https://disk.example.com/api'
+        cache = MetadataCache(base_url, cache_path=str(tmp_path))
+        cache.invalidate('indicator-types')
+        cache.get('indicator-types', lambda: {'Host': {'apiBranch': 'hosts'}})
+
+        # simulate a new process
+        MetadataCache._memory.clear()
+
+        fetch = MagicMock()
+        cache = MetadataCache(base_url, cache_path=str(tmp_path))
+        assert cache.get('indicator-types', fetch) == {'Host': {'apiBranch': 'hosts'}}
+        fetch.assert_not_called()
+
+    @staticmethod
+    def test_get_expired(tmp_path):
+        """Test expired disk data is fetched again."""
+        base_url = 'https://expired.example.com/api'
+        cache = MetadataCache(base_url, cache_path=str(tmp_path), ttl_seconds=60)
+        cache.invalidate('association-types')
+        cache.get('association-types', lambda: {'old': {}})
+
+        # expire the disk and memory entries
+        MetadataCache._memory.clear()
+        expired = time.time() - 120
+        os.utime(cache._fqfn('association-types'), (expired, expired))
+
+        assert cache.get('association-types', lambda: {'new': {}}) == {'new': {}}
+
+    @staticmethod
+    def test_get_failure_not_cached(tmp_path):
+        """Test a failed fetch is not cached."""
+        cache = MetadataCache('https://failure.example.com/api', cache_path=str(tmp_path))
+        cache.invalidate('association-types')
+
+        assert cache.get('association-types', lambda: None) is None
+        assert cache.get('association-types', lambda: {'ok': {}}) == {'ok': {}}
+
+    @staticmethod
+    def test_base_url_isolation(tmp_path):
+        """Test entries for different instances are not shared."""
+        one = MetadataCache('https://one.example.com/api', cache_path=str(tmp_path))
+        two = MetadataCache('https://two.example.com/api', cache_path=str(tmp_path))
+        one.invalidate('indicator-types')
+        two.invalidate('indicator-types')
+
+        one.get('indicator-types', lambda: {'one': {}})
+        assert two.get('indicator-types', lambda: {'two': {}}) == {'two': {}}
+
+    @staticmethod
+    def test_memory_only():
+        """Test data is only cached in memory when no cache path is provided."""
+        cache = MetadataCache('https://memory-only.example.com/api')
+        cache.invalidate('indicator-types')
+
+        assert cache.cache_path is None
+        assert cache.get('indicator-types', lambda: {'Address': {}}) == {'Address': {}}
+
+        # simulate a new process
+        MetadataCache._memory.clear()
+        assert cache.get('indicator-types', lambda: {'Host': {}}) == {'Host': {}}
+
+    @staticmethod
+    def test_invalid_disk_data(tmp_path):
+        """Test invalid data on disk is fetched again."""
+        cache = MetadataCache('https://invalid.example.com/api', cache_path=str(tmp_path))
+        cache.invalidate('indicator-types')
+        cache.get('indicator-types', lambda: {'Address': {}})
+        MetadataCache._memory.clear()
+
+        for data in ['["Address"]', '{"Address": "addresses"}', 'not json']:
+            with open(cache._fqfn('indicator-types'), 'w') as fh:
+                fh.write(data)
+            assert cache.get('indicator-types', lambda: {'Host': {}}) == {'Host': {}}
+            MetadataCache._memory.clear()
@@ -0,0 +1,64 @@
+"""Test the TcEx Playbook streaming Binary variables."""
+# standard library
+import base64
+import io
+import json
+import shutil
+
+# third-party
+import pytest
+
+# first-party
+from tcex.playbooks.binary_stream import BinaryStreamReader, BinaryStreamWriter, is_manifest
+
+
+class TestBinaryStream:
+    """Test the TcEx Playbook streaming Binary variables."""
+
+    @staticmethod
+    def _writer(fields: dict, chunk_size: int) -> BinaryStreamWriter:
+        """Return a writer that stores fields in a dict."""
+
+        def write_small(value: bytes):
+            fields['key'] = json.dumps(base64.b64encode(value).decode())
+
+        return BinaryStreamWriter(fields.__setitem__, write_small, 'key', chunk_size)
+
+    @pytest.mark.parametrize('size', [0, 10, 299, 300, 301, 1000])
+    def test_write(self, size):
+        """Test writing values smaller and larger than the chunk size."""
+        value = bytes(range(256)) * 4
+        value = value[:size]
+
+        fields = {}
+        with self._writer(fields, 300) as fh:
+            shutil.copyfileobj(io.BytesIO(value), fh, 128)
+
+        data = json.loads(fields.pop('key'))
+        if size < 300:
+            # small values keep the standard format
+            assert fields == {}
+            assert base64.b64decode(data) == value
+        else:
+            assert is_manifest(data)
+            assert data.get('size') == size
+            chunks = [fields[f'key.chunk.{i}'] for i in range(data.get('chunks'))]
+            # the concatenated chunks are the base64 encoding of the value
+            assert base64.b64decode(''.join(chunks)) == value
+
+    @staticmethod
+    def test_write_closed():
+        """Test writing to a closed writer raises an error."""
+        fh = BinaryStreamWriter(lambda *args: None, lambda value: None, 'key')
+        fh.close()
+        with pytest.raises(ValueError):
+            fh.write(b'data')
+
+    @staticmethod
+    def test_read():
+        """Test reading from chunks."""
+        reader = BinaryStreamReader(iter([b'abc', b'', b'defg', b'h']), 8)
+        assert reader.read(2) == b'ab'
+        assert reader.read(4) == b'c'
+        assert reader.read() == b'defgh'
+        assert reader.read() == b''
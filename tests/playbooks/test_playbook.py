@@ -266,6 +266,28 @@ class TestUtils:
             tcex.playbook.delete(variable)
             assert tcex.playbook.read(variable) is None
 
+    def test_playbook_write_output_invalid(self, playbook_app):
+        """Test an invalid output does not prevent the other outputs from being written.
+
+        Args:
+            playbook_app (callable, fixture): The playbook_app fixture.
+        """
+        tcex = playbook_app(
+            config_data={'tc_playbook_out_variables': self.tc_playbook_out_variables}
+        ).tcex
+
+        tcex.playbook.add_output('s1', 'one', 'String')
+        tcex.playbook.add_output('kv1', 'not a key value', 'KeyValue')
+        tcex.playbook.add_output('sa1', ['a', 'b'], 'StringArray')
+        tcex.playbook.write_output()
+
+        assert tcex.playbook.read('#App:0001:s1!String') == 'one'
+        assert tcex.playbook.read('#App:0001:kv1!KeyValue') is None
+        assert tcex.playbook.read('#App:0001:sa1!StringArray') == ['a', 'b']
+
+        for variable in ['#App:0001:s1!String', '#App:0001:sa1!StringArray']:
+            tcex.playbook.delete(variable)
+
     def test_playbook_check_output_variable(self, playbook_app):
         """Test the create output method of Playbook module.
 
@@ -555,6 +577,139 @@ class TestUtils:
         result = tcex.playbook.read('#App:0001:none!String', True)
         assert result == [], f'result of ({result}) does not match ([])'
 
+    def test_playbook_read_many(self, playbook_app):
+        """Test the read many method of Playbook module.
+
+        Args:
+            playbook_app (callable, fixture): The playbook_app fixture.
+        """
+        tcex = playbook_app(
+            config_data={'tc_playbook_out_variables': self.tc_playbook_out_variables}
+        ).tcex
+
+        tcex.playbook.create_output('b1', b'not really binary', 'Binary')
+        tcex.playbook.create_output('s1', '1', 'String')
+        tcex.playbook.create_output('sa1', ['a', 'b', 'c'], 'StringArray')
+
+        result = tcex.playbook.read_many(
+            [
+                '#App:0001:b1!Binary',
+                '#App:0001:s1!String',
+                '#App:0001:sa1!StringArray',
+                '#App:0001:none!String',
+                'default with #App:0001:s1!String',
+                '#App:0001:s1!String',
+            ]
+        )
+        assert result == [b'not really binary', '1', ['a', 'b', 'c'], None, 'default with 1', '1']
+
+        for variable in ['#App:0001:b1!Binary', '#App:0001:s1!String', '#App:0001:sa1!StringArray']:
+            tcex.playbook.delete(variable)
+
+    def test_playbook_read_cache(self, playbook_app):
+        """Test the read cache of Playbook module.
+
+        Args:
+            playbook_app (callable, fixture): The playbook_app fixture.
+        """
+        tcex = playbook_app(
+            config_data={'tc_playbook_out_variables': self.tc_playbook_out_variables}
+        ).tcex
+        tcex.playbook.read_cache = True
+
+        tcex.playbook.create_output('s1', 'one', 'String')
+        tcex.playbook.create_output('s2', 'embedded #App:0001:s1!String', 'String')
+        assert tcex.playbook.read('#App:0001:s2!String') == 'embedded one'
+
+        # a value changed outside of the playbook instance is not seen while cached
+        tcex.key_value_store.create(tcex.playbook._context, '#App:0001:s1!String', '"two"')
+        assert tcex.playbook.read('#App:0001:s1!String') == 'one'
+
+        # creating a variable invalidates it and any value it is embedded in
+        tcex.playbook.create_output('s1', 'three', 'String')
+        assert tcex.playbook.read('#App:0001:s1!String') == 'three'
+        assert tcex.playbook.read('#App:0001:s2!String') == 'embedded three'
+
+        tcex.playbook.delete('#App:0001:s1!String')
+        assert tcex.playbook.read('#App:0001:s1!String') is None
+        tcex.playbook.delete('#App:0001:s2!String')
+
+        # cached values are shared by default
+        tcex.playbook.create_output('sa1', ['a', 'b'], 'StringArray')
+        value = tcex.playbook.read('#App:0001:sa1!StringArray')
+        assert tcex.playbook.read('#App:0001:sa1!StringArray') is value
+
+        # with read_cache_copy, modifying a returned value does not change the cached value
+        tcex.playbook.read_cache_copy = True
+        tcex.playbook.create_output('sa1', ['a', 'b'], 'StringArray')
+        tcex.playbook.read('#App:0001:sa1!StringArray').append('c')
+        tcex.playbook.read('#App:0001:sa1!StringArray').append('d')
+        assert tcex.playbook.read('#App:0001:sa1!StringArray') == ['a', 'b']
+        tcex.playbook.delete('#App:0001:sa1!StringArray')
+
+    @pytest.mark.parametrize(
+        'variable,value',
+        [
+            ('#App:0001:ba1!BinaryArray', [b'bytes 1', None, b'bytes 3']),
+            ('#App:0001:kva1!KeyValueArray', [{'key': 'one', 'value': 1}, {'key': 'two'}]),
+            ('#App:0001:sa1!StringArray', ['one', 'two', None]),
+            ('#App:0001:sa2!StringArray', []),
+            (
+                '#App:0001:tea1!TCEntityArray',
+                [{'id': '001', 'value': '1.1.1.1', 'type': 'Address'}],
+            ),
+        ],
+    )
+    def test_playbook_iter_array(self, variable, value, playbook_app):
+        """Test the iter array method of Playbook module.
+
+        Args:
+            variable (str): The key/variable to create in Key Value Store.
+            value (str): The value to store in Key Value Store.
+            playbook_app (callable, fixture): The playbook_app fixture.
+        """
+        tcex = playbook_app(
+            config_data={'tc_playbook_out_variables': self.tc_playbook_out_variables}
+        ).tcex
+        tcex.playbook.create(variable, value)
+
+        result = tcex.playbook.iter_array(variable)
+        assert not isinstance(result, list)
+        assert list(result) == tcex.playbook.read_array(variable) == value
+
+        tcex.playbook.delete(variable)
+        assert tcex.playbook.iter_array(variable) is None
+
+    def test_playbook_iter_array_embedded(self, playbook_app):
+        """Test the iter array method of Playbook module with embedded variables.
+
+        Args:
+            playbook_app (callable, fixture): The playbook_app fixture.
+        """
+        tcex = playbook_app(
+            config_data={'tc_playbook_out_variables': self.tc_playbook_out_variables}
+        ).tcex
+
+        tcex.playbook.create_output('s1', 'two', 'String')
+        tcex.playbook.create_output('sa1', ['three', 'four'], 'StringArray')
+        tcex.playbook.create_output(
+            'sa2', ['one', '#App:0001:s1!String', '#App:0001:sa1!StringArray', 5], 'StringArray'
+        )
+
+        result = list(tcex.playbook.iter_array('#App:0001:sa2!StringArray'))
+        assert result == ['one', 'two', ['three', 'four'], '5']
+        assert result == tcex.playbook.read('#App:0001:sa2!StringArray')
+
+        with pytest.raises(RuntimeError):
+            tcex.playbook.iter_array('#App:0001:s1!String')
+
+        for variable in [
+            '#App:0001:s1!String',
+            '#App:0001:sa1!StringArray',
+            '#App:0001:sa2!StringArray',
+        ]:
+            tcex.playbook.delete(variable)
+
     def test_playbook_variable_types(self, tcex):
         """Test the playbooks variable types property.
 
@@ -31,6 +31,34 @@ class TestUtils:
         tcex.playbook.delete(variable)
         assert tcex.playbook.read(variable) is None
 
+    @pytest.mark.parametrize(
+        'variable,value,chunk_size',
+        [
+            ('#App:0002:b1!Binary', b'small value', 1024),
+            ('#App:0002:b2!Binary', bytes(range(256)) * 100, 1024),
+            ('#App:0002:b3!Binary', bytes(range(256)) * 4, 1024),
+        ],
+    )
+    def test_playbook_binary_stream(self, variable, value, chunk_size, tcex):
+        """Test the binary stream methods of Playbook module.
+
+        Args:
+            variable (str): The key/variable to create in Key Value Store.
+            value (str): The value to store in Key Value Store.
+            chunk_size (int): The chunk size for the stream.
+            tcex (TcEx, fixture): An instantiated instance of TcEx object.
+        """
+        with tcex.playbook.create_binary_stream(variable, chunk_size=chunk_size) as fh:
+            for i in range(0, len(value), 100):
+                fh.write(value[i : i + 100])
+
+        assert tcex.playbook.read_binary_stream(variable).read() == value
+        assert tcex.playbook.read_binary(variable) == value
+
+        tcex.playbook.delete(variable)
+        assert tcex.playbook.read(variable) is None
+        assert tcex.playbook.read_raw(f'{variable}.chunk.0') is None
+
     @pytest.mark.parametrize(
         'variable,value',
         [
@@ -1,7 +1,14 @@
 """Test the TcEx Batch Module."""
+# standard library
+import threading
+import time
+
 # third-party
 import pytest
 
+# first-party
+from tcex.key_value_store import KeyValueApi
+
 
 class MockApi:
     """Mock tcex session.get() method."""
@@ -155,3 +162,141 @@ class TestPlaybookKeyValueApi:
         tcex.playbook.create_output(variable_name, value, variable_type)
         result = tcex.playbook.read(variable)
         assert result == value, f'result of ({result}) does not match ({value})'
+
+    def test_playbook_key_value_api_write_output(self, playbook_app, monkeypatch):
+        """Test the batched write_output method with the Key Value API.
+
+        Args:
+            playbook_app (callable, fixture): The playbook_app fixture.
+        """
+        tcex = playbook_app(
+            config_data={
+                'tc_playbook_out_variables': self.tc_playbook_out_variables,
+                'tc_playbook_db_type': 'TCKeyValueAPI',
+            }
+        ).tcex
+
+        # setup mock key value api service storing data by url
+        kv_data = {}
+
+        # monkeypatch put method
+        def mp_put(url, **kwargs):
+            mock_api = MockApi()
+            mock_api.content = kwargs.get('data')
+            kv_data[url] = mock_api
+            return mock_api
+
+        # monkeypatch get method
+        def mp_get(url, **kwargs):  # pylint: disable=unused-argument
+            return kv_data.get(url, MockApi())
+
+        monkeypatch.setattr(tcex.session, 'get', mp_get)
+        monkeypatch.setattr(tcex.session, 'put', mp_put)
+
+        tcex.playbook.add_output('s1', 'one', 'String')
+        tcex.playbook.add_output('sa1', 'a', 'StringArray')
+        tcex.playbook.add_output('sa1', ['b', 'c'], 'StringArray')
+        tcex.playbook.add_output('kv1', {'key': 'one', 'value': '1'}, 'KeyValue')
+        tcex.playbook.add_output('not_requested', 'value', 'String')
+        tcex.playbook.write_output()
+
+        assert len(kv_data) == 3
+        assert tcex.playbook.read('#App:0001:s1!String') == 'one'
+        assert tcex.playbook.read('#App:0001:sa1!StringArray') == ['a', 'b', 'c']
+        assert tcex.playbook.read('#App:0001:kv1!KeyValue') == {'key': 'one', 'value': '1'}
+
+    def test_key_value_api_many(self):
+        """Test the concurrent create_many and read_many methods of the Key Value API."""
+        kv_data = {}
+        in_flight = {'current': 0, 'max': 0}
+        lock = threading.Lock()
+
+        def request(url, data=None):
+            """Record the concurrent requests and store/return data by url."""
+            with lock:
+                in_flight['current'] += 1
+                in_flight['max'] = max(in_flight['max'], in_flight['current'])
+            time.sleep(0.05)
+            mock_api = MockApi()
+            if data is None:
+                mock_api.content = kv_data.get(url)
+            else:
+                kv_data[url] = mock_api.content = data
+            with lock:
+                in_flight['current'] -= 1
+            return mock_api
+
+        class MockSession:
+            """Mock tcex session."""
+
+            @staticmethod
+            def get(url):
+                """Mock get method."""
+                return request(url)
+
+            @staticmethod
+            def put(url, data, headers):  # pylint: disable=unused-argument
+                """Mock put method."""
+                return request(url, data)
+
+        kv = KeyValueApi(MockSession(), 'triggerservice', max_workers=4)
+        variables = [f'#App:0001:s{i}!String' for i in range(8)]
+
+        kv.create_many('context', {v: f'"{i}"'.encode() for i, v in enumerate(variables)})
+        assert in_flight['max'] == 4
+        assert kv.read_many('context', variables) == [f'"{i}"' for i in range(8)]
+        assert kv.read_many('context', []) == []
+
+        # a single worker sends the requests sequentially
+        in_flight['max'] = 0
+        kv.max_workers = 1
+        assert kv.read_many('context', variables[::-1]) == [f'"{i}"' for i in range(8)][::-1]
+        assert in_flight['max'] == 1
+
+    def test_key_value_api_bytes_like(self):
+        """Test bytearray and memoryview values are sent to the Key Value API as bytes."""
+        kv_data = {}
+
+        class MockSession:
+            """Mock tcex session."""
+
+            @staticmethod
+            def put(url, data, headers):  # pylint: disable=unused-argument
+                """Mock put method."""
+                kv_data[url] = data
+                mock_api = MockApi()
+                mock_api.content = data
+                return mock_api
+
+        kv = KeyValueApi(MockSession(), 'apiservice')
+        kv.create('context', 'ba', bytearray(b'bytearray'))
+        kv.create('context', 'mv', memoryview(b'memoryview'))
+
+        assert kv_data == {
+            '/internal/playbooks/keyValue/context/ba': b'bytearray',
+            '/internal/playbooks/keyValue/context/mv': b'memoryview',
+        }
+        assert all(isinstance(v, bytes) for v in kv_data.values())
+
+    def test_key_value_api_decode(self):
+        """Test the decode argument of the read and read_many methods."""
+
+        class MockSession:
+            """Mock tcex session."""
+
+            @staticmethod
+            def get(url):  # pylint: disable=unused-argument
+                """Mock get method."""
+                mock_api = MockApi()
+                mock_api.content = 'café'.encode('utf-8')
+                return mock_api
+
+        kv = KeyValueApi(MockSession(), 'apiservice')
+        assert kv.read('context', 'key') == 'café'
+        assert kv.read('context', 'key', decode=False) == 'café'.encode('utf-8')
+        assert kv.read('context', 'key', decode='latin-1') == 'cafÃ©'
+        assert kv.read_many('context', ['k1', 'k2']) == ['café', 'café']
+        assert kv.read_many('context', ['k1', 'k2'], decode=False) == [
+            'café'.encode('utf-8'),
+            'café'.encode('utf-8'),
+        ]
@@ -0,0 +1,119 @@
+"""Test the TcEx Playbook variable tokenizer."""
+# third-party
+import pytest
+
+# first-party
+from tcex.playbooks.variable_tokenizer import VariableToken, VariableTokenizer
+
+
+class TestVariableTokenizer:
+    """Test the TcEx Playbook variable tokenizer."""
+
+    @staticmethod
+    def test_template():
+        """Test parsing a value into literal and variable segments."""
+        tokenizer = VariableTokenizer()
+        template = tokenizer.template(
+            'a #App:1:one!String b "#App:1:two!KeyValue" &{TC:TEXT:secret} #App:1:one!String'
+        )
+
+        assert template.pb_variables == ['#App:1:one!String', '#App:1:two!KeyValue']
+        assert [t.variable for t in template.tc_variables] == ['&{TC:TEXT:secret}']
+        assert [type(s) for s in template.segments] == [
+            str,
+            VariableToken,
+            str,
+            VariableToken,
+            str,
+            VariableToken,
+            str,
+            VariableToken,
+        ]
+        assert template.segments[3].quoted is True
+
+        # cached by input string
+        assert tokenizer.template(
+            'a #App:1:one!String b "#App:1:two!KeyValue" &{TC:TEXT:secret} #App:1:one!String'
+        ) is template
+
+    @staticmethod
+    def test_template_render():
+        """Test rendering a template with replacements."""
+        tokenizer = VariableTokenizer()
+        template = tokenizer.template(
+            '{"s": "#App:1:s!String", "kv": "#App:1:kv!KeyValue", '
+            '"sa": #App:1:sa!StringArray, "m": "#App:1:missing!String"}'
+        )
+        result = template.render(
+            {
+                '#App:1:s!String': ('one', False),
+                '#App:1:kv!KeyValue': ('{"key": "k", "value": "v"}', True),
+                '#App:1:sa!StringArray': ('["a", "b"]', True),
+            }
+        )
+        assert result == (
+            '{"s": "one", "kv": {"key": "k", "value": "v"}, '
+            '"sa": ["a", "b"], "m": "#App:1:missing!String"}'
+        )
+
+    @staticmethod
+    def test_template_longer_type():
+        """Test a variable is not matched as the prefix of a variable with a longer type."""
+        template = VariableTokenizer().template('#App:1:a!StringArray #App:1:a!String')
+        assert template.pb_variables == ['#App:1:a!StringArray', '#App:1:a!String']
+        assert template.render({'#App:1:a!String': ('x', False)}) == '#App:1:a!StringArray x'
+
+    @staticmethod
+    def test_template_cache_bounds():
+        """Test the template cache is bounded by size and value length."""
+        tokenizer = VariableTokenizer(cache_size=2, max_cached_length=10)
+        for value in ['one', 'two', 'three']:
+            tokenizer.template(value)
+        tokenizer.template('x' * 11)
+        assert list(tokenizer._templates) == ['two', 'three']
+
+    @staticmethod
+    def test_template_cache_total_length():
+        """Test the template and variable caches are bounded by the total value length."""
+        tokenizer = VariableTokenizer(max_total_length=40)
+        for i in range(4):
+            tokenizer.template(f'{i} #App:1:name!String')
+        assert list(tokenizer._templates) == ['2 #App:1:name!String', '3 #App:1:name!String']
+        assert tokenizer._total_length == 40
+
+        tokenizer.variable('#App:1:name!String')
+        assert list(tokenizer._templates) == ['3 #App:1:name!String']
+        assert tokenizer._total_length == 38
+
+    @pytest.mark.parametrize(
+        'variable,expected',
+        [
+            ('#App:1:name!String', 'String'),
+            ('#App:1:name!StringArray', 'StringArray'),
+            ('#Trigger:1:name.with-dash[0]!TCEntity', 'TCEntity'),
+            ('#App:1:name!Custom_Type', 'Custom_Type'),
+            ('not a #App:1:name!String', None),
+            ('#App:one:name!String', None),
+        ],
+    )
+    def test_variable(self, variable, expected):
+        """Test parsing a playbook variable."""
+        parsed_variable = VariableTokenizer().variable(variable)
+        if expected is None:
+            assert parsed_variable is None
+        else:
+            assert parsed_variable.get('type') == expected
+            assert parsed_variable.get('root') == variable
+
+    @staticmethod
+    def test_expand():
+        """Test backslash escapes are processed the same as a re.sub() replacement."""
+        assert VariableTokenizer.expand(r'a\nb \\ \"') == 'a\nb \\ \\"'
+
+    @staticmethod
+    def test_wrap_embedded_keyvalue():
+        """Test unquoted KeyValue variables are wrapped in quotes."""
+        data = '[{"key": "a", "value": #App:1:a!String}, {"key": "b", "value":#App:1:a!String}]'
+        assert VariableTokenizer().wrap_embedded_keyvalue(data) == (
+            '[{"key": "a", "value": "#App:1:a!String"}, {"key": "b", "value": "#App:1:a!String"}]'
+        )
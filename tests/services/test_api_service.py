@@ -0,0 +1,273 @@
+"""Test the TcEx API Service Module."""
+# standard library
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+
+# first-party
+from tcex.services import ApiService
+from tcex.tokens import Tokens
+from tcex.utils import Utils
+
+
+class BodyIterable:
+    """WSGI response iterable tracking calls to close()."""
+
+    def __init__(self, chunks: list):
+        """Initialize class properties."""
+        self.chunks = chunks
+        self.closed = False
+
+    def __iter__(self):
+        """Return an iterator over the chunks."""
+        return iter(self.chunks)
+
+    def close(self):
+        """Close the iterable."""
+        self.closed = True
+
+
+class MockKeyValueStore:
+    """Mock KV store."""
+
+    def __init__(self):
+        """Initialize class properties."""
+        self.data = {}
+
+    def create(self, context: str, key: str, value: bytes):
+        """Mock create method."""
+        self.data[(context, key)] = bytes(value)
+
+    def read(self, context: str, key: str, decode: str = 'utf-8'):
+        """Mock read method."""
+        value = self.data.get((context, key))
+        if value is not None and decode:
+            value = value.decode(decode)
+        return value
+
+
+class MockMessageBroker:
+    """Mock message broker."""
+
+    def __init__(self):
+        """Initialize class properties."""
+        self.messages = []
+        self.published = threading.Event()
+
+    def publish(self, message: str, topic: str):  # pylint: disable=unused-argument
+        """Mock publish method."""
+        self.messages.append(json.loads(message))
+        self.published.set()
+
+
+@pytest.fixture()
+def api_service():
+    """Return an API service with a mock KV store and message broker."""
+    tcex = MagicMock()
+    tcex.utils = Utils()
+    service = ApiService(tcex)
+    service.key_value_store = MockKeyValueStore()
+    service.message_broker = MockMessageBroker()
+    return service
+
+
+# pylint: disable=no-self-use
+class TestApiService:
+    """Test the TcEx API Service Module."""
+
+    def test_format_response_body_single_chunk(self):
+        """Test a single chunk body is returned without a copy."""
+        chunk = b'{"status": "ok"}'
+        body = ApiService.format_response_body([chunk])
+        assert body is chunk
+
+        # empty chunks are skipped
+        body = ApiService.format_response_body([b'', chunk, b''])
+        assert body is chunk
+
+    def test_format_response_body_chunks(self):
+        """Test multiple bytes and str chunks are joined into a memoryview."""
+        body = ApiService.format_response_body([b'one', 'two', b'', 'café'])
+        assert isinstance(body, memoryview)
+        assert body.tobytes() == 'onetwocafé'.encode('utf-8')
+
+    def test_format_response_body_empty(self):
+        """Test an empty body returns None."""
+        assert ApiService.format_response_body([]) is None
+        assert ApiService.format_response_body([b'', '', b'']) is None
+
+    def test_format_response_body_close(self):
+        """Test close() is called on the response iterable."""
+        body_data = BodyIterable([b'one', b'two'])
+        assert bytes(ApiService.format_response_body(body_data)) == b'onetwo'
+        assert body_data.closed is True
+
+    def test_asgi(self, api_service):
+        """Test a RunService command is handled by the ASGI application.
+
+        Args:
+            api_service (ApiService, fixture): The api_service fixture.
+        """
+        captured = {}
+
+        async def app(scope, receive, send):
+            """Echo the request body in a response sent in two body events."""
+            event = await receive()
+            captured['scope'] = scope
+            await send(
+                {
+                    'type': 'http.response.start',
+                    'status': 201,
+                    'headers': [(b'content-type', b'application/json')],
+                }
+            )
+            await send({'type': 'http.response.body', 'body': b'{"body": ', 'more_body': True})
+            # the response is published on the final body event
+            captured['published'] = len(api_service.message_broker.messages)
+            await send({'type': 'http.response.body', 'body': event.get('body') + b'}'})
+
+        api_service.asgi_app = app
+        api_service.key_value_store.create('request-key', 'request.body', b'"request"')
+        api_service.process_run_service_command(
+            {
+                'command': 'RunService',
+                'apiToken': 'token',
+                'bodyVariable': 'request.body',
+                'headers': [{'name': 'Content-Type', 'value': 'text/plain'}],
+                'method': 'post',
+                'path': '/v1/items',
+                'queryParams': [{'name': 'limit', 'value': 10}],
+                'requestKey': 'request-key',
+                'userConfig': [{'name': 'tlpExportSetting', 'value': 'TLP:RED'}],
+            }
+        )
+        assert api_service.message_broker.published.wait(5)
+
+        # the ASGI scope
+        scope = captured.get('scope')
+        assert scope.get('type') == 'http'
+        assert scope.get('asgi').get('version') == '3.0'
+        assert scope.get('method') == 'POST'
+        assert scope.get('path') == '/v1/items'
+        assert scope.get('raw_path') == b'/v1/items'
+        assert scope.get('query_string') == b'limit=10'
+        assert (b'content-type', b'text/plain') in scope.get('headers')
+        assert scope.get('api_token') == 'token'
+        assert scope.get('request_key') == 'request-key'
+        assert scope.get('user_config') == [{'name': 'tlpExportSetting', 'value': 'TLP:RED'}]
+
+        # the response
+        assert captured.get('published') == 0
+        assert len(api_service.message_broker.messages) == 1
+        message = api_service.message_broker.messages[0]
+        assert message.get('bodyVariable') == 'response.body'
+        assert message.get('command') == 'Acknowledged'
+        assert message.get('requestKey') == 'request-key'
+        assert message.get('status') == 'Created'
+        assert message.get('statusCode') == '201'
+        assert message.get('type') == 'RunService'
+        assert {'name': 'content-type', 'value': 'application/json'} in message.get('headers')
+        assert api_service.key_value_store.read('request-key', 'response.body') == (
+            '{"body": "request"}'
+        )
+
+        # the metrics
+        assert api_service.metrics.get('Requests') == 1
+        assert api_service.metrics.get('Responses') == 1
+        assert api_service.metrics.get('Errors') == 0
+
+    def test_asgi_error(self, api_service):
+        """Test an exception raised by the ASGI application is counted as an error.
+
+        Args:
+            api_service (ApiService, fixture): The api_service fixture.
+        """
+        completed = threading.Event()
+
+        async def app(scope, receive, send):  # pylint: disable=unused-argument
+            """Raise an exception."""
+            completed.set()
+            raise RuntimeError('app failed')
+
+        api_service.asgi_app = app
+        api_service.process_run_service_command(
+            {
+                'command': 'RunService',
+                'headers': [],
+                'method': 'GET',
+                'path': '/v1/items',
+                'queryParams': [],
+                'requestKey': 'request-key',
+            }
+        )
+        assert completed.wait(5)
+        # wait for the exception to be handled on the event loop
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), api_service.asgi_loop).result(5)
+
+        assert api_service.message_broker.messages == []
+        assert api_service.metrics.get('Requests') == 1
+        assert api_service.metrics.get('Errors') == 1
+
+    def test_asgi_token(self, api_service):
+        """Test the apiToken of each request is used while the ASGI application handles it.
+
+        Args:
+            api_service (ApiService, fixture): The api_service fixture.
+        """
+        api_service.token = Tokens('https://localhost', 60, False, MagicMock())
+        api_service.token.register_token('MainThread', 'main-token', time.time() + 3600)
+        tokens = {}
+
+        def read(context: str, key: str, decode: str = 'utf-8'):  # pylint: disable=unused-argument
+            """Record the token on the KV store worker thread."""
+            tokens[f'{context}-kv'] = api_service.token.token
+
+        api_service.key_value_store.read = read
+        started = []
+
+        async def app(scope, receive, send):  # pylint: disable=unused-argument
+            """Record the token after both requests have started."""
+            started.append(scope.get('request_key'))
+            while len(started) < 2:
+                await asyncio.sleep(0.01)
+            tokens[scope.get('request_key')] = api_service.token.token
+            await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+            await send({'type': 'http.response.body', 'body': b''})
+
+        api_service.asgi_app = app
+        for request_key in ['one', 'two']:
+            api_service.process_run_service_command(
+                {
+                    'command': 'RunService',
+                    'apiToken': f'{request_key}-token',
+                    'bodyVariable': 'request.body',
+                    'expireSeconds': time.time() + 3600,
+                    'headers': [],
+                    'method': 'GET',
+                    'path': '/v1/items',
+                    'queryParams': [],
+                    'requestKey': request_key,
+                }
+            )
+
+        for _ in range(500):
+            if len(api_service.message_broker.messages) == 2:
+                break
+            time.sleep(0.01)
+        # wait for the requests to complete on the event loop
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), api_service.asgi_loop).result(5)
+
+        assert tokens == {
+            'one': 'one-token',
+            'one-kv': 'one-token',
+            'two': 'two-token',
+            'two-kv': 'two-token',
+        }
+        assert api_service.token.token == 'main-token'
+        assert list(api_service.token.token_map) == ['MainThread']
+        api_service.token.shutdown = True
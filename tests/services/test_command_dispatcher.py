@@ -0,0 +1,175 @@
+"""Test the TcEx Service Command Dispatcher Module."""
+# standard library
+import threading
+import time
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+
+# first-party
+from tcex.services import CommandDispatcher
+
+
+# pylint: disable=no-self-use
+class TestCommandDispatcher:
+    """Test the TcEx Service Command Dispatcher Module."""
+
+    @staticmethod
+    def _busy_dispatcher(overflow: str) -> tuple:
+        """Return a dispatcher with a running command and a full queue.
+
+        Args:
+            overflow (str): The overflow policy.
+
+        Returns:
+            tuple: The dispatcher, the command, the release event, and the completed commands.
+        """
+        dispatcher = CommandDispatcher(
+            MagicMock(), max_queue_size=1, max_workers=1, overflow=overflow
+        )
+        completed = []
+        release = threading.Event()
+        started = threading.Event()
+
+        def command(name: str):
+            """Wait for the release event on the first command."""
+            if name == 'first':
+                started.set()
+                release.wait(5)
+            completed.append(name)
+
+        assert dispatcher.submit('first', command, args=('first',))
+        assert started.wait(5), 'the first command is running'
+        assert dispatcher.submit('second', command, args=('second',))
+        assert dispatcher.queue_depth == 1
+        return dispatcher, command, release, completed
+
+    @staticmethod
+    def _wait_for(condition: callable, timeout: float = 5) -> bool:
+        """Wait for the condition to be true.
+
+        Args:
+            condition (callable): The condition to wait for.
+            timeout (float): The number of seconds to wait.
+        """
+        end = time.monotonic() + timeout
+        while time.monotonic() < end:
+            if condition():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_overflow_block(self):
+        """Test a full queue blocks the submitter until a command completes."""
+        dispatcher, command, release, completed = self._busy_dispatcher('block')
+
+        submitted = threading.Event()
+
+        def submit():
+            """Submit the third command."""
+            dispatcher.submit('third', command, args=('third',))
+            submitted.set()
+
+        threading.Thread(target=submit, daemon=True).start()
+        assert not submitted.wait(0.2), 'the submitter is blocked while the queue is full'
+
+        release.set()
+        assert submitted.wait(5)
+        assert self._wait_for(lambda: len(completed) == 3)
+        assert completed == ['first', 'second', 'third']
+        assert dispatcher.overflows == 0
+
+    def test_overflow_drop_oldest(self):
+        """Test a full queue drops the oldest queued command."""
+        dispatcher, command, release, completed = self._busy_dispatcher('drop_oldest')
+
+        assert dispatcher.submit('third', command, args=('third',)) is True
+        assert dispatcher.overflows == 1
+        assert dispatcher.queue_depth == 1
+
+        release.set()
+        assert self._wait_for(lambda: len(completed) == 2)
+        time.sleep(0.1)
+        assert completed == ['first', 'third']
+        dispatcher.log.warning.assert_called_once()
+
+    def test_overflow_reject(self):
+        """Test a full queue rejects the new command."""
+        dispatcher, command, release, completed = self._busy_dispatcher('reject')
+
+        assert dispatcher.submit('third', command, args=('third',)) is False
+        assert dispatcher.overflows == 1
+
+        release.set()
+        assert self._wait_for(lambda: len(completed) == 2)
+        time.sleep(0.1)
+        assert completed == ['first', 'second']
+        dispatcher.log.warning.assert_called_once()
+
+    @staticmethod
+    def test_overflow_invalid():
+        """Test an invalid overflow policy raises an error."""
+        with pytest.raises(RuntimeError):
+            CommandDispatcher(MagicMock(), overflow='invalid')
+
+    def test_thread_context(self):
+        """Test the worker thread has the command context while the command runs."""
+        dispatcher = CommandDispatcher(MagicMock(), max_workers=1)
+        context = {}
+
+        def command():
+            """Capture the thread context."""
+            thread = threading.current_thread()
+            context['name'] = thread.name
+            context['session_id'] = thread.session_id
+            context['trigger_id'] = thread.trigger_id
+            context['thread'] = thread
+
+        dispatcher.submit('session-1', command, session_id='session-1', trigger_id=42)
+        assert self._wait_for(lambda: 'thread' in context)
+        assert context.get('name') == 'session-1'
+        assert context.get('session_id') == 'session-1'
+        assert context.get('trigger_id') == 42
+
+        # the worker context is reset after the command completes
+        thread = context.get('thread')
+        assert self._wait_for(lambda: thread.name == 'command-worker-0')
+        assert thread.session_id is None
+        assert thread.trigger_id is None
+
+    def test_command_exception(self):
+        """Test a command raising an exception does not stop the worker."""
+        dispatcher = CommandDispatcher(MagicMock(), max_workers=1)
+        completed = []
+
+        def command(fail: bool):
+            """Raise an exception or complete."""
+            if fail:
+                raise RuntimeError('command failed')
+            completed.append(True)
+
+        dispatcher.submit('failed', command, args=(True,))
+        dispatcher.submit('completed', command, kwargs={'fail': False})
+        assert self._wait_for(lambda: completed)
+        dispatcher.log.error.assert_called_once()
+
+    def test_metrics(self):
+        """Test the dispatcher metrics reported in the heartbeat message."""
+        dispatcher = CommandDispatcher(MagicMock(), max_workers=2)
+        assert dispatcher.metrics == {
+            'Queue Depth': 0,
+            'Queue Overflows': 0,
+            'Queue Wait Time (ms)': 0,
+        }
+
+        completed = []
+        for i in range(5):
+            dispatcher.submit(f'command-{i}', completed.append, args=(i,))
+        assert self._wait_for(lambda: len(completed) == 5)
+
+        metrics = dispatcher.metrics
+        assert sorted(metrics) == ['Queue Depth', 'Queue Overflows', 'Queue Wait Time (ms)']
+        assert metrics.get('Queue Depth') == 0
+        assert metrics.get('Queue Overflows') == 0
+        assert isinstance(metrics.get('Queue Wait Time (ms)'), int)
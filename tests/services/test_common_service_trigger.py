@@ -0,0 +1,158 @@
+"""Test the TcEx Service Trigger Common Module."""
+# standard library
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+
+# first-party
+from tcex.services import CommonServiceTrigger, ConfigIndex
+
+
+@pytest.fixture()
+def service():
+    """Return a trigger service with a mock TcEx instance and message broker."""
+    service = CommonServiceTrigger(MagicMock())
+    service.args.tcex_testing_context = None
+    service.message_broker = MagicMock()
+    return service
+
+
+class TestCommonServiceTrigger:
+    """Test the TcEx Service Trigger Common Module."""
+
+    @staticmethod
+    def _fire_event(service: CommonServiceTrigger, **kwargs) -> set:
+        """Call fire_event and return the trigger ids of the evaluated configs.
+
+        Args:
+            service (CommonServiceTrigger): The trigger service.
+            **kwargs: Additional args passed to fire_event.
+
+        Returns:
+            set: The trigger ids passed to the callback.
+        """
+        evaluated = set()
+
+        def callback(playbook, trigger_id, config, **kwargs):  # pylint: disable=unused-argument
+            """Record the trigger id."""
+            evaluated.add(trigger_id)
+            return False
+
+        service.fire_event(callback, **kwargs)
+        service.fire_event_dispatcher._queue.join()  # pylint: disable=protected-access
+        return evaluated
+
+    @staticmethod
+    def _configs(service: CommonServiceTrigger) -> None:
+        """Add configs to the service with the CreateConfig command.
+
+        Args:
+            service (CommonServiceTrigger): The trigger service.
+        """
+        configs = {
+            1: {'indicator_types': ['Address']},
+            2: {'indicator_types': ['Address', 'Host']},
+            3: {'indicator_types': ['URL']},
+            4: {},
+        }
+        for trigger_id, config in configs.items():
+            service.process_create_config_command(
+                {'command': 'CreateConfig', 'triggerId': trigger_id, 'config': config}
+            )
+
+    def test_config_index_sync(self, service):
+        """Test the config index is updated by the CreateConfig and DeleteConfig commands."""
+        self._configs(service)
+        service.config_index = ConfigIndex('indicator_types')
+        assert service.config_index.match('Address') == {1, 2, 4}
+
+        # a config whose callback fails is not indexed
+        service.create_config_callback = lambda trigger_id, config: {'status': False}
+        service.process_create_config_command(
+            {'command': 'CreateConfig', 'triggerId': 5, 'config': {'indicator_types': ['Host']}}
+        )
+        assert 5 not in service.configs
+        assert service.config_index.match('Host') == {2, 4}
+
+        service.process_delete_config_command({'command': 'DeleteConfig', 'triggerId': 2})
+        assert 2 not in service.configs
+        assert service.config_index.match(['Address', 'Host']) == {1, 4}
+
+    def test_fire_event(self, service):
+        """Test fire_event evaluates every config."""
+        self._configs(service)
+        assert self._fire_event(service) == {1, 2, 3, 4}
+        assert service.metrics.get('Misses') == 4
+
+    def test_fire_event_index_key(self, service):
+        """Test fire_event with an index_key only evaluates the matching configs."""
+        self._configs(service)
+
+        # without a config index the index_key is ignored
+        assert self._fire_event(service, index_key='Host') == {1, 2, 3, 4}
+
+        service.config_index = ConfigIndex('indicator_types')
+        assert self._fire_event(service, index_key='Host') == {2, 4}
+        assert self._fire_event(service, index_key=['Host', 'URL']) == {2, 3, 4}
+        assert self._fire_event(service, index_key='File') == {4}
+        assert self._fire_event(service) == {1, 2, 3, 4}
+
+    def test_fire_event_trigger_ids(self, service):
+        """Test fire_event with trigger_ids only evaluates the provided triggers."""
+        self._configs(service)
+        assert self._fire_event(service, trigger_ids=[1, 3, 5]) == {1, 3}
+
+        service.config_index = ConfigIndex('indicator_types')
+        assert self._fire_event(service, index_key='Address', trigger_ids=[1, 3]) == {1}
+
+    @staticmethod
+    def test_fire_event_publish_concurrent(service):
+        """Test every FireEvent is published once when many threads publish at the same time."""
+        published = []
+
+        def publish(message: str, topic: str):  # pylint: disable=unused-argument
+            """Record the message, slowly, and fail for one trigger."""
+            trigger_id = json.loads(message).get('triggerId')
+            published.append(trigger_id)
+            time.sleep(0.001)
+            if trigger_id == 50:
+                raise RuntimeError('publish failed')
+
+        service.message_broker.publish.side_effect = publish
+        start = threading.Event()
+
+        def fire(trigger_id: int):
+            """Publish a FireEvent once all threads are started."""
+            start.wait(5)
+            service.fire_event_publish(trigger_id, f'session-{trigger_id}')
+
+        threads = [threading.Thread(target=fire, args=(i,)) for i in range(200)]
+        for t in threads:
+            t.start()
+        start.set()
+        for t in threads:
+            t.join(10)
+
+        assert sorted(published) == list(range(200))
+        assert service.metrics.get('Errors') == 1
+        # pylint: disable=protected-access
+        assert service._fire_event_messages == []
+        assert service._fire_event_publishing is False
+
+    @staticmethod
+    def test_heartbeat_metrics(service):
+        """Test the heartbeat reports the command and fire_event dispatcher metrics."""
+        service.configs = {1: {}, 2: {}}
+        service.process_heartbeat_command({'command': 'Heartbeat'})
+
+        metrics = json.loads(service.message_broker.publish.call_args[1].get('message')).get(
+            'metric'
+        )
+        assert metrics.get('Active Playbooks') == 2
+        for label in ['Queue Depth', 'Queue Overflows', 'Queue Wait Time (ms)']:
+            assert metrics.get(label) == 0
+            assert metrics.get(f'Fire Event {label}') == 0
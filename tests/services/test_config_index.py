@@ -0,0 +1,85 @@
+"""Test the TcEx Service Trigger Config Index Module."""
+# first-party
+from tcex.services import ConfigIndex
+
+
+class TestConfigIndex:
+    """Test the TcEx Service Trigger Config Index Module."""
+
+    @staticmethod
+    def test_match():
+        """Test configs are matched by their key."""
+        index = ConfigIndex('indicator_type')
+        index.add(1, {'indicator_type': 'Address'})
+        index.add(2, {'indicator_type': 'Host'})
+
+        assert index.match('Address') == {1}
+        assert index.match('Host') == {2}
+        assert index.match('URL') == set()
+        assert index.match(['Address', 'Host', 'URL']) == {1, 2}
+
+    @staticmethod
+    def test_list_keys():
+        """Test a config with a list of keys matches any of the keys."""
+        index = ConfigIndex('indicator_types')
+        index.add(1, {'indicator_types': ['Address', 'Host', None, '']})
+        index.add(2, {'indicator_types': ['Host']})
+
+        assert index.match('Address') == {1}
+        assert index.match('Host') == {1, 2}
+        assert index.match('') == set()
+
+    @staticmethod
+    def test_callable_key():
+        """Test the keys of a config can be derived with a callable."""
+        index = ConfigIndex(lambda config: config.get('owner', '').lower())
+        index.add(1, {'owner': 'Acme'})
+
+        assert index.match('acme') == {1}
+        assert index.match('Acme') == set()
+
+    @staticmethod
+    def test_wildcard():
+        """Test configs without a key match every event."""
+        index = ConfigIndex('indicator_types')
+        index.add(1, {'indicator_types': ['Address']})
+        index.add(2, {})
+        index.add(3, {'indicator_types': []})
+        index.add(4, {'indicator_types': ''})
+
+        assert index.match('Address') == {1, 2, 3, 4}
+        assert index.match('Host') == {2, 3, 4}
+
+    @staticmethod
+    def test_replace():
+        """Test adding a config for an existing trigger replaces the previous keys."""
+        index = ConfigIndex('indicator_types')
+        index.add(1, {'indicator_types': ['Address']})
+        index.add(1, {'indicator_types': ['Host']})
+        assert index.match('Address') == set()
+        assert index.match('Host') == {1}
+
+        index.add(1, {})
+        assert index.match('Host') == {1}
+        index.add(1, {'indicator_types': ['URL']})
+        assert index.match('Host') == set()
+
+    @staticmethod
+    def test_remove():
+        """Test removed configs are no longer matched."""
+        index = ConfigIndex('indicator_types')
+        index.add(1, {'indicator_types': ['Address', 'Host']})
+        index.add(2, {'indicator_types': ['Host']})
+        index.add(3, {})
+
+        index.remove(1)
+        assert index.match(['Address', 'Host']) == {2, 3}
+        index.remove(3)
+        assert index.match(['Address', 'Host']) == {2}
+
+        # removing an unknown trigger is a no-op
+        index.remove(4)
+        assert index.match('Host') == {2}
+
+        index.clear()
+        assert index.match('Host') == set()
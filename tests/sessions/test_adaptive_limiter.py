@@ -0,0 +1,122 @@
+"""Test the AdaptiveLimiter"""
+# standard library
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# third-party
+import pytest
+
+# first-party
+from tcex.sessions import AdaptiveLimiter, CircuitOpenError, ExternalSession
+
+
+class Handler(BaseHTTPRequestHandler):
+    """HTTP handler returning the status code from the path (e.g., /status/503)."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle GET requests."""
+        self.send_response(int(self.path.split('/')[-1]))
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Suppress request logging."""
+
+
+@pytest.fixture()
+def server_url():
+    """Return the URL of a local HTTP server."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+class TestAdaptiveLimiter:
+    """Test the AdaptiveLimiter"""
+
+    @staticmethod
+    def test_aimd():
+        """Test the limit increases additively and decreases multiplicatively."""
+        limiter = AdaptiveLimiter(initial_limit=4, max_limit=8, decrease_interval=0)
+        host = limiter.host('api.example.com')
+
+        # each success adds 1 / limit
+        for _ in range(5):
+            host.acquire()
+            host.release(failed=False)
+        assert host.stats.get('limit') == 5
+
+        host.acquire()
+        host.release(failed=True)
+        assert host.stats.get('limit') == 2
+        assert host.stats.get('circuit') == 'closed'
+
+    @staticmethod
+    def test_limit_in_flight():
+        """Test requests wait for a free slot."""
+        limiter = AdaptiveLimiter(initial_limit=2, acquire_timeout=0.05)
+        host = limiter.acquire('https://api.example.com/v1')
+        limiter.acquire('https://api.example.com/v2')
+
+        with pytest.raises(CircuitOpenError):
+            limiter.acquire('https://api.example.com/v3')
+
+        # other hosts are not affected
+        limiter.acquire('https://other.example.com/v1')
+
+        threading.Timer(0.01, host.release, args=(False,)).start()
+        limiter.acquire_timeout = 1
+        limiter.acquire('https://api.example.com/v3')
+        assert limiter.stats.get('api.example.com').get('in_flight') == 2
+
+    @staticmethod
+    def test_circuit():
+        """Test the circuit opens, probes when half-open, and closes on success."""
+        limiter = AdaptiveLimiter(initial_limit=8, failure_threshold=3, reset_timeout=0.3)
+        host = limiter.host('api.example.com')
+
+        for _ in range(3):
+            host.acquire()
+            host.release(failed=True)
+        assert host.stats.get('circuit') == 'open'
+        with pytest.raises(CircuitOpenError):
+            host.acquire()
+
+        # a failed probe opens the circuit again
+        time.sleep(0.35)
+        host.acquire()
+        assert host.stats.get('circuit') == 'half-open'
+        host.release(failed=True)
+        assert host.stats.get('circuit') == 'open'
+
+        # a successful probe closes the circuit with the minimum limit
+        time.sleep(0.35)
+        host.acquire()
+        host.release(failed=False)
+        assert host.stats.get('circuit') == 'closed'
+        assert host.stats.get('limit') == 1
+
+    @staticmethod
+    def test_external_session(server_url):
+        """Test 5xx responses open the circuit for the session."""
+        session = ExternalSession(server_url)
+        session.retry(retries=0, urls=['http://'])
+        session.concurrency_limiter = AdaptiveLimiter(failure_threshold=2)
+
+        assert session.get('/status/200').ok
+        session.get('/status/503')
+        session.get('/status/503')
+        with pytest.raises(CircuitOpenError):
+            session.get('/status/200')
+
+        stats = session.concurrency_limiter.stats.get(server_url.split('/')[-1])
+        assert stats.get('circuit') == 'open'
+        assert stats.get('in_flight') == 0
+        assert stats.get('rejected') == 1
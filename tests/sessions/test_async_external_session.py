@@ -0,0 +1,156 @@
+"""Test the AsyncExternalSession"""
+# standard library
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# third-party
+import pytest
+
+# first-party
+from tcex.sessions import AsyncExternalSession
+
+
+class Handler(BaseHTTPRequestHandler):
+    """HTTP handler that tracks the number of concurrent requests."""
+
+    protocol_version = 'HTTP/1.1'
+    active = 0
+    lock = threading.Lock()
+    max_active = 0
+    too_many = set()
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle GET requests."""
+        with self.lock:
+            Handler.active += 1
+            Handler.max_active = max(Handler.max_active, Handler.active)
+
+        time.sleep(0.02)
+        status = 200
+        if '/limited' in self.path and self.path not in self.too_many:
+            # the first request for each limited path returns a 429
+            self.too_many.add(self.path)
+            status = 429
+
+        body = self.path.encode()
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Retry-After', '0')
+        self.end_headers()
+        self.wfile.write(body)
+
+        with self.lock:
+            Handler.active -= 1
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Suppress request logging."""
+
+
+@pytest.fixture()
+def server_url():
+    """Return the URL of a local HTTP server."""
+    Handler.max_active = 0
+    Handler.too_many = set()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+class TestAsyncExternalSession:
+    """Test the AsyncExternalSession"""
+
+    @staticmethod
+    def test_map(server_url):
+        """Test requests are sent concurrently within the limit and returned in order."""
+
+        async def run():
+            async with AsyncExternalSession(server_url, max_concurrency=4) as session:
+                kwargs = [{'params': {'page': page}} for page in range(12)]
+                return await session.map('GET', '/v1/items', kwargs)
+
+        responses = asyncio.run(run())
+        assert [r.text for r in responses] == [f'/v1/items?page={p}' for p in range(12)]
+        assert 1 < Handler.max_active <= 4
+
+    @staticmethod
+    def test_gather_limited(server_url):
+        """Test awaitables are limited and returned in order."""
+
+        async def run():
+            async with AsyncExternalSession(server_url, max_concurrency=10) as session:
+
+                async def fetch(page):
+                    r = await session.get(f'/v1/items/{page}')
+                    return r.text
+
+                return await session.gather_limited([fetch(p) for p in range(6)], limit=2)
+
+        assert asyncio.run(run()) == [f'/v1/items/{p}' for p in range(6)]
+        assert Handler.max_active <= 2
+
+    @staticmethod
+    def test_too_many_requests(server_url):
+        """Test a 429 response is retried after the too_many_requests_handler delay."""
+        waits = []
+
+        def handler(response):
+            waits.append(response.status_code)
+            return 0.01
+
+        async def run():
+            async with AsyncExternalSession(server_url) as session:
+                session.too_many_requests_handler = handler
+                return await session.get('/limited/1')
+
+        response = asyncio.run(run())
+        assert response.status_code == 200
+        assert waits == [429]
+
+    @staticmethod
+    def test_multiple_loops(server_url):
+        """Test a session can be used by more than one event loop."""
+        session = AsyncExternalSession(server_url, max_concurrency=2)
+
+        async def run(page):
+            return (await session.get(f'/v1/items/{page}')).text
+
+        try:
+            assert asyncio.run(run(1)) == '/v1/items/1'
+            assert asyncio.run(run(2)) == '/v1/items/2'
+
+            # a loop on another thread while the first loop is running
+            results = []
+            thread = threading.Thread(target=lambda: results.append(asyncio.run(run(3))))
+            thread.start()
+            assert asyncio.run(run(4)) == '/v1/items/4'
+            thread.join()
+            assert results == ['/v1/items/3']
+        finally:
+            session.close()
+
+    @staticmethod
+    def test_close_off_loop(server_url):
+        """Test the session is closed off of the event loop on exit of the async context."""
+        close_threads = []
+
+        async def run():
+            async with AsyncExternalSession(server_url) as session:
+                close = session.close
+
+                def track_close():
+                    close_threads.append(threading.current_thread())
+                    close()
+
+                session.close = track_close
+                await session.get('/v1/items')
+            return threading.current_thread()
+
+        loop_thread = asyncio.run(run())
+        assert len(close_threads) == 1
+        assert close_threads[0] is not loop_thread
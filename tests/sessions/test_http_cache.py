@@ -0,0 +1,233 @@
+"""Test the HttpCache"""
+# standard library
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# third-party
+import pytest
+
+# first-party
+from tcex.sessions import ExternalSession, HttpCache
+
+
+class Handler(BaseHTTPRequestHandler):
+    """HTTP handler with cache headers based on the path."""
+
+    protocol_version = 'HTTP/1.1'
+    requests = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle GET requests."""
+        Handler.requests.append((self.path, self.headers.get('If-None-Match')))
+        headers = {}
+        body = f'body for {self.path}'.encode()
+        if self.path.startswith('/fresh'):
+            headers['Cache-Control'] = 'max-age=60'
+        elif self.path.startswith('/etag'):
+            headers['ETag'] = '"v1"'
+            if self.headers.get('If-None-Match') == '"v1"':
+                self.send_response(304)
+                self.send_header('ETag', '"v1"')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+        elif self.path.startswith('/gzip'):
+            headers['Cache-Control'] = 'max-age=60'
+            headers['Content-Encoding'] = 'gzip'
+            body = gzip.compress(body)
+        elif self.path.startswith('/large'):
+            headers['Cache-Control'] = 'max-age=60'
+            body = b'x' * 4096
+        elif self.path.startswith('/no-store'):
+            headers['Cache-Control'] = 'no-store'
+
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Handle POST requests."""
+        Handler.requests.append((self.path, None))
+        self.send_response(200)
+        self.send_header('Cache-Control', 'max-age=60')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Suppress request logging."""
+
+
+@pytest.fixture()
+def server_url():
+    """Return the URL of a local HTTP server."""
+    Handler.requests = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def session(server_url, tmp_path):
+    """Return an ExternalSession with the HttpCache enabled."""
+    session = ExternalSession(server_url)
+    session.retry(urls=['http://'])
+    session.http_cache = HttpCache(str(tmp_path / 'http-cache'), max_size=2048)
+    return session
+
+
+class TestHttpCache:
+    """Test the HttpCache"""
+
+    @staticmethod
+    def test_fresh(session):
+        """Test a fresh response is served without a request."""
+        assert session.get('/fresh/1').text == 'body for /fresh/1'
+        r = session.get('/fresh/1')
+        assert r.text == 'body for /fresh/1'
+        assert r.from_cache is True
+
+        assert len(Handler.requests) == 1
+        stats = session.http_cache.stats
+        assert stats.get('hits') == 1
+        assert stats.get('stores') == 1
+
+    @staticmethod
+    def test_auth_headers(session):
+        """Test responses are only served to requests with the same credentials."""
+        session.get('/fresh/1', headers={'Authorization': 'Bearer one'})
+        assert session.get('/fresh/1', headers={'Authorization': 'Bearer one'}).from_cache
+        session.get('/fresh/1', headers={'Authorization': 'Bearer two'})
+        session.get('/fresh/1')
+
+        assert len(Handler.requests) == 3
+        assert session.http_cache.stats.get('entries') == 3
+
+    @staticmethod
+    def test_not_cacheable(session):
+        """Test requests that can not be cached are not counted as misses."""
+        session.post('/fresh/1')
+        session.post('/fresh/1')
+
+        assert len(Handler.requests) == 2
+        stats = session.http_cache.stats
+        assert stats.get('misses') == 0
+        assert stats.get('entries') == 0
+
+    @staticmethod
+    def test_revalidate(session):
+        """Test a stale response is revalidated with If-None-Match."""
+        assert session.get('/etag/1').text == 'body for /etag/1'
+        r = session.get('/etag/1')
+        assert r.status_code == 200
+        assert r.text == 'body for /etag/1'
+
+        assert Handler.requests == [('/etag/1', None), ('/etag/1', '"v1"')]
+        assert session.http_cache.stats.get('revalidated') == 1
+
+    @staticmethod
+    def test_revalidate_evicted(session):
+        """Test the full response is requested when the entry is evicted while revalidating."""
+        session.get('/etag/1')
+        cache = session.http_cache
+        lookup = cache.lookup
+
+        def evicting_lookup(request):
+            """Evict the entry after the lookup, as another thread would."""
+            meta = lookup(request)
+            if meta is not None:
+                with cache._lock:  # pylint: disable=protected-access
+                    cache._index.pop(meta.get('key'))  # pylint: disable=protected-access
+                cache._remove_files(meta.get('key'))  # pylint: disable=protected-access
+            return meta
+
+        cache.lookup = evicting_lookup
+        r = session.get('/etag/1')
+        assert r.status_code == 200
+        assert r.text == 'body for /etag/1'
+
+        assert Handler.requests == [('/etag/1', None), ('/etag/1', '"v1"'), ('/etag/1', None)]
+        assert cache.stats.get('entries') == 1
+
+    @staticmethod
+    def test_no_store(session):
+        """Test responses are not stored when not allowed or not cacheable."""
+        session.get('/no-store/1')
+        session.get('/no-store/1')
+        session.get('/plain/1')
+        session.get('/plain/1')
+
+        assert len(Handler.requests) == 4
+        assert session.http_cache.stats.get('entries') == 0
+
+    @staticmethod
+    def test_gzip(session):
+        """Test encoded responses are stored decoded."""
+        assert session.get('/gzip/1').text == 'body for /gzip/1'
+        r = session.get('/gzip/1')
+        assert r.text == 'body for /gzip/1'
+        assert 'Content-Encoding' not in r.headers
+
+    @staticmethod
+    def test_stream(session):
+        """Test a cached response can be streamed."""
+        session.get('/large/1')
+        r = session.get('/large/1', stream=True)
+        assert sum(len(chunk) for chunk in r.iter_content(1024)) == 4096
+
+    @staticmethod
+    def test_eviction(session, tmp_path):
+        """Test the least recently used entries are evicted."""
+        session.get('/large/1')
+        assert session.http_cache.stats.get('size') == 0
+
+        # 17 byte bodies, room for 5 entries
+        session.http_cache = HttpCache(str(tmp_path / 'small'), max_size=90)
+        for i in range(1, 6):
+            session.get(f'/fresh/{i}')
+        session.get('/fresh/1')
+        session.get('/fresh/6')
+
+        stats = session.http_cache.stats
+        assert stats.get('entries') == 5
+        assert stats.get('evictions') == 1
+
+        # entry 2 was the least recently used
+        requests = len(Handler.requests)
+        session.get('/fresh/1')
+        assert len(Handler.requests) == requests
+        session.get('/fresh/2')
+        assert len(Handler.requests) == requests + 1
+
+    @staticmethod
+    def test_persistent(session, tmp_path):
+        """Test entries are loaded from disk by a new cache instance."""
+        session.get('/fresh/1')
+        session.http_cache = HttpCache(str(tmp_path / 'http-cache'))
+        assert session.get('/fresh/1').from_cache is True
+        assert len(Handler.requests) == 1
+
+    @staticmethod
+    def test_freshness_lifetime(tmp_path):
+        """Test the freshness lifetime for response headers."""
+        cache = HttpCache(str(tmp_path))
+        assert cache.freshness_lifetime({'Cache-Control': 'public, max-age=30'}) == 30
+        assert cache.freshness_lifetime({'Cache-Control': 'no-cache', 'ETag': '"1"'}) == 0
+        assert cache.freshness_lifetime({'Cache-Control': 'no-store', 'ETag': '"1"'}) is None
+        assert cache.freshness_lifetime({}) is None
+        assert (
+            cache.freshness_lifetime(
+                {
+                    'Date': 'Wed, 21 Oct 2015 07:28:00 GMT',
+                    'Expires': 'Wed, 21 Oct 2015 07:38:00 GMT',
+                }
+            )
+            == 600
+        )
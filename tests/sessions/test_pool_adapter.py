@@ -0,0 +1,115 @@
+"""Test the PoolAdapter and PoolTelemetry"""
+# standard library
+import pickle
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# third-party
+import pytest
+from requests import Session
+
+# first-party
+from tcex.sessions.pool_adapter import PoolAdapter
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 handler that keeps connections open."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle GET requests."""
+        body = b'ok'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Suppress request logging."""
+
+
+@pytest.fixture()
+def server_url():
+    """Return the URL of a local keep-alive HTTP server."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    server.daemon_threads = True
+    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+class TestPoolAdapter:
+    """Test the PoolAdapter and PoolTelemetry"""
+
+    @staticmethod
+    def test_reuse(server_url):
+        """Test sequential requests reuse a single connection."""
+        session = Session()
+        adapter = PoolAdapter()
+        session.mount('http://', adapter)
+
+        for _ in range(5):
+            assert session.get(server_url).ok
+
+        stats = adapter.telemetry.stats
+        assert stats.get('created') == 1
+        assert stats.get('reused') == 4
+        assert stats.get('requests') == 5
+        assert stats.get('discarded') == 0
+
+    @staticmethod
+    def test_discard(server_url):
+        """Test connections are discarded when the pool is smaller than the thread count."""
+        session = Session()
+        adapter = PoolAdapter(pool_maxsize=1)
+        session.mount('http://', adapter)
+        barrier = threading.Barrier(4)
+
+        def worker():
+            barrier.wait()
+            for _ in range(3):
+                session.get(server_url)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = adapter.telemetry.stats
+        assert stats.get('requests') == 12
+        assert stats.get('created') > 1
+        assert stats.get('discarded') > 0
+
+    @staticmethod
+    def test_configure(server_url):
+        """Test reconfiguring the pool."""
+        session = Session()
+        adapter = PoolAdapter()
+        session.mount('http://', adapter)
+        session.get(server_url)
+
+        adapter.configure(pool_maxsize=32, pool_block=True, keep_alive=True)
+        assert session.get(server_url).ok
+        assert adapter._pool_maxsize == 32
+        assert adapter.telemetry.stats.get('created') == 2
+
+    @staticmethod
+    def test_socket_options():
+        """Test TCP keep-alive socket options."""
+        assert PoolAdapter.socket_options(False) is None
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in PoolAdapter.socket_options(True)
+
+    @staticmethod
+    def test_pickle():
+        """Test the adapter can be pickled with its telemetry."""
+        adapter = PoolAdapter(pool_maxsize=20, keep_alive=True)
+        adapter.telemetry.created()
+
+        adapter = pickle.loads(pickle.dumps(adapter))
+        assert adapter._pool_maxsize == 20
+        assert adapter.telemetry.stats.get('created') == 1
@@ -0,0 +1,121 @@
+"""Test the RateLimiter and TokenBucket"""
+# standard library
+import threading
+import time
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+
+# first-party
+from tcex.sessions import ExternalSession, RateLimiter
+from tcex.sessions.rate_limiter import TokenBucket
+
+
+class TestRateLimiter:
+    """Test the RateLimiter and TokenBucket"""
+
+    @staticmethod
+    def test_bucket_burst():
+        """Test requests up to the capacity are not delayed."""
+        bucket = TokenBucket(rate=10, capacity=5)
+        assert sum(bucket.acquire() for _ in range(5)) == 0
+        assert bucket.acquire() == pytest.approx(0.1, abs=0.02)
+
+    @staticmethod
+    def test_bucket_threads():
+        """Test concurrent callers are spaced at the configured rate."""
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(11)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # the first token is available immediately, the other 10 at 50/s
+        assert time.monotonic() - start >= 0.19
+        assert bucket.acquired == 11
+
+    @staticmethod
+    def test_bucket_pause_threads():
+        """Test requests queued during a pause are spaced out after the pause."""
+        bucket = TokenBucket(rate=20, capacity=5)
+        start = time.monotonic()
+        bucket.pause(0.2)
+
+        sent = []
+        lock = threading.Lock()
+
+        def send():
+            """Acquire a token and record the send time."""
+            bucket.acquire()
+            with lock:
+                sent.append(time.monotonic() - start)
+
+        threads = [threading.Thread(target=send) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # the queued requests are sent after the pause at 20/s, not all at the resume time
+        sent.sort()
+        assert sent[0] >= 0.2
+        assert all(b - a >= 0.04 for a, b in zip(sent, sent[1:])), sent
+        assert sent[-1] >= 0.2 + 4 * 0.05 - 0.01
+
+    @staticmethod
+    def test_bucket_invalid_rate():
+        """Test a rate of zero is rejected."""
+        with pytest.raises(RuntimeError):
+            TokenBucket(rate=0)
+
+    @staticmethod
+    def test_patterns():
+        """Test the first matching pattern is used."""
+        rate_limiter = RateLimiter()
+        rate_limiter.add_limit('api.example.com/v1/search*', rate=2)
+        rate_limiter.add_limit('api.example.com/*', rate=10)
+
+        search = rate_limiter.bucket('https://api.example.com/v1/search?q=1')
+        other = rate_limiter.bucket('https://api.example.com/v1/indicators')
+        assert search.rate == 2
+        assert other.rate == 10
+        assert rate_limiter.bucket('https://other.example.com/v1/search') is None
+
+    @staticmethod
+    def test_post_send():
+        """Test server headers are fed back into the bucket."""
+        rate_limiter = RateLimiter()
+        rate_limiter.add_limit('*', rate=100)
+        bucket = rate_limiter.bucket('https://api.example.com/')
+
+        response = MagicMock(status_code=200, headers={'X-RateLimit-Remaining': '3'})
+        response.request.url = 'https://api.example.com/'
+        rate_limiter.post_send(response)
+        assert bucket.tokens <= 4
+
+        response = MagicMock(status_code=429, headers={'Retry-After': '0.2'})
+        response.request.url = 'https://api.example.com/'
+        rate_limiter.post_send(response)
+        assert bucket.acquire() == pytest.approx(0.2, abs=0.05)
+
+    @staticmethod
+    def test_seconds_until():
+        """Test parsing of reset/retry header values."""
+        assert RateLimiter._seconds_until('5') == 5
+        assert RateLimiter._seconds_until(str(time.time() + 10)) == pytest.approx(10, abs=1)
+        assert RateLimiter._seconds_until('Wed, 21 Oct 2015 07:28:00 GMT') == 0
+        assert RateLimiter._seconds_until('invalid') is None
+        assert RateLimiter._seconds_until(None) is None
+
+    @staticmethod
+    def test_external_session():
+        """Test the rate limiter is applied to the external session adapter."""
+        rate_limiter = RateLimiter()
+        session = ExternalSession('https://api.example.com')
+        session.rate_limiter = rate_limiter
+
+        assert session.get_adapter('https://api.example.com').rate_limiter is rate_limiter
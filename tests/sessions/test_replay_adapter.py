@@ -0,0 +1,129 @@
+"""Test the RecordingAdapter and ReplayAdapter"""
+# standard library
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# third-party
+import pytest
+
+# first-party
+from tcex.sessions import ExternalSession, RecordingAdapter, ReplayAdapter, ReplayStore
+
+
+class Handler(BaseHTTPRequestHandler):
+    """HTTP handler returning a counter so repeated requests differ."""
+
+    protocol_version = 'HTTP/1.1'
+    count = 0
+
+    def _respond(self, body: bytes):
+        """Send the response."""
+        Handler.count += 1
+        self.send_response(404 if 'missing' in self.path else 200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle GET requests."""
+        self._respond(f'{{"path": "{self.path}", "count": {Handler.count}}}'.encode())
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Handle POST requests."""
+        self._respond(self.rfile.read(int(self.headers.get('Content-Length'))))
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Suppress request logging."""
+
+
+@pytest.fixture()
+def recorded(tmp_path):
+    """Record requests to a local server and return the store path and server URL."""
+    Handler.count = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t.start()
+    url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    path = str(tmp_path / 'run')
+    store = ReplayStore(path, blur=['ts'])
+    session = ExternalSession(url)
+    RecordingAdapter(store).install(session)
+
+    session.get('/v1/status')
+    session.get('/v1/status')
+    session.get('/v1/items', params={'b': 2, 'a': 1, 'ts': time.time()})
+    session.get('/v1/missing')
+    session.post('/v1/items', json={'name': 'one'})
+    session.post('/v1/items', json={'name': 'two'})
+    store.close()
+
+    server.shutdown()
+    server.server_close()
+    return path, url
+
+
+class TestReplayAdapter:
+    """Test the RecordingAdapter and ReplayAdapter"""
+
+    @staticmethod
+    def test_replay(recorded):
+        """Test recorded responses are replayed without the server."""
+        path, url = recorded
+        session = ExternalSession(url)
+        ReplayAdapter(ReplayStore(path, blur=['ts'])).install(session)
+
+        # query params are order independent and blurred params are ignored
+        r = session.get('/v1/items', params={'a': 1, 'b': 2, 'ts': 0})
+        assert r.json().get('path').startswith('/v1/items?')
+        assert r.headers.get('Content-Type') == 'application/json'
+
+        # the request body is part of the key
+        assert session.post('/v1/items', json={'name': 'two'}).json() == {'name': 'two'}
+        assert session.post('/v1/items', json={'name': 'one'}).json() == {'name': 'one'}
+
+        assert session.get('/v1/missing').status_code == 404
+
+        with pytest.raises(KeyError):
+            session.get('/v1/unknown')
+
+    @staticmethod
+    def test_replay_stream(recorded):
+        """Test streamed responses are replayed (e.g., TI document downloads)."""
+        path, url = recorded
+        session = ExternalSession(url)
+        ReplayAdapter(ReplayStore(path)).install(session)
+
+        with session.get('/v1/status', stream=True) as r:
+            body = b''.join(r.iter_content(chunk_size=4))
+        assert body == b'{"path": "/v1/status", "count": 0}'
+
+        # the content is read from the raw body when accessed on a streamed response
+        r = session.get('/v1/status', stream=True)
+        assert r.json().get('count') == 1
+
+    @staticmethod
+    def test_replay_sequence(recorded):
+        """Test repeated requests replay responses in order, then repeat the last."""
+        path, url = recorded
+        store = ReplayStore(path)
+        session = ExternalSession(url)
+        ReplayAdapter(store).install(session)
+
+        assert [session.get('/v1/status').json().get('count') for _ in range(3)] == [0, 1, 1]
+        store.reset()
+        assert session.get('/v1/status').json().get('count') == 0
+
+    @staticmethod
+    def test_latency(recorded):
+        """Test the simulated latency."""
+        path, url = recorded
+        session = ExternalSession(url)
+        ReplayAdapter(ReplayStore(path), latency=0.05).install(session)
+
+        start = time.perf_counter()
+        session.get('/v1/status')
+        assert time.perf_counter() - start >= 0.05
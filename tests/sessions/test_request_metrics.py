@@ -0,0 +1,158 @@
+"""Test the RequestMetrics"""
+# standard library
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# third-party
+import pytest
+from requests import exceptions
+
+# first-party
+from tcex.sessions import ExternalSession
+from tcex.sessions.request_metrics import RequestMetrics
+
+
+class Handler(BaseHTTPRequestHandler):
+    """HTTP handler returning a 404 for paths containing "missing"."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle GET requests."""
+        body = b'{"status": "Success"}'
+        self.send_response(404 if 'missing' in self.path else 200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Handle POST requests."""
+        self.rfile.read(int(self.headers.get('Content-Length')))
+        self.send_response(201)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Suppress request logging."""
+
+
+@pytest.fixture()
+def server_url():
+    """Return the URL of a local HTTP server."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+class TestRequestMetrics:
+    """Test the RequestMetrics"""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'url,expected',
+        [
+            ('https://tc/api/v2/indicators/addresses/1.1.1.1', '/api/v2/indicators/{type}/{id}'),
+            (
+                'https://tc/api/v2/groups/adversaries/123/indicators/hosts',
+                '/api/v2/groups/{type}/{id}/indicators/hosts',
+            ),
+            ('https://tc/api/v2/tags/APT%2029/groups', '/api/v2/tags/{name}/groups'),
+            ('https://tc/api/v3/cases/42?fields=tags', '/api/v3/cases/{id}'),
+            (
+                'https://ext/v1/jobs/6f1c2b1e-8a1d-4c1e-9a53-0e1f6a7f2b10/results',
+                '/v1/jobs/{id}/results',
+            ),
+            (f'https://ext/v1/files/{"a" * 64}', '/v1/files/{id}'),
+        ],
+    )
+    def test_normalize(url, expected):
+        """Test URLs are normalized to endpoint templates."""
+        assert RequestMetrics().normalize(url) == expected
+
+    @staticmethod
+    def test_add_rule():
+        """Test custom rules are applied before the default rules."""
+        metrics = RequestMetrics()
+        metrics.add_rule(r'^/v1/items/[^/]+', '/v1/items/{name}')
+        assert metrics.normalize('https://ext/v1/items/widget') == '/v1/items/{name}'
+
+    @staticmethod
+    def test_record():
+        """Test histogram, status counts, and bytes are aggregated by endpoint."""
+        metrics = RequestMetrics()
+        metrics.record('get', 'https://tc/api/v3/cases/1', 200, 0.004, 100)
+        metrics.record('GET', 'https://tc/api/v3/cases/2', 200, 0.2, 100)
+        metrics.record('GET', 'https://tc/api/v3/cases/3', 404, 0.04, 10)
+        metrics.record('DELETE', 'https://tc/api/v3/cases/3', 'error', 1.0)
+
+        stats = metrics.stats
+        assert list(stats) == ['DELETE /api/v3/cases/{id}', 'GET /api/v3/cases/{id}']
+
+        cases = stats.get('GET /api/v3/cases/{id}')
+        assert cases.get('count') == 3
+        assert cases.get('bytes_in') == 210
+        assert cases.get('status') == {'200': 2, '404': 1}
+        assert cases.get('histogram').get('<=5ms') == 1
+        assert cases.get('histogram').get('<=50ms') == 1
+        assert cases.get('histogram').get('<=250ms') == 1
+        assert cases.get('p50') == 0.05
+        assert cases.get('max') == 0.2
+
+        metrics.reset()
+        assert metrics.stats == {}
+
+    @staticmethod
+    def test_dump(tmp_path):
+        """Test the stats are written to a JSON file."""
+        metrics = RequestMetrics()
+        metrics.record('GET', 'https://tc/api/v3/cases/1', 200, 0.1)
+        fqfn = tmp_path / 'metrics.json'
+        metrics.dump(str(fqfn))
+
+        with open(fqfn) as fh:
+            assert json.load(fh).get('GET /api/v3/cases/{id}').get('count') == 1
+
+    @staticmethod
+    def test_external_session(server_url):
+        """Test requests made by the external session are recorded."""
+        session = ExternalSession()
+        session.request_metrics.enabled = True
+        session.get(f'{server_url}/v1/items/1')
+        session.get(f'{server_url}/v1/items/2')
+        session.get(f'{server_url}/v1/missing/3')
+        session.post(f'{server_url}/v1/items', data='12345')
+
+        stats = session.request_metrics.stats
+        assert stats.get('GET /v1/items/{id}').get('count') == 2
+        assert stats.get('GET /v1/items/{id}').get('bytes_in') == 42
+        assert stats.get('GET /v1/missing/{id}').get('status') == {'404': 1}
+        assert stats.get('POST /v1/items').get('bytes_out') == 5
+
+    @staticmethod
+    def test_external_session_disabled(server_url):
+        """Test requests are not recorded unless the metrics are enabled."""
+        session = ExternalSession()
+        session.get(f'{server_url}/v1/items/1')
+        assert session.request_metrics.stats == {}
+
+        # dumping the metrics on exit enables them
+        session.request_metrics.dump_on_exit()
+        session.get(f'{server_url}/v1/items/2')
+        assert session.request_metrics.stats.get('GET /v1/items/{id}').get('count') == 1
+
+    @staticmethod
+    def test_external_session_error():
+        """Test connection errors are recorded."""
+        session = ExternalSession()
+        session.request_metrics.enabled = True
+        with pytest.raises(exceptions.ConnectionError):
+            session.get('http://127.0.0.1:1/v1/items/1')
+
+        assert session.request_metrics.stats.get('GET /v1/items/{id}').get('status') == {
+            'error': 1
+        }
@@ -0,0 +1,63 @@
+"""Test the TcEx Indicator Types Methods."""
+# standard library
+from unittest.mock import MagicMock
+
+# first-party
+from tcex.datastore import MetadataCache
+
+
+class TestIndicatorTypes:
+    """Test the TcEx Indicator Types Methods."""
+
+    @staticmethod
+    def test_indicator_types_empty_cache(tcex, monkeypatch, tmp_path):
+        """Test indicator types are downloaded when the metadata cache is empty.
+
+        Args:
+            tcex (TcEx, fixture): An instantiated instance of TcEx object.
+            monkeypatch (_pytest.monkeypatch.MonkeyPatch, fixture): Pytest monkeypatch
+            tmp_path (pathlib.Path, fixture): A temporary directory.
+        """
+        r = MagicMock()
+        r.ok = True
+        r.json.return_value = {
+            'data': {
+                'indicatorType': [
+                    {'name': 'Address', 'apiBranch': 'addresses', 'custom': 'false'},
+                    {'name': 'Host', 'apiBranch': 'hosts', 'custom': 'false'},
+                ]
+            }
+        }
+        get = MagicMock(return_value=r)
+        monkeypatch.setattr(tcex.session, 'get', get)
+
+        # start with an empty memory and disk cache
+        tcex._indicator_types = None
+        tcex._indicator_types_data = None
+        tcex._metadata_cache = MetadataCache(
+            tcex.default_args.tc_api_path, cache_path=str(tmp_path)
+        )
+        tcex.metadata_cache.invalidate('indicator-types')
+
+        assert tcex.indicator_types_data.get('Host').get('apiBranch') == 'hosts'
+        assert list(tcex.indicator_types) == ['Address', 'Host']
+        get.assert_called_once_with('/v2/types/indicatorTypes')
+
+    @staticmethod
+    def test_type_from_api_branch_precedence(tcex):
+        """Test Group types take precedence over Indicator types with the same api branch.
+
+        Args:
+            tcex (TcEx, fixture): An instantiated instance of TcEx object.
+        """
+        tcex._indicator_types_data = {
+            'Address': {'name': 'Address', 'apiBranch': 'addresses', 'apiEntity': 'address'},
+            'Custom Task': {'name': 'Custom Task', 'apiBranch': 'tasks', 'apiEntity': 'task'},
+        }
+        tcex._api_branch_types = None
+        tcex._api_entity_types = None
+
+        assert tcex.get_type_from_api_branch('addresses') == 'Address'
+        assert tcex.get_type_from_api_branch('tasks') == 'Task'
+        assert tcex.get_type_from_api_entity('task') == 'Task'
+        assert tcex.get_type_from_api_entity('unknown') is None
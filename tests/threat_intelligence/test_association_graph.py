@@ -0,0 +1,125 @@
+"""Test the TcEx Threat Intel AssociationGraph Module."""
+# standard library
+from unittest.mock import MagicMock
+
+# first-party
+from tcex.threat_intelligence.association_graph import AssociationGraph
+
+# adjacency of the mocked ThreatConnect instance keyed by (api_type, api_branch, unique_id)
+ASSOCIATIONS = {
+    ('groups', 'adversaries', '1'): {
+        'indicators': [{'id': 10, 'type': 'Address', 'summary': '1.1.1.1'}],
+        'groups': [{'id': 2, 'type': 'Campaign', 'name': 'campaign'}],
+    },
+    ('indicators', 'addresses', '1.1.1.1'): {
+        'indicators': [],
+        'groups': [
+            {'id': 1, 'type': 'Adversary', 'name': 'adversary'},
+            {'id': 3, 'type': 'Incident', 'name': 'incident'},
+        ],
+    },
+    ('groups', 'campaigns', '2'): {
+        'indicators': [{'id': 11, 'type': 'Host', 'summary': 'example.com'}],
+        'groups': [{'id': 1, 'type': 'Adversary', 'name': 'adversary'}],
+    },
+}
+
+
+class TestAssociationGraph:
+    """Test the TcEx Threat Intel AssociationGraph Module."""
+
+    @staticmethod
+    def _graph(**kwargs):
+        """Return an AssociationGraph using a mocked TI module."""
+        ti = MagicMock()
+        ti._group_types_data = {
+            'Adversary': {'apiBranch': 'adversaries'},
+            'Campaign': {'apiBranch': 'campaigns'},
+            'Incident': {'apiBranch': 'incidents'},
+        }
+        ti._indicator_types_data = {
+            'Address': {'apiBranch': 'addresses'},
+            'Host': {'apiBranch': 'hosts'},
+        }
+        graph = AssociationGraph(ti, **kwargs)
+        graph.tc_requests = MagicMock()
+        graph.tc_requests.indicator_associations.side_effect = lambda *args, **kwargs: iter(
+            ASSOCIATIONS.get(args, {}).get('indicators', [])
+        )
+        graph.tc_requests.group_associations.side_effect = lambda *args, **kwargs: iter(
+            ASSOCIATIONS.get(args, {}).get('groups', [])
+        )
+        return graph
+
+    @staticmethod
+    def _root():
+        """Return a mocked Adversary root node."""
+        root = MagicMock()
+        root.api_type = 'groups'
+        root.api_branch = 'adversaries'
+        root.api_sub_type = 'Adversary'
+        root.unique_id = '1'
+        root.data = {'id': 1, 'name': 'adversary'}
+        root.is_indicator.return_value = False
+        return root
+
+    def test_expand_depth_1(self):
+        """Test expanding a single hop."""
+        result = self._graph(depth=1).expand(self._root())
+
+        assert result.get('root') == 'Adversary:1'
+        assert set(result.get('nodes')) == {'Adversary:1', 'Address:1.1.1.1', 'Campaign:2'}
+        assert result.get('adjacency') == {'Adversary:1': ['Address:1.1.1.1', 'Campaign:2']}
+        assert result.get('stats').get('expanded') == 1
+
+    def test_expand_depth_2(self):
+        """Test expanding two hops memoizes visited nodes."""
+        result = self._graph(depth=2).expand(self._root())
+
+        assert set(result.get('nodes')) == {
+            'Adversary:1',
+            'Address:1.1.1.1',
+            'Campaign:2',
+            'Incident:3',
+            'Host:example.com',
+        }
+        assert result.get('stats').get('edges') == 4
+        assert result.get('stats').get('expanded') == 3
+        assert result.get('truncated') is False
+
+    def test_type_filters(self):
+        """Test the type filters exclude nodes."""
+        result = self._graph(depth=2, indicator_types=[], group_types=['campaign']).expand(
+            self._root()
+        )
+
+        assert set(result.get('nodes')) == {'Adversary:1', 'Campaign:2'}
+
+    def test_node_budget(self):
+        """Test the node budget truncates the expansion."""
+        result = self._graph(depth=2, max_nodes=2).expand(self._root())
+
+        assert len(result.get('nodes')) == 2
+        assert result.get('truncated') is True
+
+    def test_edge_budget(self):
+        """Test the edge budget stops the expansion."""
+        graph = self._graph(depth=2, max_edges=1)
+        result = graph.expand(self._root())
+
+        assert result.get('stats').get('edges') == 1
+        assert result.get('adjacency') == {'Adversary:1': ['Address:1.1.1.1']}
+        assert result.get('truncated') is True
+        # the edge budget was reached at the first level, so no further level is expanded
+        assert result.get('stats').get('expanded') == 1
+
+    def test_adjacency_unique(self):
+        """Test a neighbor returned more than once is listed once in the adjacency."""
+        graph = self._graph(depth=1)
+        graph.tc_requests.group_associations.side_effect = lambda *args, **kwargs: iter(
+            [{'id': 2, 'type': 'Campaign', 'name': 'campaign'}] * 2
+        )
+        result = graph.expand(self._root())
+
+        assert result.get('adjacency') == {'Adversary:1': ['Address:1.1.1.1', 'Campaign:2']}
+        assert result.get('stats').get('edges') == 2
@@ -0,0 +1,82 @@
+"""Test the TcEx Threat Intel field projection."""
+# standard library
+from unittest.mock import MagicMock
+
+# first-party
+from tcex.threat_intelligence.single_flight import SingleFlight
+from tcex.threat_intelligence.tcex_ti_tc_request import TiTcRequest
+
+
+class TestFieldProjection:
+    """Test the TcEx Threat Intel field projection."""
+
+    @staticmethod
+    def _tc_request(data):
+        """Return a TiTcRequest with a mocked session returning the provided data."""
+        response = MagicMock()
+        response.ok = True
+        response.content = b''
+        response.json.return_value = {'status': 'Success', 'data': {'address': data}}
+        session = MagicMock()
+        session.get.return_value = response
+        return TiTcRequest(session, single_flight=SingleFlight())
+
+    def test_many_dict(self):
+        """Test many yields the full dicts when no fields are provided."""
+        data = [{'id': 1, 'summary': '1.1.1.1', 'rating': 3.0, 'ownerName': 'Org'}]
+        tc_request = self._tc_request(data)
+
+        assert list(tc_request.many('indicators', 'addresses', 'address')) == data
+
+    def test_many_fields(self):
+        """Test many yields lightweight records when fields are provided."""
+        data = [
+            {'id': 1, 'summary': '1.1.1.1', 'rating': 3.0, 'ownerName': 'Org'},
+            {'id': 2, 'summary': '2.2.2.2', 'ownerName': 'Org'},
+        ]
+        tc_request = self._tc_request(data)
+
+        caller_params = {'includeAdditional': 'true'}
+        records = list(
+            tc_request.many(
+                'indicators',
+                'addresses',
+                'address',
+                params=caller_params,
+                fields=['id', 'summary', 'rating'],
+            )
+        )
+
+        assert records[0].summary == '1.1.1.1'
+        assert records[1].rating is None
+        assert tuple(records[0]) == (1, '1.1.1.1', 3.0)
+        assert not hasattr(records[0], '__dict__')
+
+        # includeAdditional is not requested when no additional fields are projected
+        params = tc_request.session.get.call_args[1].get('params')
+        assert 'includeAdditional' not in params
+        assert caller_params == {'includeAdditional': 'true'}, 'caller params are not modified'
+
+    def test_many_fields_invalid_names(self):
+        """Test fields that are not valid attribute names are renamed to their position."""
+        tc_request = self._tc_request([{'id': 1, 'class': 'A'}])
+
+        records = list(
+            tc_request.many('indicators', 'addresses', 'address', fields=['id', 'class', 'id'])
+        )
+
+        assert records[0].id == 1
+        assert records[0]._1 == 'A'
+        assert tuple(records[0]) == (1, 'A', 1)
+
+    def test_many_fields_additional(self):
+        """Test includeAdditional is requested when an additional field is projected."""
+        tc_request = self._tc_request([{'id': 1, 'threatAssessRating': 2.5}])
+
+        records = list(
+            tc_request.many('indicators', 'addresses', 'address', fields=['threatAssessRating'])
+        )
+
+        assert records[0].threatAssessRating == 2.5
+        params = tc_request.session.get.call_args[1].get('params')
+        assert params.get('includeAdditional') == 'true'
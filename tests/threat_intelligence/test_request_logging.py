@@ -0,0 +1,54 @@
+"""Test the TcEx Threat Intel request logging."""
+# standard library
+import logging
+from unittest.mock import MagicMock, PropertyMock
+
+# third-party
+import pytest
+
+# first-party
+from tcex.logger.trace_logger import TRACE
+from tcex.threat_intelligence.single_flight import SingleFlight
+from tcex.threat_intelligence.tcex_ti_tc_request import TiTcRequest
+
+
+class TestRequestLogging:
+    """Test the TcEx Threat Intel request logging."""
+
+    @staticmethod
+    def _tc_request(text: PropertyMock):
+        """Return a TiTcRequest with a mocked session."""
+        response = MagicMock(ok=True, content=b'{}', status_code=200)
+        type(response).text = text
+
+        session = MagicMock()
+        session.get.return_value = response
+        session.delete.return_value = response
+        return TiTcRequest(session, single_flight=SingleFlight())
+
+    @pytest.fixture()
+    def tcex_logger(self):
+        """Restore the tcex logger level after the test."""
+        tcex_logger = logging.getLogger('tcex')
+        level = tcex_logger.level
+        yield tcex_logger
+        tcex_logger.setLevel(level)
+
+    def test_debug_disabled(self, tcex_logger):
+        """Test the response body is not decoded when debug logging is disabled."""
+        tcex_logger.setLevel(logging.INFO)
+        text = PropertyMock(return_value='{}')
+        tc_request = self._tc_request(text)
+
+        tc_request._get('https://tc/api/v2/indicators/addresses')
+        tc_request._delete('https://tc/api/v2/indicators/addresses/1.1.1.1')
+        text.assert_not_called()
+
+    def test_trace_enabled(self, tcex_logger):
+        """Test the response body is logged when trace logging is enabled."""
+        tcex_logger.setLevel(TRACE)
+        text = PropertyMock(return_value='{}')
+        tc_request = self._tc_request(text)
+
+        tc_request._get('https://tc/api/v2/indicators/addresses')
+        text.assert_called()
@@ -0,0 +1,175 @@
+"""Test the TcEx Threat Intel SingleFlight Module."""
+# standard library
+import threading
+import time
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+
+# first-party
+from tcex.threat_intelligence.single_flight import SingleFlight
+from tcex.threat_intelligence.tcex_ti_tc_request import TiTcRequest
+
+
+class TestSingleFlight:
+    """Test the TcEx Threat Intel SingleFlight Module."""
+
+    @staticmethod
+    def _run_concurrent(single_flight, key, fn, count):
+        """Run fn concurrently through single flight and return the results."""
+        barrier = threading.Barrier(count)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(single_flight.do(key, fn))
+
+        threads = [threading.Thread(target=worker) for _ in range(count)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results
+
+    def test_coalesce(self):
+        """Test concurrent identical calls share a single execution."""
+        single_flight = SingleFlight()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            time.sleep(0.2)
+            return 'result'
+
+        results = self._run_concurrent(single_flight, 'key', fn, 10)
+
+        assert results == ['result'] * 10
+        assert len(calls) == 1
+        assert single_flight.stats.get('executed') == 1
+        assert single_flight.stats.get('coalesced') == 9
+        assert single_flight.inflight == 0
+
+    @staticmethod
+    def test_error_shared():
+        """Test waiters receive the exception raised by the leader."""
+        single_flight = SingleFlight()
+        started = threading.Event()
+        errors = []
+
+        def fn():
+            started.set()
+            time.sleep(0.2)
+            raise RuntimeError('failed')
+
+        def waiter():
+            started.wait()
+            try:
+                single_flight.do('key', fn)
+            except RuntimeError as e:
+                errors.append(e)
+
+        t = threading.Thread(target=waiter)
+        t.start()
+        with pytest.raises(RuntimeError):
+            single_flight.do('key', fn)
+        t.join()
+
+        assert len(errors) == 1
+        assert single_flight.stats.get('errors') == 1
+
+    @staticmethod
+    def test_max_inflight():
+        """Test new keys bypass coalescing when the in-flight limit is reached."""
+        single_flight = SingleFlight(max_inflight=0)
+
+        assert single_flight.do('key', lambda: 'result') == 'result'
+        assert single_flight.stats.get('bypassed') == 1
+
+    @staticmethod
+    def test_waiter_timeout():
+        """Test a waiter executes the call itself when the leader takes too long."""
+        single_flight = SingleFlight(timeout=0.1)
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait()
+            return 'leader'
+
+        t = threading.Thread(target=single_flight.do, args=('key', slow))
+        t.start()
+        started.wait()
+        assert single_flight.do('key', lambda: 'waiter') == 'waiter'
+        release.set()
+        t.join()
+
+        assert single_flight.stats.get('timeouts') == 1
+
+    @staticmethod
+    def test_for_session():
+        """Test the same instance is returned for the same session."""
+
+        class Session:
+            """Mock session."""
+
+        session = Session()
+        assert SingleFlight.for_session(session) is SingleFlight.for_session(session)
+        assert SingleFlight.for_session(session) is not SingleFlight.for_session(Session())
+        assert SingleFlight.for_session(Session(), create=False) is None
+
+        SingleFlight.remove_session(session)
+        assert SingleFlight.for_session(session, create=False) is None
+
+    @staticmethod
+    def test_ti_request_opt_in():
+        """Test TI GET requests are only coalesced when enabled for the session."""
+        calls = []
+
+        class Session:
+            """Mock session."""
+
+            @staticmethod
+            def get(url, params=None):  # pylint: disable=unused-argument
+                """Mock get method."""
+                calls.append(url)
+                time.sleep(0.2)
+                return MagicMock(ok=True, content=b'{}')
+
+        session = Session()
+        tc_request = TiTcRequest(session)
+        url = 'https://tc/api/v2/indicators/addresses'
+
+        def run_concurrent(**kwargs):
+            """Send the same GET request from 4 threads and return the responses."""
+            barrier = threading.Barrier(4)
+            results = []
+
+            def worker():
+                barrier.wait()
+                results.append(tc_request._get(url, **kwargs))
+
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            return results
+
+        # disabled by default
+        run_concurrent()
+        assert len(calls) == 4
+
+        # enabled for the session
+        calls.clear()
+        SingleFlight.for_session(session)
+        results = run_concurrent()
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results), 'the response is shared'
+
+        # bypassed by the caller
+        calls.clear()
+        run_concurrent(coalesce=False)
+        assert len(calls) == 4
+        SingleFlight.remove_session(session)
@@ -0,0 +1,111 @@
+"""Test the TcEx Threat Intel multi-tag pivot."""
+# standard library
+import threading
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+
+# first-party
+from tcex.threat_intelligence.single_flight import SingleFlight
+from tcex.threat_intelligence.tcex_ti_tc_request import TiTcRequest
+
+TAG_DATA = {
+    'tag-1': [{'id': 1, 'summary': '1.1.1.1'}, {'id': 2, 'summary': '2.2.2.2'}],
+    'tag-2': [{'id': 2, 'summary': '2.2.2.2'}, {'id': 3, 'summary': '3.3.3.3'}],
+    'tag-3': [],
+}
+
+
+class TestTagPivot:
+    """Test the TcEx Threat Intel multi-tag pivot."""
+
+    @staticmethod
+    def _tc_request(release=None, queried=None):
+        """Return a TiTcRequest with a mocked session returning the tag data.
+
+        Args:
+            release (threading.Event, optional): The "slow" tag returns the tag-2 data once set.
+            queried (list, optional): The tag names are added once their query completes.
+        """
+
+        def get(url, params=None):  # pylint: disable=unused-argument
+            tag_name = url.split('/')[3]
+            if tag_name == 'slow':
+                release.wait(5)
+                queried.append(tag_name)
+                tag_name = 'tag-2'
+            if tag_name == 'bad':
+                response = MagicMock(ok=False, status_code=500, text='error', url=url)
+                return response
+            response = MagicMock(ok=True, content=b'')
+            response.json.return_value = {
+                'status': 'Success',
+                'data': {'address': TAG_DATA.get(tag_name)},
+            }
+            return response
+
+        session = MagicMock()
+        session.get.side_effect = get
+        return TiTcRequest(session, single_flight=SingleFlight())
+
+    @staticmethod
+    def _target():
+        """Return a mocked Address target."""
+        return MagicMock(api_branch='addresses', api_type='indicators', api_entity='address')
+
+    def test_pivot_from_tags(self):
+        """Test entities are deduplicated and the matched tags are tracked."""
+        results = {
+            entity.get('id'): tags
+            for entity, tags in self._tc_request().pivot_from_tags(
+                self._target(), ['tag-1', 'tag-2', 'tag-3'], max_workers=3
+            )
+        }
+
+        assert results == {1: {'tag-1'}, 2: {'tag-1', 'tag-2'}, 3: {'tag-2'}}
+
+    def test_pivot_from_tags_fields(self):
+        """Test entities are projected onto records when fields are provided."""
+        results = list(
+            self._tc_request().pivot_from_tags(self._target(), ['tag-1'], fields=['summary'])
+        )
+
+        assert sorted(tuple(entity) for entity, _ in results) == [
+            (1, '1.1.1.1'),
+            (2, '2.2.2.2'),
+        ]
+
+    def test_pivot_from_tags_error(self):
+        """Test an error querying a tag is raised."""
+        with pytest.raises(RuntimeError):
+            list(self._tc_request().pivot_from_tags(self._target(), ['tag-1', 'bad']))
+
+    def test_pivot_from_tags_streaming(self):
+        """Test entities are yielded before all tags are queried and matched tags are merged."""
+        release = threading.Event()
+        queried = []
+        results = self._tc_request(release, queried).pivot_from_tags(
+            self._target(), ['tag-1', 'slow'], max_workers=2
+        )
+
+        entity, tags = next(results)
+        assert queried == [], 'the first entity is yielded while the slow tag is queried'
+        assert tags == {'tag-1'}
+
+        release.set()
+        merged = {entity.get('id'): tags}
+        merged.update({e.get('id'): t for e, t in results})
+        assert queried == ['slow']
+        assert merged == {1: {'tag-1'}, 2: {'tag-1', 'slow'}, 3: {'slow'}}
+
+    def test_pivot_from_tags_close(self):
+        """Test the iteration can be stopped before all tags are queried."""
+        release = threading.Event()
+        results = self._tc_request(release, []).pivot_from_tags(
+            self._target(), ['tag-1', 'slow'], max_workers=2
+        )
+
+        next(results)
+        results.close()
+        release.set()
@@ -0,0 +1,61 @@
+"""Test the TcEx JSON Codec Module."""
+# standard library
+import json
+import math
+
+# third-party
+import pytest
+
+# first-party
+from tcex.utils.json_codec import JsonCodec, json_codec
+
+
+# pylint: disable=no-self-use
+class TestJsonCodec:
+    """Test the TcEx JSON Codec Module."""
+
+    @pytest.mark.parametrize('accelerated', [True, False])
+    def test_round_trip(self, accelerated):
+        """Test encoding and decoding matches the json module.
+
+        Args:
+            accelerated (bool): If True, orjson is used when installed.
+        """
+        codec = JsonCodec(accelerated=accelerated)
+        data = {
+            'id': '1',
+            'type': 'Address',
+            'value': '1.1.1.1',
+            'nested': [{'one': 1, 'two': 2.5, 'three': None, 'four': True}],
+            'unicode': 'café ☃',
+        }
+
+        encoded = codec.dumps(data)
+        assert isinstance(encoded, str)
+        assert json.loads(encoded) == data
+        assert codec.loads(encoded) == data
+        assert codec.loads(codec.dumps_bytes(data)) == data
+        assert list(codec.loads(encoded)) == list(data), 'key order is preserved'
+
+    def test_compact(self):
+        """Test encoded data is compact."""
+        assert json_codec.dumps({'a': [1, 2]}) == '{"a":[1,2]}'
+        assert json_codec.dumps_bytes(['a', 'b']) == b'["a","b"]'
+
+    def test_disabled(self):
+        """Test the codec uses the json module when acceleration is disabled."""
+        assert JsonCodec(accelerated=False).name == 'json'
+
+    def test_fallback_big_int(self):
+        """Test integers larger than 64 bits are encoded and decoded."""
+        data = {'big': 2 ** 70}
+        assert json_codec.loads(json_codec.dumps(data)) == data
+
+    def test_fallback_nan(self):
+        """Test NaN literals are decoded."""
+        assert math.isnan(json_codec.loads('{"value": NaN}').get('value'))
+
+    def test_invalid(self):
+        """Test invalid JSON raises a ValueError."""
+        with pytest.raises(ValueError):
+            json_codec.loads('{"invalid"')